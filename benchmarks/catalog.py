@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Compare server type and location lookups by name with and without a catalog cache against a local fake API.
+
+The persistent cache is measured in a cold process, with the catalogs stored by an earlier one.
+
+Usage: python -m benchmarks.catalog [--lookups 200] [--latency 0.02]
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from hcloud import Client
+from hcloud.core.catalog import CatalogCache, PersistentCatalogCache
+
+from benchmarks.fake_api import FakeAPI
+
+
+def run(endpoint, lookups, catalog_cache=None):
+    client = Client(token="benchmark", api_endpoint=endpoint, catalog_cache=catalog_cache)
+    start = time.time()
+    for i in range(lookups):
+        # what provisioning a server looks up
+        client.server_types.get_by_name("cx{size}1".format(size=i % 5 + 1))
+        client.locations.get_by_name("fsn1" if i % 2 else "nbg1")
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds of fake network latency per request")
+    args = parser.parse_args()
+
+    collections = {
+        "server_types": [{"id": i, "name": "cx{size}1".format(size=i), "cores": i} for i in range(1, 6)],
+        "locations": [{"id": 1, "name": "fsn1"}, {"id": 2, "name": "nbg1"}, {"id": 3, "name": "hel1"}],
+    }
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "catalogs.sqlite3")
+    modes = [
+        ("without cache", lambda: None, 0),
+        ("CatalogCache", CatalogCache, 0),
+        ("Persistent, cold", lambda: PersistentCatalogCache(path), 1),
+    ]
+    try:
+        with FakeAPI(collections, latency=args.latency) as api:
+            for name, catalog_cache, earlier_processes in modes:
+                for _ in range(earlier_processes):
+                    run(api.endpoint, 1, catalog_cache())
+                api.request_count = 0
+                duration = run(api.endpoint, args.lookups, catalog_cache())
+                print("{name:<18} {lookups} lookups in {duration:6.3f}s, {requests} requests".format(
+                    name=name, lookups=2 * args.lookups, duration=duration, requests=api.request_count))
+                api.request_count = 0
+                duration = run(api.endpoint, 1, catalog_cache())
+                print("{name:<18} first 2 lookups in {duration:6.3f}s, {requests} requests".format(
+                    name=name, duration=duration, requests=api.request_count))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""Measure the per-object cost of building models with the pure Python and the compiled modules.
+
+Usage: python -m benchmarks.compiled [--objects 10000] [--compare]
+
+With --compare the modules are compiled into a temporary copy of the package (requires Cython and a
+C compiler) and both builds are measured in a subprocess of their own.
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+from hcloud import Client
+from hcloud.actions.domain import Action
+from hcloud.core import is_compiled
+from hcloud.core.domain import add_meta_to_result
+from hcloud.servers.client import BoundServer
+from hcloud.servers.domain import Server
+
+from benchmarks.fake_api import fake_action, fake_server
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(objects, repeat):
+    client = Client(token="benchmark")
+    ids = range(1, objects + 1)
+    servers = [fake_server(i) for i in ids]
+    actions = [fake_action(i) for i in ids]
+    pages = {}
+    per_page = client.actions.max_per_page
+    for page in range(1, objects // per_page + 1):
+        pages[page] = json.dumps({
+            "actions": actions[(page - 1) * per_page:page * per_page],
+            "meta": {"pagination": {"page": page, "per_page": per_page,
+                                    "next_page": page + 1 if page < objects // per_page else None}},
+        })
+    client.request = lambda url, method, params=None: json.loads(pages[params["page"]])
+    response = {"actions": [], "meta": {"pagination": {"page": 1, "per_page": 50, "next_page": 2}}}
+
+    scenarios = [
+        ("Server.from_dict", lambda: [Server.from_dict(data) for data in servers]),
+        ("Action.from_dict", lambda: [Action.from_dict(data) for data in actions]),
+        ("BoundServer", lambda: [BoundServer(client.servers, data) for data in servers]),
+        ("add_meta_to_result", lambda: [add_meta_to_result([], response, "actions") for _ in ids]),
+        ("actions.get_all", lambda: client.actions.get_all()),
+    ]
+    return [(name, min(timeit.repeat(function, number=1, repeat=repeat)) / objects * 1e6)
+            for name, function in scenarios]
+
+
+def compile_copy(directory):
+    for name in ("setup.py", "README.rst", "CHANGELOG.rst"):
+        shutil.copy(os.path.join(ROOT, name), directory)
+    for name in ("hcloud", "benchmarks"):
+        shutil.copytree(os.path.join(ROOT, name), os.path.join(directory, name),
+                        ignore=shutil.ignore_patterns("*.so", "*.pyd", "__pycache__"))
+    environment = dict(os.environ, HCLOUD_COMPILE="1")
+    subprocess.check_call([sys.executable, "setup.py", "-q", "build_ext", "--inplace"], cwd=directory, env=environment)
+
+
+def run(directory, objects, repeat):
+    output = subprocess.check_output(
+        [sys.executable, "-m", "benchmarks.compiled", "--json", "--objects", str(objects), "--repeat", str(repeat)],
+        cwd=directory)
+    return json.loads(output.decode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--compare", action="store_true", help="compile a copy of the package and compare both builds")
+    parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.json:
+        print(json.dumps({"compiled": is_compiled(), "results": measure(args.objects, args.repeat)}))
+        return
+
+    if not args.compare:
+        print("compiled: {compiled}".format(compiled="yes" if is_compiled() else "no"))
+        for name, cost in measure(args.objects, args.repeat):
+            print("{name:<24} {cost:6.2f} us per object".format(name=name, cost=cost))
+        return
+
+    directory = tempfile.mkdtemp()
+    try:
+        compile_copy(directory)
+        pure = run(ROOT, args.objects, args.repeat)
+        compiled = run(directory, args.objects, args.repeat)
+    finally:
+        shutil.rmtree(directory)
+    if pure["compiled"] or not compiled["compiled"]:
+        sys.exit("expected a pure Python build in {root} and a compiled copy".format(root=ROOT))
+
+    print("{name:<24} {pure:>8} {compiled:>10} {speedup:>8}".format(
+        name="us per object", pure="python", compiled="compiled", speedup="speedup"))
+    for (name, pure_cost), (_, compiled_cost) in zip(pure["results"], compiled["results"]):
+        print("{name:<24} {pure:8.2f} {compiled:10.2f} {speedup:7.2f}x".format(
+            name=name, pure=pure_cost, compiled=compiled_cost, speedup=pure_cost / compiled_cost))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Measure the cost of turning response dicts into domain objects with ``from_dict``, without any network.
+
+Usage: python -m benchmarks.deserialization [--objects 10000]
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import timeit
+
+from hcloud import Client
+from hcloud.actions.client import BoundAction
+from hcloud.actions.domain import Action
+from hcloud.networks.domain import NetworkRoute, NetworkSubnet
+from hcloud.servers.client import BoundServer
+from hcloud.servers.domain import Server
+
+from benchmarks.fake_api import fake_action, fake_server
+
+
+def fake_subnet(id):
+    return {"type": "server", "ip_range": "10.0.{id}.0/24".format(id=id % 256), "network_zone": "eu-central",
+            "gateway": "10.0.0.1"}
+
+
+def fake_route(id):
+    return {"destination": "10.100.{id}.0/24".format(id=id % 256), "gateway": "10.0.1.1"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    client = Client(token="benchmark")
+    ids = range(1, args.objects + 1)
+    servers = [fake_server(i) for i in ids]
+    actions = [fake_action(i) for i in ids]
+    subnets = [fake_subnet(i) for i in ids]
+    routes = [fake_route(i) for i in ids]
+
+    scenarios = [
+        ("Server.from_dict", lambda: [Server.from_dict(data) for data in servers]),
+        ("Action.from_dict", lambda: [Action.from_dict(data) for data in actions]),
+        ("NetworkSubnet.from_dict", lambda: [NetworkSubnet.from_dict(data) for data in subnets]),
+        ("NetworkRoute.from_dict", lambda: [NetworkRoute.from_dict(data) for data in routes]),
+        ("BoundServer", lambda: [BoundServer(client.servers, data) for data in servers]),
+        ("BoundAction", lambda: [BoundAction(client.actions, data) for data in actions]),
+    ]
+    for name, function in scenarios:
+        cost = min(timeit.repeat(function, number=1, repeat=args.repeat)) / args.objects * 1e6
+        print("{name:<24} {cost:6.2f} us per object".format(name=name, cost=cost))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""A minimal, in-process stand-in for the Hetzner Cloud API used by the benchmarks.
+
+It serves paginated ``GET /<collection>`` and ``GET /<collection>/<id>`` requests from
+in-memory fixtures and can add an artificial per-request latency to mimic a real network.
+"""
+from __future__ import absolute_import
+
+import json
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlparse
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class FakeAPI(object):
+    """Serve the given collections on a random local port
+
+    :param collections: Dict[str, List[Dict]]
+           Resource collections by their API name, e.g. ``{"actions": [...]}``
+    :param latency: float
+           Seconds every request sleeps before answering
+    """
+
+    def __init__(self, collections, latency=0.0):
+        self.collections = collections
+        self.latency = latency
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server = _ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+
+    @property
+    def endpoint(self):
+        host, port = self._server.server_address
+        return "http://{host}:{port}".format(host=host, port=port)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handle(self, path, query):
+        with self._lock:
+            self.request_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        parts = [part for part in path.split("/") if part]
+        collection = self.collections.get(parts[0]) if parts else None
+        if collection is None:
+            return 404, {"error": {"code": "not_found", "message": "not found", "details": {}}}
+
+        if len(parts) == 2:
+            for entry in collection:
+                if str(entry["id"]) == parts[1]:
+                    return 200, {parts[0][:-1]: entry}
+            return 404, {"error": {"code": "not_found", "message": "not found", "details": {}}}
+
+        if "name" in query:
+            collection = [entry for entry in collection if entry.get("name") == query["name"][0]]
+        page = int(query.get("page", ["1"])[0])
+        per_page = int(query.get("per_page", ["25"])[0])
+        last_page = max(1, (len(collection) + per_page - 1) // per_page)
+        return 200, {
+            parts[0]: collection[(page - 1) * per_page:page * per_page],
+            "meta": {
+                "pagination": {
+                    "page": page,
+                    "per_page": per_page,
+                    "previous_page": page - 1 if page > 1 else None,
+                    "next_page": page + 1 if page < last_page else None,
+                    "last_page": last_page,
+                    "total_entries": len(collection),
+                }
+            }
+        }
+
+    def _handler_class(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                status, body = api._handle(url.path, parse_qs(url.query))
+                content = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def fake_action(id):
+    return {
+        "id": id,
+        "command": "start_server",
+        "status": "success",
+        "progress": 100,
+        "started": "2016-01-30T23:55:00+00:00",
+        "finished": "2016-01-30T23:56:00+00:00",
+        "resources": [{"id": 42, "type": "server"}],
+        "error": None,
+    }
+
+
+def fake_server(id):
+    return {
+        "id": id,
+        "name": "server-{id}".format(id=id),
+        "status": "running",
+        "created": "2016-01-30T23:50:00+00:00",
+        "public_net": {
+            "ipv4": {"ip": "1.2.3.4", "blocked": False, "dns_ptr": "server01.example.com"},
+            "ipv6": {"ip": "2001:db8::/64", "blocked": False, "dns_ptr": [{"ip": "2001:db8::1", "dns_ptr": "server.example.com"}]},
+            "floating_ips": [478],
+        },
+        "private_net": [
+            {"network": 4711, "ip": "10.1.1.5", "alias_ips": ["10.1.1.8"], "mac_address": "86:00:ff:2a:7d:e1"},
+        ],
+        "server_type": {
+            "id": 1,
+            "name": "cx11",
+            "description": "CX11",
+            "cores": 1,
+            "memory": 1,
+            "disk": 25,
+            "prices": [{"location": "fsn1", "price_hourly": {"net": "1.0000000000", "gross": "1.1900000000000000"},
+                        "price_monthly": {"net": "1.0000000000", "gross": "1.1900000000000000"}}],
+            "storage_type": "local",
+            "cpu_type": "shared",
+        },
+        "datacenter": {
+            "id": 1,
+            "name": "fsn1-dc8",
+            "description": "Falkenstein 1 DC 8",
+            "location": {
+                "id": 1,
+                "name": "fsn1",
+                "description": "Falkenstein DC Park 1",
+                "country": "DE",
+                "city": "Falkenstein",
+                "latitude": 50.47612,
+                "longitude": 12.370071,
+                "network_zone": "eu-central",
+            },
+            "server_types": {"supported": [1, 2, 3], "available": [1, 2, 3], "available_for_migration": [1, 2, 3]},
+        },
+        "image": {
+            "id": 4711,
+            "type": "system",
+            "status": "available",
+            "name": "ubuntu-16.04",
+            "description": "Ubuntu 16.04 Standard 64 bit",
+            "image_size": 2.3,
+            "disk_size": 10,
+            "created": "2016-01-30T23:50:00+00:00",
+            "created_from": {"id": 1, "name": "Server"},
+            "bound_to": None,
+            "os_flavor": "ubuntu",
+            "os_version": "16.04",
+            "rapid_deploy": False,
+            "protection": {"delete": False},
+            "deprecated": "2018-02-28T00:00:00+00:00",
+            "labels": {},
+        },
+        "iso": None,
+        "rescue_enabled": False,
+        "locked": False,
+        "backup_window": "22-02",
+        "outgoing_traffic": 123456,
+        "ingoing_traffic": 123456,
+        "included_traffic": 654321,
+        "protection": {"delete": False, "rebuild": False},
+        "labels": {"env": "prod", "team": "platform"},
+        "volumes": [1, 2],
+    }
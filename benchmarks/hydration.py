@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Measure the cost of turning server responses into BoundServer objects, without any network.
+
+Usage: python -m benchmarks.hydration [--servers 10000]
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import copy
+import timeit
+
+from hcloud import Client
+from hcloud.servers.client import BoundServer
+
+from benchmarks.fake_api import fake_server
+
+
+def build(client, payloads, fields=None):
+    return [BoundServer(client.servers, payload, fields=fields) for payload in payloads]
+
+
+FIELDS = ["name", "status", "labels"]
+
+
+def touch_scalars(servers):
+    for server in servers:
+        server.name
+        server.status
+
+
+def touch_relations(servers):
+    for server in servers:
+        server.datacenter.location.name
+        server.server_type.name
+        server.image.name
+        server.public_net.ipv4.ip
+        server.volumes
+        server.private_net
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    client = Client(token="benchmark")
+    template = [fake_server(i) for i in range(1, args.servers + 1)]
+
+    def measure(function):
+        timings = []
+        for _ in range(args.repeat):
+            payloads = copy.deepcopy(template)
+            timings.append(timeit.timeit(lambda: function(payloads), number=1))
+        return min(timings) / args.servers * 1e6
+
+    scenarios = [
+        ("build", lambda payloads: build(client, payloads)),
+        ("build + name/status", lambda payloads: touch_scalars(build(client, payloads))),
+        ("build + all relations", lambda payloads: touch_relations(build(client, payloads))),
+        ("fields= + name/status", lambda payloads: touch_scalars(build(client, payloads, fields=FIELDS))),
+    ]
+    for name, function in scenarios:
+        print("{name:<24} {cost:6.1f} us per server".format(name=name, cost=measure(function)))
+
+
+if __name__ == "__main__":
+    main()
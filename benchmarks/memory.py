@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Measure the memory held per server after listing 10k servers, in full, with 3 fields and as an inventory, without any network.
+
+Usage: python -m benchmarks.memory [--servers 10000] [--max-bytes 3500]
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+
+from hcloud import Client
+from hcloud.helpers.inventory import Inventory
+
+from benchmarks.fake_api import fake_server
+
+
+def fake_labels(id):
+    return {"env": "prod", "team": "team-{id}".format(id=id % 5), "role": "web" if id % 2 else "db"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=10000)
+    parser.add_argument("--max-bytes", type=int, default=3500,
+                        help="fail if the listed servers hold more bytes per server than this")
+    args = parser.parse_args()
+
+    client = Client(token="benchmark")
+    per_page = client.servers.max_per_page
+    pages = {}
+    for page in range(1, args.servers // per_page + 2):
+        ids = range((page - 1) * per_page + 1, min(page * per_page, args.servers) + 1)
+        pages[page] = json.dumps({
+            "servers": [dict(fake_server(id), labels=fake_labels(id)) for id in ids],
+            "meta": {"pagination": {"page": page, "per_page": per_page,
+                                    "next_page": page + 1 if page * per_page < args.servers else None}},
+        })
+    # every page is decoded on its own, like the responses of the API
+    client.request = lambda url, method, params=None: json.loads(pages[params["page"]])
+
+    gc.collect()
+    tracemalloc.start()
+    servers = client.servers.get_all()
+    gc.collect()
+    listed = tracemalloc.get_traced_memory()[0] / float(len(servers))
+    for server in servers:
+        server.datacenter, server.server_type, server.image, server.public_net, server.private_net, server.created
+    gc.collect()
+    hydrated = tracemalloc.get_traced_memory()[0] / float(len(servers))
+    tracemalloc.stop()
+
+    del servers
+    gc.collect()
+    tracemalloc.start()
+    servers = client.servers.get_all(fields=["name", "status", "labels"])
+    gc.collect()
+    projected = tracemalloc.get_traced_memory()[0] / float(len(servers))
+    tracemalloc.stop()
+
+    del servers
+    gc.collect()
+    tracemalloc.start()
+    inventory = Inventory.from_client(client.servers)
+    gc.collect()
+    inventoried = tracemalloc.get_traced_memory()[0] / float(len(inventory))
+    tracemalloc.stop()
+
+    print("{name:<24} {size:8.0f} bytes per server".format(name="listed", size=listed))
+    print("{name:<24} {size:8.0f} bytes per server".format(name="fields accessed", size=hydrated))
+    print("{name:<24} {size:8.0f} bytes per server".format(name="listed with 3 fields", size=projected))
+    print("{name:<24} {size:8.0f} bytes per server".format(name="inventory", size=inventoried))
+    if hydrated > args.max_bytes:
+        print("more than {max_bytes} bytes per server".format(max_bytes=args.max_bytes))
+        sys.exit(1)
+    if inventoried >= listed:
+        print("the inventory holds more than the listed servers")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
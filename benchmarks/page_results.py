@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Measure the per-call overhead of ``get_list`` around the HTTP request, without any network.
+
+Usage: python -m benchmarks.page_results [--calls 10000]
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import timeit
+
+from hcloud import Client
+from hcloud.core.domain import add_meta_to_result
+
+from benchmarks.fake_api import fake_action
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=10000)
+    parser.add_argument("--per-page", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    response = {
+        "actions": [fake_action(i) for i in range(1, args.per_page + 1)],
+        "meta": {"pagination": {"page": 1, "per_page": args.per_page, "previous_page": None, "next_page": 2,
+                                "last_page": 10, "total_entries": 10 * args.per_page}},
+    }
+    client = Client(token="benchmark")
+    client.request = lambda url, method, params=None: response
+
+    scenarios = [
+        ("add_meta_to_result", lambda: add_meta_to_result([], response, "actions")),
+        ("actions.get_list", lambda: client.actions.get_list(page=1, per_page=args.per_page)),
+    ]
+    for name, function in scenarios:
+        cost = min(timeit.repeat(function, number=args.calls, repeat=args.repeat)) / args.calls * 1e6
+        print("{name:<24} {cost:6.2f} us per call".format(name=name, cost=cost))
+
+
+if __name__ == "__main__":
+    main()
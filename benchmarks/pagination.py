@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Compare serial, prefetching and concurrent page fetching of ``iter_all`` against a local fake API.
+
+Usage: python -m benchmarks.pagination [--actions 10000] [--latency 0.02] [--workers 8] [--prefetch 2] [--work 0.0001]
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import time
+
+from hcloud import Client
+
+from benchmarks.fake_api import FakeAPI, fake_action
+
+
+def run(endpoint, work, max_page_workers=1, prefetch_pages=0):
+    client = Client(token="benchmark", api_endpoint=endpoint)
+    client.actions.max_page_workers = max_page_workers
+    client.actions.prefetch_pages = prefetch_pages
+    count = 0
+    start = time.time()
+    for action in client.actions.iter_all():
+        if work:
+            # stands in for whatever the caller does with every item
+            time.sleep(work)
+        count += 1
+    return count, time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--actions", type=int, default=10000)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds of fake network latency per request")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--prefetch", type=int, default=2)
+    parser.add_argument("--work", type=float, default=0.0, help="seconds the consumer spends on every item")
+    args = parser.parse_args()
+
+    modes = [
+        ("serial", {}),
+        ("prefetch_pages={0}".format(args.prefetch), {"prefetch_pages": args.prefetch}),
+        ("max_page_workers={0}".format(args.workers), {"max_page_workers": args.workers}),
+    ]
+    with FakeAPI({"actions": [fake_action(i) for i in range(1, args.actions + 1)]}, latency=args.latency) as api:
+        for name, options in modes:
+            count, duration = run(api.endpoint, args.work, **options)
+            print("{name:<22} {count} actions in {duration:.2f}s".format(name=name, count=count, duration=duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Compare the compact serialization of bound servers with plain JSON of their response data.
+
+Usage: python -m benchmarks.serialization [--servers 1000]
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import json
+import timeit
+
+from hcloud import Client
+from hcloud.core.serialization import dumps, loads
+from hcloud.servers.client import BoundServer
+
+from benchmarks.fake_api import fake_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    client = Client(token="benchmark")
+    data = [fake_server(i) for i in range(1, args.servers + 1)]
+    servers = [BoundServer(client.servers, server) for server in data]
+    plain = json.dumps(data).encode("utf-8")
+    compact = dumps(servers)
+
+    print("{name:<24} {size:8.0f} bytes per server".format(name="json", size=len(plain) / float(args.servers)))
+    print("{name:<24} {size:8.0f} bytes per server".format(name="serialization", size=len(compact) / float(args.servers)))
+
+    scenarios = [
+        ("json dump", lambda: json.dumps(data).encode("utf-8")),
+        ("json load + models", lambda: [BoundServer(client.servers, server) for server in json.loads(plain)]),
+        ("serialization dump", lambda: dumps(servers)),
+        ("serialization load", lambda: loads(compact, client)),
+    ]
+    for name, function in scenarios:
+        cost = min(timeit.repeat(function, number=1, repeat=args.repeat)) / args.servers * 1e6
+        print("{name:<24} {cost:8.2f} us per server".format(name=name, cost=cost))
+
+
+if __name__ == "__main__":
+    main()
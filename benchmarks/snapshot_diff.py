@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Measure diffing two snapshots of many servers, as a reconcile loop does every run.
+
+Usage: python -m benchmarks.snapshot_diff [--servers 20000] [--changed 200]
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import copy
+import timeit
+
+from hcloud.helpers.snapshot import Snapshot
+
+from benchmarks.fake_api import fake_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=20000)
+    parser.add_argument("--changed", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    old = Snapshot({"servers": dict((id, fake_server(id)) for id in range(1, args.servers + 1))})
+    # a separate copy, as consecutive listings share no objects
+    new = Snapshot({"servers": copy.deepcopy(old.resources["servers"])})
+    for id in range(1, args.changed + 1):
+        new.resources["servers"][id]["status"] = "off"
+        new.resources["servers"][id]["labels"] = {"env": "dev"}
+        new.resources["servers"][id]["private_net"][0]["alias_ips"] = []
+    del new.resources["servers"][args.servers]
+    new.resources["servers"][args.servers + 1] = fake_server(args.servers + 1)
+
+    diff = old.diff(new)
+    print("{added} added, {removed} removed, {changed} changed".format(
+        added=len(diff.added), removed=len(diff.removed), changed=len(diff.changed)))
+    for servers in (args.servers // 10, args.servers):
+        old_part = Snapshot({"servers": dict(list(old.resources["servers"].items())[:servers])})
+        new_part = Snapshot({"servers": dict(list(new.resources["servers"].items())[:servers])})
+        cost = min(timeit.repeat(lambda: old_part.diff(new_part), number=1, repeat=args.repeat))
+        print("{servers:>6} servers {cost:8.1f} ms per diff".format(servers=servers, cost=cost * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""Generate the domain classes in ``hcloud/*/domain.py`` from ``codegen/schema.json``.
+
+Every class of the schema gets its ``__slots__``, ``__init__`` and a straight-line ``from_dict`` generated,
+timestamps are parsed lazily through ``lazy_iso_datetimes``. Classes with an ``id`` field also get a
+``from_projection``, which reads only the given fields besides the id. Docstrings, constants and base classes
+are written by hand above the generated code.
+
+Field options of the schema:
+
+* ``required``: the constructor has no default for the field
+* ``type``: the type comment of the constructor parameter
+* ``timestamp``: the field holds an ISO 8601 timestamp, parsed on the first access
+* ``intern``: the strings of the field repeat between objects and are interned
+* ``shared``: the field embeds catalog data of the given resource kind, equal data is shared between objects
+
+Usage: python -m codegen.generate [--check]
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import json
+import os
+import re
+import sys
+from collections import OrderedDict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA = os.path.join(ROOT, "codegen", "schema.json")
+
+BEGIN = "    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit\n"
+END = "    # end of generated code\n"
+
+
+def load_schema(path=SCHEMA):
+    with open(path) as schema_file:
+        return json.load(schema_file, object_pairs_hook=OrderedDict)
+
+
+def render_class(fields):
+    # type: (List[dict]) -> str
+    """Returns the generated body of a domain class, including the markers"""
+    lines = [BEGIN, "    __slots__ = (\n"]
+    lines.extend('        "{name}",\n'.format(name=field["name"]) for field in fields)
+    lines.append("    )\n")
+
+    lines.append("\n    def __init__(\n        self,\n")
+    for field in fields:
+        parameter = field["name"] if field.get("required") else "{name}=None".format(name=field["name"])
+        if field.get("type"):
+            parameter = "{parameter},  # type: {type}".format(parameter=parameter, type=field["type"])
+        else:
+            parameter += ","
+        lines.append("        {parameter}\n".format(parameter=parameter))
+    lines.append("    ):\n")
+    lines.extend("        self.{name} = {name}\n".format(name=field["name"]) for field in fields)
+
+    lines.append("\n    @classmethod\n    def from_dict(cls, data):\n")
+    lines.append("        domain = cls.__new__(cls)\n")
+    if not all(field.get("required") for field in fields):
+        lines.append("        get = data.get\n")
+    for field in fields:
+        lines.append("        domain.{name} = {value}\n".format(name=field["name"], value=render_value(field)))
+    lines.append("        return domain\n")
+
+    if any(field["name"] == "id" for field in fields):
+        lines.append("\n    @classmethod\n    def from_projection(cls, data, fields):\n")
+        lines.append("        domain = cls.__new__(cls)\n")
+        lines.append("        get = data.get\n")
+        for field in fields:
+            if field["name"] == "id":
+                value = render_value(field)
+            else:
+                value = '{value} if "{name}" in fields else None'.format(
+                    value=render_value(dict(field, required=False)), name=field["name"])
+            lines.append("        domain.{name} = {value}\n".format(name=field["name"], value=value))
+        lines.append("        return domain\n")
+    lines.append(END)
+    return "".join(lines)
+
+
+def render_value(field):
+    # type: (dict) -> str
+    """Returns the expression reading a field from the response data `data`"""
+    value = 'data["{name}"]' if field.get("required") else 'get("{name}")'
+    value = value.format(name=field["name"])
+    if field.get("intern"):
+        value = "intern_strings({value})".format(value=value)
+    if field.get("shared"):
+        value = 'shared_values.share("{kind}", {value})'.format(kind=field["shared"], value=value)
+    return value
+
+
+def render_decorator(fields):
+    timestamps = [field["name"] for field in fields if field.get("timestamp")]
+    if not timestamps:
+        return ""
+    return "@lazy_iso_datetimes({names})\n".format(names=", ".join('"{name}"'.format(name=name) for name in timestamps))
+
+
+def render_module(source, classes):
+    # type: (str, Dict[str, List[dict]]) -> str
+    """Returns the source of a domain module with the generated parts of the given classes replaced"""
+    for name, fields in classes.items():
+        match = re.search(r"^(?:@lazy_iso_datetimes\(.*\)\n)?(class {name}\(.*\n)".format(name=name), source, re.MULTILINE)
+        if match is None:
+            raise ValueError("class {name} not found".format(name=name))
+        body_end = re.compile(r"^\S", re.MULTILINE).search(source, match.end())
+        body_end = body_end.start() if body_end else len(source)
+        body = source[match.end():body_end]
+
+        start = body.find(BEGIN)
+        if start < 0:
+            # written by hand so far, everything from the slots on is generated
+            start = body.index("    __slots__ = ")
+            end = len(body.rstrip()) + 1
+        else:
+            end = body.index(END, start) + len(END)
+
+        body = body[:start] + render_class(fields) + body[end:]
+        source = source[:match.start()] + render_decorator(fields) + match.group(1) + body + source[body_end:]
+    return source
+
+
+def generate(check=False, root=ROOT):
+    # type: (bool, str) -> List[str]
+    """Regenerates the domain modules, returns the paths of the modules which were out of date
+
+    :param check: bool
+           Only report the modules which are out of date, without writing them
+    """
+    stale = []
+    for module, classes in load_schema().items():
+        path = os.path.join(root, *module.split(".")) + ".py"
+        with open(path) as module_file:
+            source = module_file.read()
+        generated = render_module(source, classes)
+        if generated != source:
+            stale.append(path)
+            if not check:
+                with open(path, "w") as module_file:
+                    module_file.write(generated)
+    return stale
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="fail if a domain module is out of date")
+    args = parser.parse_args()
+
+    stale = generate(check=args.check)
+    for path in stale:
+        print("{action} {path}".format(action="out of date:" if args.check else "generated", path=os.path.relpath(path, ROOT)))
+    if args.check and stale:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
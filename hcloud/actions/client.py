@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 import time
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+from dateutil.tz import tzutc
 
 from hcloud.core.client import ClientEntityBase, BoundModelBase
 from hcloud.actions.domain import Action, ActionFailedException, ActionTimeoutException
 
 
 class BoundAction(BoundModelBase):
+    __slots__ = ()
     model = Action
 
     def wait_until_finished(self, max_retries=100):
@@ -30,23 +35,32 @@ class BoundAction(BoundModelBase):
 
 class ActionsClient(ClientEntityBase):
     results_list_attribute_name = 'actions'
+    query_params = ('status', 'sort')
 
-    def get_by_id(self, id):
-        # type: (int) -> BoundAction
+    def get_by_id(self, id, raw=False, fields=None):
+        # type: (int, bool, Optional[List[str]]) -> BoundAction
         """Get a specific action by its ID.
 
         :param id: int
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundAction <hcloud.actions.client.BoundAction>`
         """
 
         response = self._client.request(url="/actions/{action_id}".format(action_id=id), method="GET")
-        return BoundAction(self, response['action'])
+        if raw:
+            return response['action']
+        return BoundAction(self, response['action'], fields=fields)
 
     def get_list(self,
                  status=None,  # type: Optional[List[str]]
                  sort=None,  # type: Optional[List[str]]
                  page=None,  # type: Optional[int]
                  per_page=None,  # type: Optional[int]
+                 raw=False,  # type: bool
+                 fields=None,  # type: Optional[List[str]]
                  ):
         # type: (...) -> PageResults[List[BoundAction]]
         """Get a list of actions from this account
@@ -59,6 +73,10 @@ class ActionsClient(ClientEntityBase):
                Specifies the page to fetch
         :param per_page: int (optional)
                Specifies how many results are returned by page
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: (List[:class:`BoundAction <hcloud.actions.client.BoundAction>`], :class:`Meta <hcloud.core.domain.Meta>`)
         """
         params = {}
@@ -72,17 +90,110 @@ class ActionsClient(ClientEntityBase):
             params["per_page"] = per_page
 
         response = self._client.request(url="/actions", method="GET", params=params)
-        actions = [BoundAction(self, action_data) for action_data in response['actions']]
+        if raw:
+            return self._add_meta_to_result(response['actions'], response)
+        actions = [BoundAction(self, action_data, fields=fields) for action_data in response['actions']]
         return self._add_meta_to_result(actions, response)
 
-    def get_all(self, status=None, sort=None):
-        # type: (Optional[List[str]], Optional[List[str]]) -> List[BoundAction]
+    def get_all(self, status=None, sort=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[List[str]], Optional[List[str]], Optional[PaginationCursor], bool, Optional[List[str]]) -> List[BoundAction]
         """Get all actions of the account
 
         :param status: List[str] (optional)
                Response will have only actions with specified statuses. Choices: `running` `success` `error`
         :param sort: List[str] (optional)
                Specify how the results are sorted. Choices: `id` `command` `status` `progress`  `started` `finished` . You can add one of ":asc", ":desc" to modify sort order. ( ":asc" is default)
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
         """
-        return super(ActionsClient, self).get_all(status=status, sort=sort)
+        return super(ActionsClient, self).get_all(status=status, sort=sort, resume_from=resume_from, raw=raw, fields=fields)
+
+    def iter_all(self, status=None, sort=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[List[str]], Optional[List[str]], Optional[PaginationCursor], bool, Optional[List[str]]) -> PageIterator[BoundAction]
+        """Iterate over all actions of the account, fetching the next page only when the current one is exhausted
+
+        :param status: List[str] (optional)
+               Response will have only actions with specified statuses. Choices: `running` `success` `error`
+        :param sort: List[str] (optional)
+               Specify how the results are sorted. Choices: `id` `command` `status` `progress`  `started` `finished` . You can add one of ":asc", ":desc" to modify sort order. ( ":asc" is default)
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
+        :return: PageIterator[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+        """
+        return super(ActionsClient, self).iter_all(status=status, sort=sort, resume_from=resume_from, raw=raw, fields=fields)
+
+    def get_history(self,
+                    resources,          # type: List[BoundModelBase]
+                    status=None,        # type: Optional[List[str]]
+                    sort=None,          # type: Optional[List[str]]
+                    since=None,         # type: Optional[datetime]
+                    max_workers=8,      # type: int
+                    rate_limiter=None,  # type: Optional[RateLimiter]
+                    ):
+        # type: (...) -> OrderedDict[BoundModelBase, List[BoundAction]]
+        """Get the actions of many servers, volumes, Floating IPs, images and networks at once. The resources are
+        paginated concurrently, every worker collects the complete history of one resource at a time.
+
+        :param resources: List[:class:`BoundServer <hcloud.servers.client.BoundServer>`, :class:`BoundVolume <hcloud.volumes.client.BoundVolume>`, :class:`BoundFloatingIP <hcloud.floating_ips.client.BoundFloatingIP>`, :class:`BoundImage <hcloud.images.client.BoundImage>`, :class:`BoundNetwork <hcloud.networks.client.BoundNetwork>`]
+        :param status: List[str] (optional)
+               Response will have only actions with specified statuses. Choices: `running` `success` `error`
+        :param sort: List[str] (optional)
+               Specify how the results are sorted. Choices: `id` `command` `status` `progress`  `started` `finished` . You can add one of ":asc", ":desc" to modify sort order. ( ":asc" is default)
+        :param since: datetime (optional)
+               Only actions started at or after this point in time (naive datetimes are treated as UTC). The actions are
+               requested newest first and the pagination of a resource stops at the first older action, so `sort` can not be combined with it.
+        :param max_workers: int
+               Number of resources paginated in parallel (default is 8)
+        :param rate_limiter: :class:`RateLimiter <hcloud.core.rate_limit.RateLimiter>` (optional)
+               Budget every page request of all workers has to fit in, can be shared with other calls
+        :return: OrderedDict[resource, List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]]
+                 The actions of every resource, in the order the resources were given
+        """
+        for resource in resources:
+            if not hasattr(getattr(resource, '_client', None), 'get_actions_list'):
+                raise ValueError('{} does not support get_actions'.format(resource.__class__.__name__))
+
+        if since is not None:
+            if sort is not None:
+                raise ValueError('sort can not be combined with since, actions are sorted by started:desc')
+            sort = ["started:desc"]
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=tzutc())
+
+        def collect(resource):
+            list_function = resource._client.get_actions_list
+            if rate_limiter is not None:
+                list_function = rate_limiter.wrap(list_function)
+
+            actions = resource._client._iter_all(list_function, 'actions', resource, status=status, sort=sort)
+            history = []
+            try:
+                for action in actions:
+                    if since is not None and action.started is not None and action.started < since:
+                        break
+                    history.append(action)
+            finally:
+                actions.close()
+            return history
+
+        resources = list(OrderedDict.fromkeys(resources))
+        histories = OrderedDict()
+        if not resources:
+            return histories
+
+        pool = ThreadPool(min(max_workers, len(resources)))
+        try:
+            for resource, history in zip(resources, pool.imap(collect, resources)):
+                histories[resource] = history
+        finally:
+            pool.terminate()
+        return histories
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
-from dateutil.parser import isoparse
 
-from hcloud.core.domain import BaseDomain
+from hcloud.core.domain import BaseDomain, intern_strings, lazy_iso_datetimes
 
 
+@lazy_iso_datetimes("started", "finished")
 class Action(BaseDomain):
     """Action Domain
 
@@ -23,38 +23,67 @@ class Action(BaseDomain):
     STATUS_ERROR = "error"
     """Action Status error"""
 
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "id",
         "command",
         "status",
         "progress",
+        "started",
+        "finished",
         "resources",
         "error",
-        "started",
-        "finished"
     )
 
     def __init__(
-            self,
-            id,
-            command=None,
-            status=None,
-            progress=None,
-            started=None,
-            finished=None,
-            resources=None,
-            error=None
+        self,
+        id,
+        command=None,
+        status=None,
+        progress=None,
+        started=None,
+        finished=None,
+        resources=None,
+        error=None,
     ):
         self.id = id
         self.command = command
-
         self.status = status
         self.progress = progress
-        self.started = isoparse(started) if started else None
-        self.finished = isoparse(finished) if finished else None
+        self.started = started
+        self.finished = finished
         self.resources = resources
         self.error = error
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = data["id"]
+        domain.command = intern_strings(get("command"))
+        domain.status = intern_strings(get("status"))
+        domain.progress = get("progress")
+        domain.started = get("started")
+        domain.finished = get("finished")
+        domain.resources = get("resources")
+        domain.error = get("error")
+        return domain
+
+    @classmethod
+    def from_projection(cls, data, fields):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = data["id"]
+        domain.command = intern_strings(get("command")) if "command" in fields else None
+        domain.status = intern_strings(get("status")) if "status" in fields else None
+        domain.progress = get("progress") if "progress" in fields else None
+        domain.started = get("started") if "started" in fields else None
+        domain.finished = get("finished") if "finished" in fields else None
+        domain.resources = get("resources") if "resources" in fields else None
+        domain.error = get("error") if "error" in fields else None
+        return domain
+    # end of generated code
+
 
 class ActionFailedException(Exception):
     """The Action you was waiting for failed"""
@@ -1 +1,19 @@
 # -*- coding: utf-8 -*-
+import importlib
+
+try:
+    from importlib.machinery import EXTENSION_SUFFIXES
+except ImportError:  # Python 2
+    import imp
+
+    EXTENSION_SUFFIXES = [suffix for suffix, mode, type in imp.get_suffixes() if type == imp.C_EXTENSION]
+
+
+def is_compiled(module="hcloud.core.domain"):
+    # type: (str) -> bool
+    """Returns True if the module was compiled, see ``HCLOUD_COMPILE`` in setup.py
+
+    :param module: str
+           Name of the module, by default the domain base of all models
+    """
+    return importlib.import_module(module).__file__.endswith(tuple(EXTENSION_SUFFIXES))
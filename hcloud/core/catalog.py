@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+
+class CatalogCache(object):
+    """Keeps static catalogs (server types, locations, datacenters, ISOs and system images) in memory
+
+    A catalog is listed once on its first lookup by id or name and again after its time to live passed,
+    lookups in between are answered without any request. Entries which are not in the catalog are
+    requested from the API as usual. Catalogs are kept per API endpoint and token, so one cache can be
+    shared by several :class:`Clients <hcloud.Client>`.
+
+    The cached response data is shared by all lookups and must not be modified.
+
+    :param ttl: float (optional)
+           Seconds a catalog is kept before it is listed again (default is 3600)
+    :param ttls: Dict[str, float] (optional)
+           Time to live of single catalogs by their name, e.g. `{"isos": 600}`
+    """
+
+    def __init__(self, ttl=3600, ttls=None):
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self._catalogs = {}
+        self._lock = threading.RLock()
+
+    def get(self, client, field, value):
+        # type: (ClientEntityBase, str, Any) -> Optional[dict]
+        """Returns the response data of the catalog entry whose field has the given value, None if there is none
+
+        :param client: Resource client of the catalog, e.g. :class:`ServerTypesClient <hcloud.server_types.client.ServerTypesClient>`
+        :param field: str
+               `id` or `name`
+        :param value: id or name of the entry
+        :return: Dict
+        """
+        name = client.results_list_attribute_name
+        with self._lock:
+            catalog = self._catalogs.get((self._client_key(client), name))
+            if catalog is None or catalog[0] <= time.time():
+                catalog = self._load(client)
+            return catalog[1][field].get(value)
+
+    def refresh(self, client):
+        # type: (ClientEntityBase) -> None
+        """Lists the catalog of the given resource client now, e.g. to warm up the cache
+
+        :param client: Resource client of the catalog, e.g. :class:`LocationsClient <hcloud.locations.client.LocationsClient>`
+        """
+        self._list(client)
+
+    def invalidate(self, name=None):
+        # type: (Optional[str]) -> None
+        """Forgets a catalog, or all catalogs if no name is given, they are listed again on their next lookup
+
+        :param name: str (optional)
+               Name of the catalog, e.g. `server_types`
+        """
+        with self._lock:
+            if name is None:
+                self._catalogs.clear()
+            else:
+                for key in [key for key in self._catalogs if key[1] == name]:
+                    del self._catalogs[key]
+
+    def _load(self, client):
+        """Returns the catalog of the client which is missing or expired in memory"""
+        return self._list(client)
+
+    def _list(self, client):
+        name = client.results_list_attribute_name
+        entries = list(client.iter_all(raw=True, **client.catalog_filters))
+        return self._keep(client, time.time() + self.ttls.get(name, self.ttl), entries)
+
+    def _client_key(self, client):
+        """Returns the API endpoint and token of the client, catalogs are kept per both"""
+        api_client = client._client
+        return api_client._api_endpoint, api_client.token
+
+    def _keep(self, client, expires, entries):
+        index = {
+            "id": dict((entry["id"], entry) for entry in entries),
+            "name": dict((entry["name"], entry) for entry in entries if entry.get("name") is not None),
+        }
+        with self._lock:
+            catalog = self._catalogs[(self._client_key(client), client.results_list_attribute_name)] = (expires, index)
+        return catalog
+
+
+def default_cache_path():
+    # type: () -> str
+    """Returns the path of the database of :class:`PersistentCatalogCache`, in the user cache directory"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "hcloud-python", "catalogs.sqlite3")
+
+
+class PersistentCatalogCache(CatalogCache):
+    """Catalog cache which stores the catalogs in a sqlite database, so later processes start with them
+
+    Catalogs are stored per API endpoint and token, the token itself is only stored as part of a hash. Every
+    catalog is replaced in one transaction, processes sharing the database read either the old or the new
+    catalog. When the database can not be read or written the catalogs are listed and kept in memory only.
+
+    :param path: str (optional)
+           Path of the database, created on first use (default is `hcloud-python/catalogs.sqlite3` in `$XDG_CACHE_HOME` or `~/.cache`)
+    :param ttl: float (optional)
+           Seconds a catalog is kept before it is listed again (default is 3600)
+    :param ttls: Dict[str, float] (optional)
+           Time to live of single catalogs by their name, e.g. `{"isos": 600}`
+    """
+    busy_timeout = 10
+    """Seconds to wait for another process writing to the database"""
+
+    def __init__(self, path=None, ttl=3600, ttls=None):
+        super(PersistentCatalogCache, self).__init__(ttl=ttl, ttls=ttls)
+        self.path = path or default_cache_path()
+        self._created = False
+
+    def invalidate(self, name=None):
+        # type: (Optional[str]) -> None
+        """Forgets a catalog, or all catalogs if no name is given, in memory and in the database
+
+        :param name: str (optional)
+               Name of the catalog, e.g. `server_types`
+        """
+        super(PersistentCatalogCache, self).invalidate(name)
+        try:
+            with self._connect() as connection:
+                if name is None:
+                    connection.execute("DELETE FROM catalogs")
+                else:
+                    connection.execute("DELETE FROM catalogs WHERE name = ?", (name,))
+        except sqlite3.Error:
+            pass
+
+    def _load(self, client):
+        name = client.results_list_attribute_name
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT expires, entries FROM catalogs WHERE key = ? AND name = ? AND expires > ?",
+                    (self._key(client), name, time.time()),
+                ).fetchone()
+        except sqlite3.Error:
+            row = None
+        if row is not None:
+            try:
+                entries = json.loads(row[1])
+            except ValueError:
+                # truncated or corrupt, listed again like a missing catalog
+                pass
+            else:
+                return self._keep(client, row[0], entries)
+        return super(PersistentCatalogCache, self)._load(client)
+
+    def _list(self, client):
+        catalog = super(PersistentCatalogCache, self)._list(client)
+        entries = json.dumps(list(catalog[1]["id"].values()), separators=(",", ":"))
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO catalogs (key, name, expires, entries) VALUES (?, ?, ?, ?)",
+                    (self._key(client), client.results_list_attribute_name, catalog[0], entries),
+                )
+        except sqlite3.Error:
+            pass
+        return catalog
+
+    def _key(self, client):
+        """Returns the key of the catalogs of the client in the database, the token is only stored as part of a hash"""
+        key = "{0}\n{1}".format(*self._client_key(client))
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def _connect(self):
+        """Opens the database for one transaction, which is committed unless an exception is raised"""
+        if not self._created:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.isdir(directory):
+                try:
+                    os.makedirs(directory, 0o700)
+                except OSError:
+                    # created by another process in the meantime, or not writable
+                    pass
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout)
+        try:
+            with connection:
+                if not self._created:
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS catalogs ("
+                        "key TEXT NOT NULL, name TEXT NOT NULL, expires REAL NOT NULL, entries TEXT NOT NULL, "
+                        "PRIMARY KEY (key, name))"
+                    )
+                    self._created = True
+                yield connection
+        finally:
+            connection.close()
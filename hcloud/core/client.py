@@ -1,10 +1,152 @@
 # -*- coding: utf-8 -*-
-from hcloud.core.domain import add_meta_to_result
+import threading
+from collections import Counter, OrderedDict
+from multiprocessing.pool import ThreadPool
+
+try:
+    from queue import Full, Queue
+except ImportError:  # Python 2
+    from Queue import Full, Queue
+
+from hcloud.core.catalog import CatalogCache
+from hcloud.core.domain import PaginationCursor, add_meta_to_result
+from hcloud.core.identity import IdentityMap
+from hcloud.core.query import Query
+
+
+def _prefetch(iterator, depth):
+    """Consume `iterator` on a background thread, keeping up to `depth` entries ready ahead of the caller"""
+    buffer = Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(entry):
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for value in iterator:
+                if not put((True, value)):
+                    return
+        except Exception as exception:
+            put((False, exception))
+        else:
+            put((False, None))
+
+    producer = threading.Thread(target=produce)
+    producer.daemon = True
+    producer.start()
+    try:
+        while True:
+            has_value, value = buffer.get()
+            if not has_value:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        stopped.set()
+
+
+_lazy_reloads_lock = threading.Lock()
+_loaded_field_sets = {}
+_projections = {}
+
+
+def _projection(model, fields):
+    """Returns the response keys a bound model is built with for the given fields, always including the id"""
+    key = (model, tuple(fields))
+    names = _projections.get(key)
+    if names is None:
+        known = model._fields()
+        for name in fields:
+            if name not in known:
+                raise ValueError("{field} is not a field of {model}".format(field=name, model=model.__name__))
+        names = frozenset(fields) | frozenset(["id"])
+        names = _projections[key] = _loaded_field_sets.setdefault(names, names)
+    return names
+
+
+def resolve_placeholders(models):
+    # type: (Iterable[BoundModelBase]) -> None
+    """Fill incomplete bound models with one paginated listing per resource client
+
+    The listing stops as soon as every model of its client was found, models that are not listed keep being
+    incomplete and are reloaded one by one on access as before.
+    """
+    pending = OrderedDict()
+    for model in models:
+        if model is not None and not model.complete:
+            pending.setdefault(model._client, OrderedDict()).setdefault(model._data_model.id, []).append(model)
+
+    for client, models_by_id in pending.items():
+        entries = client.iter_all(raw=True)
+        try:
+            for data in entries:
+                for model in models_by_id.pop(data["id"], ()):
+                    model._fill(data)
+                if not models_by_id:
+                    break
+        finally:
+            entries.close()
+
+
+class PageIterator(object):
+    """Iterates over the entries of a paginated listing, fetching pages as they are needed
+
+    :attr:`cursor` always points behind the last page that was completely handed out, so a listing
+    that failed with an exception can be continued later with `resume_from=iterator.cursor`. Listings
+    of all entries at once (`get_all`, `get_actions`) attach the cursor to the exception as `cursor`.
+    """
+
+    def __init__(self, pages, results_list_attribute_name, cursor):
+        self.cursor = cursor
+        self._entries = self._iter_entries(pages, results_list_attribute_name)
+
+    def _iter_entries(self, pages, results_list_attribute_name):
+        for page_result in pages:
+            result = getattr(page_result, results_list_attribute_name)
+            if result:
+                for item in result:
+                    yield item
+            meta = page_result.meta
+            if meta and meta.pagination:
+                completed_page = meta.pagination.page
+            else:
+                completed_page = self.cursor.next_page
+            self.cursor = PaginationCursor(self.cursor.params, self.cursor.per_page, completed_page)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._entries)
+
+    next = __next__
+
+    def close(self):
+        """Stops the iteration, pages which were not fetched yet are never requested"""
+        self._entries.close()
 
 
 class ClientEntityBase(object):
     max_per_page = 50
+    max_page_workers = 1
+    """Number of pages fetched in parallel by get_all/iter_all once the first page reported the `last_page` (1 fetches pages one after another)"""
+    prefetch_pages = 0
+    """Number of pages get_all/iter_all fetch in the background while the current page is processed (0 disables read-ahead)"""
     results_list_attribute_name = None
+    query_params = ()
+    """Parameters of get_list besides the pagination, used to push filters of a :class:`Query <hcloud.core.query.Query>` to the API"""
+    max_shared_models = 1024
+    """Number of bound models of embedded catalog data (e.g. the datacenter of servers) kept to share them between models"""
+    catalog_filters = None
+    """Filters of the listing a :class:`CatalogCache <hcloud.core.catalog.CatalogCache>` keeps of this client, None if its entries are no static catalog"""
 
     def __init__(self, client):
         """
@@ -12,6 +154,7 @@ class ClientEntityBase(object):
         :return self
         """
         self._client = client
+        self._shared_models = {}
 
     def _is_list_attribute_implemented(self):
         if self.results_list_attribute_name is None:
@@ -19,6 +162,14 @@ class ClientEntityBase(object):
                 "in order to get results list, 'results_list_attribute_name' attribute of {} has to be specified". format(self.__class__.__name__)
             )
 
+    def _from_catalog(self, field, value):
+        # type: (str, Any) -> Optional[dict]
+        """Returns the response data of the entry with the given id or name from the catalog cache of the client, None if it is not cached"""
+        catalog_cache = getattr(self._client, "_catalog_cache", None)
+        if self.catalog_filters is None or not isinstance(catalog_cache, CatalogCache):
+            return None
+        return catalog_cache.get(self, field, value)
+
     def _add_meta_to_result(self,
                             results,  # type: List[BoundModelBase]
                             response  # type: json
@@ -27,6 +178,65 @@ class ClientEntityBase(object):
         self._is_list_attribute_implemented()
         return add_meta_to_result(results, response, self.results_list_attribute_name)
 
+    def _iter_pages(self,
+                    list_function,  # type: function
+                    page,           # type: int
+                    per_page,       # type: int
+                    *args,
+                    **kwargs
+                    ):
+        # type (...) -> Generator[PageResults]
+        def fetch_page(page):
+            return list_function(page=page, per_page=per_page, *args, **kwargs)
+
+        while page:
+            page_result = fetch_page(page)
+            yield page_result
+            meta = page_result.meta
+            pagination = meta.pagination if meta else None
+            if pagination and pagination.next_page:
+                page = pagination.next_page
+            else:
+                page = None
+
+            if page and pagination.last_page and self.max_page_workers > 1:
+                for page_result in self._iter_pages_concurrently(fetch_page, range(page, pagination.last_page + 1)):
+                    yield page_result
+                page = None
+
+    def _iter_pages_concurrently(self,
+                                 fetch_page,  # type: function
+                                 pages,       # type: List[int]
+                                 ):
+        # type (...) -> Generator[PageResults]
+        pool = ThreadPool(min(self.max_page_workers, len(pages)))
+        try:
+            # imap hands the pages back in the requested order, whichever finishes first
+            for page_result in pool.imap(fetch_page, pages):
+                yield page_result
+        finally:
+            pool.terminate()
+
+    def _iter_all(self,
+                  list_function,                # type: function
+                  results_list_attribute_name,  # type: str
+                  *args,
+                  **kwargs
+                  ):
+        # type (...) -> PageIterator[BoundModelBase]
+        resume_from = kwargs.pop("resume_from", None)
+        if resume_from is not None:
+            cursor = resume_from
+            kwargs = dict(resume_from.params)
+        else:
+            cursor = PaginationCursor(params=kwargs, per_page=self.max_per_page)
+
+        pages = self._iter_pages(list_function, cursor.next_page, cursor.per_page, *args, **kwargs)
+        if self.prefetch_pages > 0:
+            pages = _prefetch(pages, self.prefetch_pages)
+
+        return PageIterator(pages, results_list_attribute_name, cursor)
+
     def _get_all(self,
                  list_function,                # type: function
                  results_list_attribute_name,  # type: str
@@ -34,27 +244,57 @@ class ClientEntityBase(object):
                  **kwargs
                  ):
         # type (...) -> List[BoundModelBase]
-        page = 1
-
-        results = []
-
-        while page:
-            page_result = list_function(page=page, per_page=self.max_per_page, *args, **kwargs)
-            result = getattr(page_result, results_list_attribute_name)
-            if result:
-                results.extend(result)
-            meta = page_result.meta
-            if meta and meta.pagination and meta.pagination.next_page and meta.pagination.next_page:
-                page = meta.pagination.next_page
-            else:
-                page = None
+        iterator = self._iter_all(list_function, results_list_attribute_name, *args, **kwargs)
+        try:
+            return list(iterator)
+        except Exception as exception:
+            # the entries fetched so far are lost, the listing can be continued with resume_from=exception.cursor
+            exception.cursor = iterator.cursor
+            raise
 
-        return results
+    def _expand(self,
+                models,  # type: List[BoundModelBase]
+                expand,  # type: Optional[List[str]]
+                ):
+        # type: (...) -> None
+        """Resolves the placeholders the given fields of the models refer to, see :attr:`BoundModelBase._expandable`"""
+        if not expand:
+            return
+        placeholders = []
+        for model in models:
+            for name in expand:
+                try:
+                    field, placeholders_of = model._expandable[name]
+                except KeyError:
+                    raise ValueError("{field} of {model} can not be expanded".format(field=name, model=model.__class__.__name__))
+                if not model.complete and field not in model._loaded_fields:
+                    raise ValueError("{field} of {model} can not be expanded, {source} is not among the fields".format(
+                        field=name, model=model.__class__.__name__, source=field))
+                placeholders.extend(placeholders_of(model))
+        resolve_placeholders(placeholders)
 
     def get_all(self, *args, **kwargs):
         # type: (...) -> List[BoundModelBase]
         self._is_list_attribute_implemented()
-        return self._get_all(self.get_list, self.results_list_attribute_name, *args, **kwargs)
+        expand = kwargs.pop("expand", None)
+        models = self._get_all(self.get_list, self.results_list_attribute_name, *args, **kwargs)
+        if not kwargs.get("raw"):
+            self._expand(models, expand)
+        return models
+
+    def iter_all(self, *args, **kwargs):
+        # type: (...) -> PageIterator[BoundModelBase]
+        self._is_list_attribute_implemented()
+        return self._iter_all(self.get_list, self.results_list_attribute_name, *args, **kwargs)
+
+    def query(self):
+        # type: () -> Query
+        """Starts a :class:`Query <hcloud.core.query.Query>` over all entries of this client
+
+        :return: :class:`Query <hcloud.core.query.Query>`
+        """
+        self._is_list_attribute_implemented()
+        return Query(self)
 
     def get_actions(self, *args, **kwargs):
         # type: (...) -> List[BoundModelBase]
@@ -63,52 +303,199 @@ class ClientEntityBase(object):
 
         return self._get_all(self.get_actions_list, 'actions', *args, **kwargs)
 
+    def iter_actions(self, *args, **kwargs):
+        # type: (...) -> PageIterator[BoundModelBase]
+        if not hasattr(self, 'get_actions_list'):
+            raise ValueError('this endpoint does not support iter_actions method')
+
+        return self._iter_all(self.get_actions_list, 'actions', *args, **kwargs)
+
 
 class GetEntityByNameMixin(object):
     """
     Use as a mixin for ClientEntityBase classes
     """
 
-    def get_by_name(self, name):
-        # type: (str) -> BoundModelBase
+    def get_by_name(self, name, raw=False, fields=None):
+        # type: (str, bool, Optional[List[str]]) -> BoundModelBase
         self._is_list_attribute_implemented()
-        response = self.get_list(name=name)
+        entity = self._from_catalog("name", name)
+        if entity is not None:
+            # served from the catalog cache as well
+            return self.get_by_id(entity["id"], raw=raw, fields=fields)
+        if raw:
+            response = self.get_list(name=name, raw=True)
+        elif fields is not None:
+            response = self.get_list(name=name, fields=fields)
+        else:
+            response = self.get_list(name=name)
         entities = getattr(response, self.results_list_attribute_name)
         entity = entities[0] if entities else None
         return entity
 
 
 class BoundModelBase(object):
-    """Bound Model Base"""
+    """Bound Model Base
+
+    Models built with `fields` (an option of `get_by_id`, `get_by_name`, `get_list`, `get_all` and `iter_all`)
+    hold only the given fields besides the id. Nested models are built on their first access either way, so
+    this saves memory rather than build time. Reading a field which was not requested reloads the model with
+    one `get_by_id` request, which is one request per model when a listing is read that way (see
+    :attr:`lazy_reloads`).
+    """
+    __slots__ = (
+        "_client",
+        "complete",
+        "_data_model",
+        "_hydrated",
+        "_loaded_fields",
+        "__weakref__",
+    )
+
     model = None
 
-    def __init__(self, client, data={}, complete=True):
+    _hydrators = {}
+    """Functions building the nested models of a field from its response data, applied on the first access of the field"""
+    _expandable = {}
+    """Field the placeholder models of an `expand` option of list calls come from, and a function returning them"""
+
+    lazy_reloads = Counter()
+    """Number of reloads caused by accessing a field an incomplete model was not created with, per model class name"""
+
+    @staticmethod
+    def _identity_map_of(client, data):
+        # type: (ClientEntityBase, Optional[dict]) -> Optional[IdentityMap]
+        identity_map = getattr(getattr(client, "_client", None), "_identity_map", None)
+        if isinstance(identity_map, IdentityMap) and data and data.get("id") is not None:
+            return identity_map
+        return None
+
+    def __new__(cls, client, *args, **kwargs):
+        data = args[0] if args else kwargs.get("data")
+        identity_map = cls._identity_map_of(client, data)
+        if identity_map is None:
+            return super(BoundModelBase, cls).__new__(cls)
+
+        def create():
+            model = super(BoundModelBase, cls).__new__(cls)
+            model._init(client, *args, **kwargs)
+            return model
+
+        # built or updated under the lock of the identity map, __init__ leaves the model as it is
+        return identity_map.get_or_create(cls, data["id"], create, lambda model: model._update(client, *args, **kwargs))
+
+    def __init__(self, client, data=None, complete=True, fields=None):
         """
         :param client:
                 The client for the specific model to use
         :param data:
-                The data of the model
+                The data of the model, which is only read and can be shared with other models
         :param complete: bool
                 False if not all attributes of the model fetched
+        :param fields: List[str] (optional)
+                Fields of the data to build the model with, the model is incomplete and loads other fields on their first access
         """
+        if self._identity_map_of(client, data) is None:
+            self._init(client, data, complete, fields)
+
+    def _init(self, client, data=None, complete=True, fields=None):
         self._client = client
+        self._hydrated = ()
+        if fields is not None:
+            self.complete = False
+            self._loaded_fields = _projection(self.model, fields)
+            self._data_model = self.model.from_projection(data, self._loaded_fields)
+            return
+        if data is None:
+            data = {}
         self.complete = complete
-        self.data_model = self.model.from_dict(data)
+        self._data_model = self.model.from_dict(data)
+        if complete:
+            self._loaded_fields = ()
+        else:
+            # placeholders are mostly created with the same keys, e.g. just the id
+            loaded_fields = frozenset(data)
+            self._loaded_fields = _loaded_field_sets.setdefault(loaded_fields, loaded_fields)
+
+    def _update(self, client, data=None, complete=True, fields=None):
+        """Rebuilds a model shared through the identity map, unless a placeholder would replace the fetched data"""
+        if (complete and fields is None) or not self.complete:
+            self._init(client, data, complete, fields)
+
+    @classmethod
+    def _shared(cls, client, data):
+        # type: (ClientEntityBase, dict) -> BoundModelBase
+        """Returns the bound model of embedded response data, e.g. the datacenter of a server
+
+        Response data of catalog objects is shared within a response page (see
+        :data:`shared_values <hcloud.core.domain.shared_values>`), models embedding the same data get the same
+        bound model of it from the resource client.
+        """
+        if data is None:
+            return None
+        shared_models = client.__dict__.get("_shared_models")
+        if shared_models is None or "id" not in data:
+            return cls(client, data)
+        key = (cls, data["id"])
+        shared = shared_models.get(key)
+        if shared is not None and shared[0] is data:
+            return shared[1]
+        if len(shared_models) >= client.max_shared_models:
+            shared_models.clear()
+        model = cls(client, data)
+        shared_models[key] = (data, model)
+        return model
 
     def __getattr__(self, name):
         """Allow magical access to the properties of the model
         :param name: str
         :return:
         """
-        value = getattr(self.data_model, name)
-        if not value and not self.complete:
+        if name == "_data_model":
+            # not initialized yet
+            raise AttributeError(name)
+        value = getattr(self._data_model, name)
+        if not self.complete and name not in self._loaded_fields:
+            with _lazy_reloads_lock:
+                self.lazy_reloads[self.__class__.__name__] += 1
             self.reload()
-            value = getattr(self.data_model, name)
+            value = getattr(self._data_model, name)
+        if name in self._hydrators and name not in self._hydrated:
+            value = self._hydrators[name](self, value)
+            setattr(self._data_model, name, value)
+            self._hydrated += (name,)
         return value
 
+    @property
+    def data_model(self):
+        """The domain model holding the data of the bound model
+
+        Nested models (e.g. the datacenter of a server) are built from the response data on their first access,
+        reading the domain model builds the ones which were not accessed yet.
+        """
+        hydrated = self._hydrated
+        if len(hydrated) < len(self._hydrators):
+            for name in self._hydrators:
+                if name not in hydrated and (self.complete or name in self._loaded_fields):
+                    getattr(self, name)
+        return self._data_model
+
+    @data_model.setter
+    def data_model(self, data_model):
+        self._data_model = data_model
+
     def reload(self):
         """Reloads the model and tries to get all data from the APIx
         """
-        bound_model = self._client.get_by_id(self.data_model.id)
-        self.data_model = bound_model.data_model
+        bound_model = self._client.get_by_id(self._data_model.id)
+        self._data_model = bound_model._data_model
+        self._hydrated = bound_model._hydrated
+        self._loaded_fields = ()
+        self.complete = True
+
+    def _fill(self, data):
+        """Completes the model with the response data of a list call"""
+        self._data_model = self.model.from_dict(data)
+        self._hydrated = ()
+        self._loaded_fields = ()
         self.complete = True
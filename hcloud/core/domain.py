@@ -1,14 +1,169 @@
 # -*- coding: utf-8 -*-
+import re
+import threading
 from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    from sys import intern
+except ImportError:  # Python 2, where intern is a builtin
+    pass
+
+from dateutil.parser import isoparse
+from dateutil.tz import tzoffset, tzutc
+
+
+class SharedValues(threading.local):
+    """Hands out one instance of equal response data within a scope, e.g. of the datacenter every server of a page embeds
+
+    List calls open a scope per response page with :meth:`scope`, outside of a scope values are returned as
+    they are. Within one response, data of the same kind and id is equal, so it is shared without comparing
+    it; data without an id is shared only if it is equal. Scopes belong to the thread which opened them.
+    Shared data must not be modified.
+    """
+
+    def __init__(self):
+        self._values = None
+
+    @contextmanager
+    def scope(self):
+        """Shares the values handed to :meth:`share` until the scope is left, nested scopes share with the outer one"""
+        if self._values is not None:
+            yield
+            return
+        self._values = {}
+        try:
+            yield
+        finally:
+            self._values = None
+
+    def share(self, kind, value):
+        # type: (str, dict) -> dict
+        values = self._values
+        if values is None or not isinstance(value, dict):
+            return value
+        id = value.get("id")
+        known = values.get((kind, id))
+        if known is None:
+            values[(kind, id)] = value
+            return value
+        if id is not None or known == value:
+            return known
+        return value
+
+
+shared_values = SharedValues()
+
+
+def intern_strings(value):
+    """Interns a string or the string keys and values of a dict, e.g. of labels
+
+    :param value: str, dict or any other value, which is returned as it is
+    """
+    if isinstance(value, str):
+        return intern(value)
+    if isinstance(value, dict):
+        return {intern(k) if isinstance(k, str) else k: intern(v) if isinstance(v, str) else v
+                for k, v in value.items()}
+    return value
 
 
 class BaseDomain(object):
     __slots__ = ()
 
+    @classmethod
+    def _fields(cls):
+        # type: () -> frozenset
+        """Returns the keys :meth:`from_dict` passes on to the constructor, computed once per class"""
+        fields = cls.__dict__.get("_field_set")
+        if fields is None:
+            fields = cls._field_set = frozenset(
+                name for klass in cls.__mro__ for name in klass.__dict__.get("__slots__", ())
+            )
+        return fields
+
     @classmethod
     def from_dict(cls, data):
-        supported_data = {k: v for k, v in data.items() if k in cls.__slots__}
-        return cls(**supported_data)
+        try:
+            fields = cls.__dict__["_field_set"]
+        except KeyError:
+            fields = cls._fields()
+        return cls(**{k: v for k, v in data.items() if k in fields})
+
+    @classmethod
+    def from_projection(cls, data, fields):
+        """Builds the domain from the given fields of the response data only, the id is always read
+
+        :param data: Dict
+        :param fields: Set[str]
+        """
+        return cls.from_dict({name: data[name] for name in fields if name in data})
+
+
+_ISO_DATETIME = re.compile(r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:\d{2})\Z")
+_timezones = {"Z": tzutc(), "+00:00": tzutc(), "-00:00": tzutc()}
+
+
+def parse_iso_datetime(value):
+    # type: (str) -> datetime
+    """Parses an ISO 8601 timestamp
+
+    Timestamps in the format used by the API (e.g. ``2016-01-30T23:50:00+00:00``) are parsed directly,
+    everything else is handed to :func:`dateutil.parser.isoparse`.
+
+    :param value: str
+    :return: datetime
+    """
+    match = _ISO_DATETIME.match(value)
+    if match is None:
+        return isoparse(value)
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    timezone = _timezones.get(offset)
+    if timezone is None:
+        seconds = (int(offset[1:3]) * 60 + int(offset[4:6])) * 60
+        timezone = _timezones[offset] = tzoffset(None, -seconds if offset[0] == "-" else seconds)
+    try:
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                        int(fraction.ljust(6, "0")) if fraction else 0, timezone)
+    except ValueError:
+        return isoparse(value)
+
+
+class LazyISODateTime(object):
+    """Descriptor wrapping the slot of a domain field which holds an ISO 8601 timestamp
+
+    The raw string is kept in the slot and parsed on the first access, the result replaces it.
+    """
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = self.slot.__get__(instance, owner)
+        if value is None or isinstance(value, datetime):
+            return value
+        value = parse_iso_datetime(value) if value else None
+        self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+
+def lazy_iso_datetimes(*names):
+    """Class decorator parsing the timestamps in the given slots of a domain lazily
+
+    :param names: str
+           Names of the slots holding ISO 8601 timestamps
+    """
+    def decorate(cls):
+        for name in names:
+            setattr(cls, name, LazyISODateTime(cls.__dict__[name]))
+        return cls
+    return decorate
 
 
 class DomainIdentityMixin(object):
@@ -57,21 +212,58 @@ class Meta(BaseDomain):
 
     @classmethod
     def parse_meta(cls, json_content):
-        meta = None
-        if json_content and "meta" in json_content:
-            meta = cls()
-            pagination_json = json_content['meta'].get("pagination")
-            if pagination_json:
-                pagination = Pagination(**pagination_json)
-                meta.pagination = pagination
-        return meta
+        if not json_content:
+            return None
+        meta_json = json_content.get("meta")
+        if meta_json is None:
+            return None
+        pagination_json = meta_json.get("pagination")
+        return cls(Pagination(**pagination_json) if pagination_json else None)
+
+
+class PaginationCursor(BaseDomain):
+    """Pagination Cursor Domain
+
+    Position of a paginated listing, used to resume it after an error or in another process.
+
+    :param params: dict
+           Filter parameters of the listing
+    :param per_page: int
+           Number of entries per page the listing was fetched with
+    :param completed_page: int
+           Last page whose entries were completely handed to the caller (0 if none)
+    """
+    __slots__ = (
+        "params",
+        "per_page",
+        "completed_page",
+    )
+
+    def __init__(self, params, per_page, completed_page=0):
+        self.params = params
+        self.per_page = per_page
+        self.completed_page = completed_page
+
+    @property
+    def next_page(self):
+        return self.completed_page + 1
+
+    def to_dict(self):
+        """Returns the cursor as a JSON serializable dict, :meth:`from_dict` restores it"""
+        return {
+            "params": dict(self.params),
+            "per_page": self.per_page,
+            "completed_page": self.completed_page,
+        }
+
+
+_page_results_classes = {}
 
 
 def add_meta_to_result(result, json_content, attr_name):
     # type: (List[BoundModelBase], json, string) -> PageResult
-    class_name = 'PageResults{0}'.format(attr_name.capitalize())
-    PageResults = namedtuple(class_name, [attr_name, 'meta'])
-    return PageResults(**{
-        attr_name: result,
-        'meta': Meta.parse_meta(json_content)
-    })
+    PageResults = _page_results_classes.get(attr_name)
+    if PageResults is None:
+        class_name = 'PageResults{0}'.format(attr_name.capitalize())
+        PageResults = _page_results_classes[attr_name] = namedtuple(class_name, [attr_name, 'meta'])
+    return PageResults(result, Meta.parse_meta(json_content))
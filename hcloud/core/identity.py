@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import threading
+import weakref
+from collections import OrderedDict
+
+
+class IdentityMap(object):
+    """Resolves every resource id to one shared bound model per :class:`Client <hcloud.Client>`
+
+    Bound models are held by weak references, so they disappear as soon as the caller drops them.
+
+    :param max_size: int (optional)
+           Keep the `max_size` most recently resolved models alive even when nothing else references them,
+           e.g. to share datacenters and server types between listings (default is None, only weak references)
+    """
+
+    def __init__(self, max_size=None):
+        self.max_size = max_size
+        self._models = weakref.WeakValueDictionary()
+        self._recent = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, model_class, id):
+        # type: (type, int) -> Optional[BoundModelBase]
+        """Returns the bound model of the given class and id if it is still alive, otherwise None"""
+        with self._lock:
+            model = self._models.get((model_class, id))
+            if model is not None:
+                self._touch((model_class, id), model)
+            return model
+
+    def get_or_create(self, model_class, id, factory, update=None):
+        # type: (type, int, Callable[[], BoundModelBase], Optional[Callable[[BoundModelBase], None]]) -> BoundModelBase
+        """Returns the bound model of the given class and id, `factory` creates it if there is none
+
+        Both `factory` and `update`, which is applied to an existing model, run under the lock of the map, so
+        other threads only get models which are completely built and never see two updates interleave.
+        """
+        with self._lock:
+            model = self._models.get((model_class, id))
+            if model is None:
+                model = factory()
+                self._models[(model_class, id)] = model
+            elif update is not None:
+                update(model)
+            self._touch((model_class, id), model)
+            return model
+
+    def _touch(self, key, model):
+        if not self.max_size:
+            return
+        self._recent.pop(key, None)
+        self._recent[key] = model
+        while len(self._recent) > self.max_size:
+            self._recent.popitem(last=False)
+
+    def clear(self):
+        """Forgets all bound models"""
+        with self._lock:
+            self._models.clear()
+            self._recent.clear()
+
+    def __len__(self):
+        return len(self._models)
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+import copy
+
+from hcloud.core.domain import PaginationCursor
+
+
+class LabelPredicate(object):
+    """A single requirement of a label selector
+
+    :param operator: str
+           One of `exists`, `missing`, `equals`, `not_equals`, `in`, `not_in`
+    :param key: str
+           Label key the requirement applies to
+    :param values: List[str]
+           Values the operator compares against (empty for `exists` and `missing`)
+    """
+    __slots__ = (
+        "operator",
+        "key",
+        "values",
+    )
+
+    def __init__(self, operator, key, values=()):
+        self.operator = operator
+        self.key = key
+        self.values = tuple(values)
+
+    def to_selector(self):
+        # type: () -> str
+        """Returns the requirement in the label selector syntax of the API"""
+        if self.operator == "exists":
+            return self.key
+        if self.operator == "missing":
+            return "!{key}".format(key=self.key)
+        if self.operator == "equals":
+            return "{key}={value}".format(key=self.key, value=self.values[0])
+        if self.operator == "not_equals":
+            return "{key}!={value}".format(key=self.key, value=self.values[0])
+        keyword = "in" if self.operator == "in" else "notin"
+        return "{key} {keyword} ({values})".format(key=self.key, keyword=keyword, values=",".join(self.values))
+
+    def matches(self, labels):
+        # type: (Optional[Dict[str, str]]) -> bool
+        """Evaluates the requirement against the labels of an entity"""
+        labels = labels or {}
+        if self.operator == "exists":
+            return self.key in labels
+        if self.operator == "missing":
+            return self.key not in labels
+        if self.operator in ("equals", "in"):
+            return self.key in labels and labels[self.key] in self.values
+        return labels.get(self.key) not in self.values
+
+
+class Query(object):
+    """Fluent query over the entries of a resource client
+
+    Filters the API understands (see ``query_params`` of the client) are sent with the list requests,
+    everything else is applied to the entries while the pages stream in. Iteration stops requesting pages
+    as soon as :meth:`limit` is satisfied. Every method returns a new query, so partial queries can be reused.
+
+    :param client: :class:`ClientEntityBase <hcloud.core.client.ClientEntityBase>`
+    """
+    # API parameters which take a list of values, a single value is wrapped
+    list_params = ("status", "type", "bound_to")
+
+    def __init__(self, client):
+        self._client = client
+        self._params = {}
+        self._fields = {}
+        self._labels = []
+        self._predicates = []
+        self._sort = []
+        self._limit = None
+
+    def _clone(self):
+        query = copy.copy(self)
+        query._params = dict(self._params)
+        query._fields = dict(self._fields)
+        query._labels = list(self._labels)
+        query._predicates = list(self._predicates)
+        query._sort = list(self._sort)
+        return query
+
+    def _supports(self, param):
+        return param in self._client.query_params
+
+    def filter(self, **fields):
+        # type: (...) -> Query
+        """Only entries whose attributes equal the given values. A list, tuple or set matches any of its values.
+
+        :return: :class:`Query <hcloud.core.query.Query>`
+        """
+        query = self._clone()
+        for field, value in fields.items():
+            many = isinstance(value, (list, tuple, set))
+            if self._supports(field) and field in self.list_params:
+                query._params[field] = list(value) if many else [value]
+            elif self._supports(field) and not many:
+                query._params[field] = value
+            else:
+                query._fields[field] = value
+        return query
+
+    def with_label(self, key, value=None):
+        # type: (str, Optional[str]) -> Query
+        """Only entries which have the label `key` (with the given `value` if specified)
+
+        :return: :class:`Query <hcloud.core.query.Query>`
+        """
+        if value is None:
+            return self._with_label_predicate(LabelPredicate("exists", key))
+        return self._with_label_predicate(LabelPredicate("equals", key, [value]))
+
+    def without_label(self, key, value=None):
+        # type: (str, Optional[str]) -> Query
+        """Only entries which do not have the label `key` (or whose label `key` differs from `value` if specified)
+
+        :return: :class:`Query <hcloud.core.query.Query>`
+        """
+        if value is None:
+            return self._with_label_predicate(LabelPredicate("missing", key))
+        return self._with_label_predicate(LabelPredicate("not_equals", key, [value]))
+
+    def label_in(self, key, values):
+        # type: (str, List[str]) -> Query
+        """Only entries whose label `key` has one of the given values
+
+        :return: :class:`Query <hcloud.core.query.Query>`
+        """
+        return self._with_label_predicate(LabelPredicate("in", key, values))
+
+    def label_not_in(self, key, values):
+        # type: (str, List[str]) -> Query
+        """Only entries whose label `key` is missing or has none of the given values
+
+        :return: :class:`Query <hcloud.core.query.Query>`
+        """
+        return self._with_label_predicate(LabelPredicate("not_in", key, values))
+
+    def _with_label_predicate(self, predicate):
+        query = self._clone()
+        query._labels.append(predicate)
+        return query
+
+    def where(self, predicate):
+        # type: (Callable[[BoundModelBase], bool]) -> Query
+        """Only entries for which `predicate` returns True, always evaluated client-side
+
+        :return: :class:`Query <hcloud.core.query.Query>`
+        """
+        query = self._clone()
+        query._predicates.append(predicate)
+        return query
+
+    def order_by(self, *sort):
+        # type: (*str) -> Query
+        """Sort the entries, e.g. ``order_by("created:desc", "id")``. Sorting is done by the API if the client supports it,
+        otherwise all matching entries are fetched and sorted locally.
+
+        :return: :class:`Query <hcloud.core.query.Query>`
+        """
+        query = self._clone()
+        query._sort.extend(sort)
+        return query
+
+    def limit(self, limit):
+        # type: (int) -> Query
+        """Stop after `limit` matching entries
+
+        :return: :class:`Query <hcloud.core.query.Query>`
+        """
+        query = self._clone()
+        query._limit = limit
+        return query
+
+    @property
+    def params(self):
+        # type: () -> Dict
+        """The parameters the list requests of this query are sent with"""
+        params = dict(self._params)
+        if self._labels and self._supports("label_selector"):
+            params["label_selector"] = ",".join(predicate.to_selector() for predicate in self._labels)
+        if self._sort and self._supports("sort"):
+            params["sort"] = list(self._sort)
+        return params
+
+    def _matches(self, entity):
+        for field, value in self._fields.items():
+            actual = getattr(entity, field)
+            if isinstance(value, (list, tuple, set)):
+                if actual not in value:
+                    return False
+            elif actual != value:
+                return False
+        if not self._supports("label_selector"):
+            labels = getattr(entity, "labels", None)
+            for predicate in self._labels:
+                if not predicate.matches(labels):
+                    return False
+        for predicate in self._predicates:
+            if not predicate(entity):
+                return False
+        return True
+
+    def _sort_locally(self, entities):
+        for sort in reversed(self._sort):
+            field, _, direction = sort.partition(":")
+            # entries without a value are sorted last, regardless of the direction
+            present = [entity for entity in entities if getattr(entity, field) is not None]
+            missing = [entity for entity in entities if getattr(entity, field) is None]
+            present.sort(key=lambda entity: getattr(entity, field), reverse=direction == "desc")
+            entities = present + missing
+        return entities
+
+    def __iter__(self):
+        # type: () -> Iterator[BoundModelBase]
+        if self._sort and not self._supports("sort"):
+            entities = self._sort_locally([entity for entity in self._iter_matching(self._client.max_per_page)])
+            return iter(entities[:self._limit] if self._limit is not None else entities)
+        return self._iter_limited()
+
+    def _iter_matching(self, per_page):
+        cursor = PaginationCursor(params=self.params, per_page=per_page)
+        entities = self._client._iter_all(self._client.get_list, self._client.results_list_attribute_name, resume_from=cursor)
+        try:
+            for entity in entities:
+                if self._matches(entity):
+                    yield entity
+        finally:
+            entities.close()
+
+    def _iter_limited(self):
+        if self._limit is not None and self._limit <= 0:
+            return
+        per_page = self._client.max_per_page
+        if self._limit is not None and not self._fields and not self._predicates and \
+                (self._supports("label_selector") or not self._labels):
+            # every entry of the response is a match, so there is no need to fetch more than requested
+            per_page = min(per_page, self._limit)
+
+        count = 0
+        entities = self._iter_matching(per_page)
+        try:
+            for entity in entities:
+                yield entity
+                count += 1
+                if self._limit is not None and count >= self._limit:
+                    return
+        finally:
+            entities.close()
+
+    def all(self):
+        # type: () -> List[BoundModelBase]
+        """Returns all matching entries
+
+        :return: List[:class:`BoundModelBase <hcloud.core.client.BoundModelBase>`]
+        """
+        return list(self)
+
+    def first(self):
+        # type: () -> Optional[BoundModelBase]
+        """Returns the first matching entry or None, fetching only as many pages as needed
+
+        :return: :class:`BoundModelBase <hcloud.core.client.BoundModelBase>`, None
+        """
+        for entity in self.limit(1):
+            return entity
+        return None
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+
+class RateLimiter(object):
+    """Token bucket which spreads requests of concurrent workers over time
+
+    A single instance can be shared by several calls (and threads) to keep them within one request budget.
+
+    :param requests_per_second: float
+           Sustained number of requests allowed per second
+    :param burst: int
+           Number of requests which may be sent at once after the limiter was idle (default is 1)
+    """
+
+    def __init__(self, requests_per_second, burst=1):
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0")
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until the budget allows another request"""
+        while True:
+            with self._lock:
+                now = time.time()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.requests_per_second)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.requests_per_second
+            time.sleep(wait)
+
+    def wrap(self, function):
+        """Returns `function` acquiring a token before every call"""
+        def limited(*args, **kwargs):
+            self.acquire()
+            return function(*args, **kwargs)
+        return limited
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+import json
+from datetime import datetime
+
+from hcloud.core.client import BoundModelBase
+from hcloud.core.domain import BaseDomain, LazyISODateTime, parse_iso_datetime
+
+FORMAT_VERSION = 1
+"""Version of the format written by :func:`dumps`, :func:`loads` rejects data of other versions"""
+
+_BOUND = "#b"
+_REFERENCE = "#r"
+_DOMAIN = "#d"
+_DATETIME = "#t"
+_MAPPING = "#m"
+_TAGS = frozenset([_BOUND, _REFERENCE, _DOMAIN, _DATETIME, _MAPPING])
+
+_RESOURCES = (
+    ("hcloud.actions.client", "BoundAction", "actions"),
+    ("hcloud.datacenters.client", "BoundDatacenter", "datacenters"),
+    ("hcloud.floating_ips.client", "BoundFloatingIP", "floating_ips"),
+    ("hcloud.images.client", "BoundImage", "images"),
+    ("hcloud.isos.client", "BoundIso", "isos"),
+    ("hcloud.locations.client", "BoundLocation", "locations"),
+    ("hcloud.networks.client", "BoundNetwork", "networks"),
+    ("hcloud.server_types.client", "BoundServerType", "server_types"),
+    ("hcloud.servers.client", "BoundServer", "servers"),
+    ("hcloud.ssh_keys.client", "BoundSSHKey", "ssh_keys"),
+    ("hcloud.volumes.client", "BoundVolume", "volumes"),
+)
+"""Bound model classes with the attribute of :class:`Client <hcloud.Client>` holding their resource client"""
+
+_registry = {}
+
+
+def _bound_model_classes():
+    if not _registry:
+        import importlib
+
+        for module, name, resource in _RESOURCES:
+            _registry[name] = (getattr(importlib.import_module(module), name), resource)
+    return _registry
+
+
+def _domain_classes(cls=BaseDomain, classes=None):
+    classes = {} if classes is None else classes
+    for subclass in cls.__subclasses__():
+        classes[subclass.__name__] = subclass
+        _domain_classes(subclass, classes)
+    return classes
+
+
+def _field_names(cls):
+    names = []
+    for klass in reversed(cls.__mro__):
+        for name in klass.__dict__.get("__slots__", ()):
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def _raw_value(domain, name):
+    """Returns the value of a domain field without parsing lazy timestamps"""
+    descriptor = getattr(type(domain), name, None)
+    if isinstance(descriptor, LazyISODateTime):
+        return descriptor.slot.__get__(domain, type(domain))
+    return getattr(domain, name, None)
+
+
+class _Encoder(object):
+    def __init__(self):
+        self.schema = {}
+
+    def fields(self, cls):
+        name = cls.__name__
+        if name not in self.schema:
+            self.schema[name] = _field_names(cls)
+        return name, self.schema[name]
+
+    def encode(self, value, nested):
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, (list, tuple)):
+            return [self.encode(item, nested) for item in value]
+        if isinstance(value, dict):
+            encoded = dict((key, self.encode(item, nested)) for key, item in value.items())
+            if len(encoded) == 1 and next(iter(encoded)) in _TAGS:
+                return {_MAPPING: encoded}
+            return encoded
+        if isinstance(value, datetime):
+            return {_DATETIME: value.isoformat()}
+        if isinstance(value, BoundModelBase):
+            if nested:
+                return {_REFERENCE: [value.__class__.__name__, value._data_model.id]}
+            return self.encode_bound_model(value)
+        if isinstance(value, BaseDomain):
+            name, fields = self.fields(type(value))
+            return {_DOMAIN: [name, [self.encode(_raw_value(value, field), True) for field in fields]]}
+        try:
+            # e.g. unicode strings and longs on Python 2
+            json.dumps(value)
+        except TypeError:
+            raise TypeError("{type} can not be serialized".format(type=type(value).__name__))
+        return value
+
+    def encode_bound_model(self, bound_model):
+        if bound_model.__class__.__name__ not in _bound_model_classes():
+            raise TypeError("{type} can not be serialized".format(type=type(bound_model).__name__))
+        for name in bound_model._hydrators:
+            # nested data is stored as references, so build the nested models first
+            if bound_model.complete or name in bound_model._loaded_fields:
+                getattr(bound_model, name)
+        data_model = bound_model._data_model
+        name, fields = self.fields(type(data_model))
+        return {_BOUND: [
+            bound_model.__class__.__name__,
+            name,
+            bound_model.complete,
+            sorted(bound_model._loaded_fields),
+            [self.encode(_raw_value(data_model, field), True) for field in fields],
+        ]}
+
+
+class _Decoder(object):
+    def __init__(self, client, schema):
+        self.client = client
+        self.schema = schema
+        self.domain_classes = _domain_classes()
+        self.bound_model_classes = _bound_model_classes()
+
+    def decode(self, value):
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if len(value) == 1:
+            tag, content = next(iter(value.items()))
+            if tag == _REFERENCE:
+                bound_model_class, resource = self.bound_model_classes[content[0]]
+                return bound_model_class(getattr(self.client, resource), {"id": content[1]}, complete=False)
+            if tag == _BOUND:
+                return self.decode_bound_model(*content)
+            if tag == _DOMAIN:
+                return self.decode_domain(*content)
+            if tag == _DATETIME:
+                return parse_iso_datetime(content)
+            if tag == _MAPPING:
+                value = content
+        return dict((key, self.decode(item)) for key, item in value.items())
+
+    def decode_domain(self, name, values):
+        cls = self.domain_classes[name]
+        domain = cls.__new__(cls)
+        known = cls._fields()
+        for field in known:
+            setattr(domain, field, None)
+        for field, value in zip(self.schema[name], values):
+            if field in known:
+                setattr(domain, field, self.decode(value))
+        return domain
+
+    def decode_bound_model(self, bound_model_name, name, complete, loaded_fields, values):
+        bound_model_class, resource = self.bound_model_classes[bound_model_name]
+        client = getattr(self.client, resource)
+        data_model = self.decode_domain(name, values)
+
+        def build(bound_model=None):
+            if bound_model is None:
+                bound_model = object.__new__(bound_model_class)
+            elif bound_model.complete and not complete:
+                # shared through the identity map, keep the fetched data
+                return bound_model
+            bound_model._client = client
+            bound_model.complete = complete
+            bound_model._data_model = data_model
+            bound_model._hydrated = tuple(bound_model._hydrators)
+            bound_model._loaded_fields = () if complete else frozenset(loaded_fields)
+            return bound_model
+
+        identity_map = bound_model_class._identity_map_of(client, {"id": data_model.id})
+        if identity_map is None:
+            return build()
+        return identity_map.get_or_create(bound_model_class, data_model.id, build, build)
+
+
+def dumps(value):
+    # type: (Any) -> bytes
+    """Serializes bound models, domain models and lists or dicts of them
+
+    The client of bound models is left out, models they refer to (e.g. the datacenter of a server) are stored by
+    their id and loaded as incomplete models, which :meth:`Client.resolve <hcloud.Client.resolve>` completes in
+    batches. Field names are written once per model type instead of once per object.
+
+    :param value: :class:`BoundModelBase <hcloud.core.client.BoundModelBase>`, :class:`BaseDomain <hcloud.core.domain.BaseDomain>` or a list or dict of them
+    :return: bytes
+    """
+    encoder = _Encoder()
+    root = encoder.encode(value, False)
+    return json.dumps([FORMAT_VERSION, encoder.schema, root], separators=(",", ":")).encode("utf-8")
+
+
+def loads(data, client):
+    # type: (bytes, Client) -> Any
+    """Restores values serialized by :func:`dumps`, attaching the bound models to the given client
+
+    :param data: bytes
+    :param client: :class:`Client <hcloud.Client>`
+    :return: the serialized value
+    """
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    version, schema, root = json.loads(data)
+    if version != FORMAT_VERSION:
+        raise ValueError("unsupported serialization format version {version}".format(version=version))
+    return _Decoder(client, schema).decode(root)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from hcloud.core.client import ClientEntityBase, BoundModelBase, GetEntityByNameMixin
+from hcloud.core.domain import shared_values
 
 from hcloud.datacenters.domain import Datacenter, DatacenterServerTypes
 from hcloud.locations.client import BoundLocation
@@ -7,44 +8,73 @@ from hcloud.server_types.client import BoundServerType
 
 
 class BoundDatacenter(BoundModelBase):
+    __slots__ = ()
     model = Datacenter
 
-    def __init__(self, client, data):
-        location = data.get("location")
-        if location is not None:
-            data['location'] = BoundLocation(client._client.locations, location)
-
-        server_types = data.get("server_types")
-        if server_types is not None:
-            available = [BoundServerType(client._client.server_types, {"id": server_type}, complete=False) for
-                         server_type in server_types['available']]
-            supported = [BoundServerType(client._client.server_types, {"id": server_type}, complete=False) for
-                         server_type in server_types['supported']]
-            available_for_migration = [BoundServerType(client._client.server_types, {"id": server_type}, complete=False)
-                                       for server_type in server_types['available_for_migration']]
-            data['server_types'] = DatacenterServerTypes(available=available, supported=supported,
-                                                         available_for_migration=available_for_migration)
-
-        super(BoundDatacenter, self).__init__(client, data)
+    def _hydrate_location(self, location):
+        if location is None:
+            return None
+        return BoundLocation._shared(self._client._client.locations, location)
+
+    def _hydrate_server_types(self, server_types):
+        if server_types is None:
+            return None
+        server_types_client = self._client._client.server_types
+        available = [BoundServerType(server_types_client, {"id": server_type}, complete=False) for
+                     server_type in server_types['available']]
+        supported = [BoundServerType(server_types_client, {"id": server_type}, complete=False) for
+                     server_type in server_types['supported']]
+        available_for_migration = [BoundServerType(server_types_client, {"id": server_type}, complete=False)
+                                   for server_type in server_types['available_for_migration']]
+        return DatacenterServerTypes(available=available, supported=supported,
+                                     available_for_migration=available_for_migration)
+
+    _hydrators = {
+        "location": _hydrate_location,
+        "server_types": _hydrate_server_types,
+    }
+
+    def _server_type_placeholders(self):
+        server_types = self.server_types
+        if server_types is None:
+            return []
+        return server_types.available + server_types.supported + server_types.available_for_migration
+
+    _expandable = {
+        "server_types": ("server_types", _server_type_placeholders),
+    }
 
 
 class DatacentersClient(ClientEntityBase, GetEntityByNameMixin):
     results_list_attribute_name = 'datacenters'
+    query_params = ('name',)
+    catalog_filters = {}
 
-    def get_by_id(self, id):
-        # type: (int) -> BoundDatacenter
+    def get_by_id(self, id, raw=False, fields=None):
+        # type: (int, bool, Optional[List[str]]) -> BoundDatacenter
         """Get a specific datacenter by its ID.
 
         :param id: int
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundDatacenter <hcloud.datacenters.client.BoundDatacenter>`
         """
-        response = self._client.request(url="/datacenters/{datacenter_id}".format(datacenter_id=id), method="GET")
-        return BoundDatacenter(self, response['datacenter'])
+        datacenter = self._from_catalog("id", id)
+        if datacenter is None:
+            datacenter = self._client.request(url="/datacenters/{datacenter_id}".format(datacenter_id=id), method="GET")['datacenter']
+        if raw:
+            return datacenter
+        return BoundDatacenter(self, datacenter, fields=fields)
 
     def get_list(self,
                  name=None,  # type: Optional[str]
                  page=None,  # type: Optional[int]
-                 per_page=None  # type: Optional[int]
+                 per_page=None,  # type: Optional[int]
+                 raw=False,  # type: bool
+                 expand=None,  # type: Optional[List[str]]
+                 fields=None,  # type: Optional[List[str]]
                  ):
         # type: (...) -> PageResults[List[BoundDatacenter], Meta]
         """Get a list of datacenters
@@ -55,6 +85,12 @@ class DatacentersClient(ClientEntityBase, GetEntityByNameMixin):
                Specifies the page to fetch
         :param per_page: int (optional)
                Specifies how many results are returned by page
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param expand: List[str] (optional)
+               Fields whose placeholder models are completed with one list call per resource type. Choices: server_types
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: (List[:class:`BoundDatacenter <hcloud.datacenters.client.BoundDatacenter>`], :class:`Meta <hcloud.core.domain.Meta>`)
         """
         params = {}
@@ -68,27 +104,59 @@ class DatacentersClient(ClientEntityBase, GetEntityByNameMixin):
             params['per_page'] = per_page
 
         response = self._client.request(url="/datacenters", method="GET", params=params)
+        if raw:
+            return self._add_meta_to_result(response['datacenters'], response)
 
-        datacenters = [BoundDatacenter(self, datacenter_data) for datacenter_data in response['datacenters']]
+        with shared_values.scope():
+            datacenters = [BoundDatacenter(self, datacenter_data, fields=fields) for datacenter_data in response['datacenters']]
 
+        self._expand(datacenters, expand)
         return self._add_meta_to_result(datacenters, response)
 
-    def get_all(self, name=None):
-        # type: (Optional[str]) -> List[BoundDatacenter]
+    def get_all(self, name=None, resume_from=None, raw=False, expand=None, fields=None):
+        # type: (Optional[str], Optional[PaginationCursor], bool, Optional[List[str]], Optional[List[str]]) -> List[BoundDatacenter]
         """Get all datacenters
 
         :param name: str (optional)
                Can be used to filter datacenters by their name.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param expand: List[str] (optional)
+               Fields whose placeholder models are completed with one list call per resource type. Choices: server_types
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: List[:class:`BoundDatacenter <hcloud.datacenters.client.BoundDatacenter>`]
         """
-        return super(DatacentersClient, self).get_all(name=name)
+        return super(DatacentersClient, self).get_all(name=name, resume_from=resume_from, raw=raw, expand=expand, fields=fields)
+
+    def iter_all(self, name=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[PaginationCursor], bool, Optional[List[str]]) -> PageIterator[BoundDatacenter]
+        """Iterate over all datacenters, fetching the next page only when the current one is exhausted
+
+        :param name: str (optional)
+               Can be used to filter datacenters by their name.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
+        :return: PageIterator[:class:`BoundDatacenter <hcloud.datacenters.client.BoundDatacenter>`]
+        """
+        return super(DatacentersClient, self).iter_all(name=name, resume_from=resume_from, raw=raw, fields=fields)
 
-    def get_by_name(self, name):
-        # type: (str) -> BoundDatacenter
+    def get_by_name(self, name, raw=False, fields=None):
+        # type: (str, bool, Optional[List[str]]) -> BoundDatacenter
         """Get datacenter by name
 
         :param name: str
                Used to get datacenter by name.
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundDatacenter <hcloud.datacenters.client.BoundDatacenter>`
         """
-        return super(DatacentersClient, self).get_by_name(name)
+        return super(DatacentersClient, self).get_by_name(name, raw=raw, fields=fields)
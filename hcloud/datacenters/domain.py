@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from hcloud.core.domain import BaseDomain, DomainIdentityMixin
+from hcloud.core.domain import BaseDomain, DomainIdentityMixin, shared_values
 
 
 class Datacenter(BaseDomain, DomainIdentityMixin):
@@ -11,6 +11,7 @@ class Datacenter(BaseDomain, DomainIdentityMixin):
     :param location: :class:`BoundLocation <hcloud.locations.client.BoundLocation>`
     :param server_types: :class:`DatacenterServerTypes <hcloud.datacenters.domain.DatacenterServerTypes>`
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "id",
         "name",
@@ -25,7 +26,7 @@ class Datacenter(BaseDomain, DomainIdentityMixin):
         name=None,
         description=None,
         location=None,
-        server_types=None
+        server_types=None,
     ):
         self.id = id
         self.name = name
@@ -33,8 +34,31 @@ class Datacenter(BaseDomain, DomainIdentityMixin):
         self.location = location
         self.server_types = server_types
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.name = get("name")
+        domain.description = get("description")
+        domain.location = shared_values.share("locations", get("location"))
+        domain.server_types = get("server_types")
+        return domain
 
-class DatacenterServerTypes:
+    @classmethod
+    def from_projection(cls, data, fields):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.name = get("name") if "name" in fields else None
+        domain.description = get("description") if "description" in fields else None
+        domain.location = shared_values.share("locations", get("location")) if "location" in fields else None
+        domain.server_types = get("server_types") if "server_types" in fields else None
+        return domain
+    # end of generated code
+
+
+class DatacenterServerTypes(BaseDomain):
     """DatacenterServerTypes Domain
 
     :param available: List[:class:`BoundServerTypes <hcloud.server_types.client.BoundServerTypes>`]
@@ -44,13 +68,28 @@ class DatacenterServerTypes:
     :param available_for_migration: List[:class:`BoundServerTypes <hcloud.server_types.client.BoundServerTypes>`]
            All available for migration (change type) server types for this datacenter
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "available",
         "supported",
-        "available_for_migration"
+        "available_for_migration",
     )
 
-    def __init__(self, available, supported, available_for_migration):
+    def __init__(
+        self,
+        available,
+        supported,
+        available_for_migration,
+    ):
         self.available = available
         self.supported = supported
         self.available_for_migration = available_for_migration
+
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        domain.available = data["available"]
+        domain.supported = data["supported"]
+        domain.available_for_migration = data["available_for_migration"]
+        return domain
+    # end of generated code
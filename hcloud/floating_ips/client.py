@@ -1,26 +1,35 @@
 # -*- coding: utf-8 -*-
 from hcloud.actions.client import BoundAction
 from hcloud.core.client import BoundModelBase, ClientEntityBase, GetEntityByNameMixin
-from hcloud.core.domain import add_meta_to_result
+from hcloud.core.domain import add_meta_to_result, shared_values
 
 from hcloud.floating_ips.domain import FloatingIP, CreateFloatingIPResponse
 from hcloud.locations.client import BoundLocation
 
 
 class BoundFloatingIP(BoundModelBase):
+    __slots__ = ()
     model = FloatingIP
 
-    def __init__(self, client, data, complete=True):
+    def _hydrate_server(self, server):
+        if server is None:
+            return None
         from hcloud.servers.client import BoundServer
-        server = data.get("server")
-        if server is not None:
-            data['server'] = BoundServer(client._client.servers, {"id": server}, complete=False)
+        return BoundServer(self._client._client.servers, {"id": server}, complete=False)
 
-        home_location = data.get("home_location")
-        if home_location is not None:
-            data['home_location'] = BoundLocation(client._client.locations, home_location)
+    def _hydrate_home_location(self, home_location):
+        if home_location is None:
+            return None
+        return BoundLocation._shared(self._client._client.locations, home_location)
 
-        super(BoundFloatingIP, self).__init__(client, data, complete)
+    _hydrators = {
+        "server": _hydrate_server,
+        "home_location": _hydrate_home_location,
+    }
+
+    _expandable = {
+        "server": ("server", lambda floating_ip: [floating_ip.server]),
+    }
 
     def get_actions_list(self, status=None, sort=None, page=None, per_page=None):
         # type: (Optional[List[str]], Optional[List[str]], Optional[int], Optional[int]) -> PageResult[BoundAction, Meta]
@@ -38,18 +47,35 @@ class BoundFloatingIP(BoundModelBase):
         """
         return self._client.get_actions_list(self, status, sort, page, per_page)
 
-    def get_actions(self, status=None, sort=None):
-        # type: (Optional[List[str]]) -> List[BoundAction]
+    def get_actions(self, status=None, sort=None, resume_from=None):
+        # type: (Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> List[BoundAction]
         """Returns all action objects for a Floating IP.
 
         :param status: List[str] (optional)
                Response will have only actions with specified statuses. Choices: `running` `success` `error`
         :param sort: List[str] (optional)
                Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
 
         :return: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
         """
-        return self._client.get_actions(self, status, sort)
+        return self._client.get_actions(self, status, sort, resume_from=resume_from)
+
+    def iter_actions(self, status=None, sort=None, resume_from=None):
+        # type: (Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> PageIterator[BoundAction]
+        """Iterate over all action objects for a Floating IP, fetching the next page only when the current one is exhausted.
+
+        :param status: List[str] (optional)
+               Response will have only actions with specified statuses. Choices: `running` `success` `error`
+        :param sort: List[str] (optional)
+               Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+
+        :return: PageIterator[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+        """
+        return self._client.iter_actions(self, status, sort, resume_from=resume_from)
 
     def update(self, description=None, labels=None, name=None):
         # type: (Optional[str], Optional[Dict[str, str]], Optional[str]) -> BoundFloatingIP
@@ -116,6 +142,7 @@ class BoundFloatingIP(BoundModelBase):
 
 class FloatingIPsClient(ClientEntityBase, GetEntityByNameMixin):
     results_list_attribute_name = 'floating_ips'
+    query_params = ('name', 'label_selector')
 
     def get_actions_list(self,
                          floating_ip,  # type: FloatingIP
@@ -157,6 +184,7 @@ class FloatingIPsClient(ClientEntityBase, GetEntityByNameMixin):
                     floating_ip,  # type: FloatingIP
                     status=None,  # type: Optional[List[str]]
                     sort=None,  # type: Optional[List[str]]
+                    resume_from=None,  # type: Optional[PaginationCursor]
                     ):
         # type: (...) -> List[BoundAction]
         """Returns all action objects for a Floating IP.
@@ -166,26 +194,58 @@ class FloatingIPsClient(ClientEntityBase, GetEntityByNameMixin):
                Response will have only actions with specified statuses. Choices: `running` `success` `error`
         :param sort: List[str] (optional)
                Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
 
         :return: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
         """
-        return super(FloatingIPsClient, self).get_actions(floating_ip, status=status, sort=sort)
+        return super(FloatingIPsClient, self).get_actions(floating_ip, status=status, sort=sort, resume_from=resume_from)
+
+    def iter_actions(self,
+                     floating_ip,  # type: FloatingIP
+                     status=None,  # type: Optional[List[str]]
+                     sort=None,  # type: Optional[List[str]]
+                     resume_from=None,  # type: Optional[PaginationCursor]
+                     ):
+        # type: (...) -> PageIterator[BoundAction]
+        """Iterate over all action objects for a Floating IP, fetching the next page only when the current one is exhausted.
+
+        :param floating_ip: :class:`BoundFloatingIP <hcloud.floating_ips.client.BoundFloatingIP>` or  :class:`FloatingIP <hcloud.floating_ips.domain.FloatingIP>`
+        :param status: List[str] (optional)
+               Response will have only actions with specified statuses. Choices: `running` `success` `error`
+        :param sort: List[str] (optional)
+               Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+
+        :return: PageIterator[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+        """
+        return super(FloatingIPsClient, self).iter_actions(floating_ip, status=status, sort=sort, resume_from=resume_from)
 
-    def get_by_id(self, id):
-        # type: (int) -> BoundFloatingIP
+    def get_by_id(self, id, raw=False, fields=None):
+        # type: (int, bool, Optional[List[str]]) -> BoundFloatingIP
         """Returns a specific Floating IP object.
 
         :param id: int
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundFloatingIP <hcloud.floating_ips.client.BoundFloatingIP>`
         """
         response = self._client.request(url="/floating_ips/{floating_ip_id}".format(floating_ip_id=id), method="GET")
-        return BoundFloatingIP(self, response['floating_ip'])
+        if raw:
+            return response['floating_ip']
+        return BoundFloatingIP(self, response['floating_ip'], fields=fields)
 
     def get_list(self,
                  label_selector=None,  # type: Optional[str]
                  page=None,  # type: Optional[int]
                  per_page=None,  # type: Optional[int]
                  name=None,  # type: Optional[str]
+                 raw=False,  # type: bool
+                 expand=None,  # type: Optional[List[str]]
+                 fields=None,  # type: Optional[List[str]]
                  ):
         # type: (...) -> PageResults[List[BoundFloatingIP]]
         """Get a list of floating ips from this account
@@ -198,6 +258,12 @@ class FloatingIPsClient(ClientEntityBase, GetEntityByNameMixin):
                Specifies how many results are returned by page
         :param name: str (optional)
                Can be used to filter networks by their name.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param expand: List[str] (optional)
+               Fields whose placeholder models are completed with one list call per resource type. Choices: server
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: (List[:class:`BoundFloatingIP <hcloud.floating_ips.client.BoundFloatingIP>`], :class:`Meta <hcloud.core.domain.Meta>`)
         """
         params = {}
@@ -212,31 +278,65 @@ class FloatingIPsClient(ClientEntityBase, GetEntityByNameMixin):
             params['name'] = name
 
         response = self._client.request(url="/floating_ips", method="GET", params=params)
-        floating_ips = [BoundFloatingIP(self, floating_ip_data) for floating_ip_data in response['floating_ips']]
+        if raw:
+            return self._add_meta_to_result(response['floating_ips'], response)
+        with shared_values.scope():
+            floating_ips = [BoundFloatingIP(self, floating_ip_data, fields=fields) for floating_ip_data in response['floating_ips']]
 
+        self._expand(floating_ips, expand)
         return self._add_meta_to_result(floating_ips, response)
 
-    def get_all(self, label_selector=None, name=None):
-        # type: (Optional[str], Optional[str]) -> List[BoundFloatingIP]
+    def get_all(self, label_selector=None, name=None, resume_from=None, raw=False, expand=None, fields=None):
+        # type: (Optional[str], Optional[str], Optional[PaginationCursor], bool, Optional[List[str]], Optional[List[str]]) -> List[BoundFloatingIP]
         """Get all floating ips from this account
 
         :param label_selector: str (optional)
                Can be used to filter Floating IPs by labels. The response will only contain Floating IPs matching the label selector.able values.
         :param name: str (optional)
                Can be used to filter networks by their name.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param expand: List[str] (optional)
+               Fields whose placeholder models are completed with one list call per resource type. Choices: server
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: List[:class:`BoundFloatingIP <hcloud.floating_ips.client.BoundFloatingIP>`]
         """
-        return super(FloatingIPsClient, self).get_all(label_selector=label_selector, name=name)
+        return super(FloatingIPsClient, self).get_all(label_selector=label_selector, name=name, resume_from=resume_from, raw=raw, expand=expand, fields=fields)
+
+    def iter_all(self, label_selector=None, name=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[str], Optional[PaginationCursor], bool, Optional[List[str]]) -> PageIterator[BoundFloatingIP]
+        """Iterate over all floating ips from this account, fetching the next page only when the current one is exhausted
+
+        :param label_selector: str (optional)
+               Can be used to filter Floating IPs by labels. The response will only contain Floating IPs matching the label selector.able values.
+        :param name: str (optional)
+               Can be used to filter networks by their name.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
+        :return: PageIterator[:class:`BoundFloatingIP <hcloud.floating_ips.client.BoundFloatingIP>`]
+        """
+        return super(FloatingIPsClient, self).iter_all(label_selector=label_selector, name=name, resume_from=resume_from, raw=raw, fields=fields)
 
-    def get_by_name(self, name):
-        # type: (str) -> BoundFloatingIP
+    def get_by_name(self, name, raw=False, fields=None):
+        # type: (str, bool, Optional[List[str]]) -> BoundFloatingIP
         """Get Floating IP by name
 
         :param name: str
                Used to get Floating IP by name.
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundFloatingIP <hcloud.floating_ips.client.BoundFloatingIP>`
         """
-        return super(FloatingIPsClient, self).get_by_name(name)
+        return super(FloatingIPsClient, self).get_by_name(name, raw=raw, fields=fields)
 
     def create(self,
                type,  # type: str
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
-from dateutil.parser import isoparse
 
-from hcloud.core.domain import BaseDomain
+from hcloud.core.domain import BaseDomain, intern_strings, lazy_iso_datetimes, shared_values
 
 
+@lazy_iso_datetimes("created")
 class FloatingIP(BaseDomain):
     """Floating IP Domain
 
@@ -32,6 +32,7 @@ class FloatingIP(BaseDomain):
     :param name: str
            Name of the Floating IP
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "id",
         "type",
@@ -43,8 +44,8 @@ class FloatingIP(BaseDomain):
         "blocked",
         "protection",
         "labels",
+        "created",
         "name",
-        "created"
     )
 
     def __init__(
@@ -60,7 +61,7 @@ class FloatingIP(BaseDomain):
         protection=None,
         labels=None,
         created=None,
-        name=None
+        name=None,
     ):
         self.id = id
         self.type = type
@@ -72,9 +73,46 @@ class FloatingIP(BaseDomain):
         self.blocked = blocked
         self.protection = protection
         self.labels = labels
-        self.created = isoparse(created) if created else None
+        self.created = created
         self.name = name
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.type = intern_strings(get("type"))
+        domain.description = get("description")
+        domain.ip = get("ip")
+        domain.server = get("server")
+        domain.dns_ptr = get("dns_ptr")
+        domain.home_location = shared_values.share("locations", get("home_location"))
+        domain.blocked = get("blocked")
+        domain.protection = get("protection")
+        domain.labels = intern_strings(get("labels"))
+        domain.created = get("created")
+        domain.name = get("name")
+        return domain
+
+    @classmethod
+    def from_projection(cls, data, fields):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.type = intern_strings(get("type")) if "type" in fields else None
+        domain.description = get("description") if "description" in fields else None
+        domain.ip = get("ip") if "ip" in fields else None
+        domain.server = get("server") if "server" in fields else None
+        domain.dns_ptr = get("dns_ptr") if "dns_ptr" in fields else None
+        domain.home_location = shared_values.share("locations", get("home_location")) if "home_location" in fields else None
+        domain.blocked = get("blocked") if "blocked" in fields else None
+        domain.protection = get("protection") if "protection" in fields else None
+        domain.labels = intern_strings(get("labels")) if "labels" in fields else None
+        domain.created = get("created") if "created" in fields else None
+        domain.name = get("name") if "name" in fields else None
+        return domain
+    # end of generated code
+
 
 class CreateFloatingIPResponse(BaseDomain):
     """Create Floating IP Response Domain
@@ -84,15 +122,24 @@ class CreateFloatingIPResponse(BaseDomain):
     :param action: :class:`BoundAction <hcloud.actions.client.BoundAction>`
            The Action which shows the progress of the Floating IP Creation
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "floating_ip",
-        "action"
+        "action",
     )
 
     def __init__(
-            self,
-            floating_ip,     # type: BoundFloatingIP
-            action,          # type: BoundAction
+        self,
+        floating_ip,  # type: BoundFloatingIP
+        action,  # type: BoundAction
     ):
         self.floating_ip = floating_ip
         self.action = action
+
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        domain.floating_ip = data["floating_ip"]
+        domain.action = data["action"]
+        return domain
+    # end of generated code
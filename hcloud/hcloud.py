@@ -5,6 +5,7 @@ import time
 import requests
 
 from hcloud.actions.client import ActionsClient
+from hcloud.core.client import resolve_placeholders
 from hcloud.floating_ips.client import FloatingIPsClient
 from hcloud.networks.client import NetworksClient
 from hcloud.isos.client import IsosClient
@@ -37,7 +38,7 @@ class Client(object):
     _retry_wait_time = 0.5
     __user_agent_prefix = 'hcloud-python'
 
-    def __init__(self, token, api_endpoint="https://api.hetzner.cloud/v1", application_name=None, application_version=None, poll_interval=1):
+    def __init__(self, token, api_endpoint="https://api.hetzner.cloud/v1", application_name=None, application_version=None, poll_interval=1, identity_map=None, catalog_cache=None):
         """Create an new Client instance
 
         :param token: str
@@ -50,12 +51,18 @@ class Client(object):
                 Your application _version (default is None)
         :param poll_interval: int
                 Interval for polling information from Hetzner Cloud API in seconds (default is 1)
+        :param identity_map: :class:`IdentityMap <hcloud.core.identity.IdentityMap>`
+                Shares one bound model per resource id between all responses of this client, which updates it in place with fresher data (default is None, every response builds new bound models)
+        :param catalog_cache: :class:`CatalogCache <hcloud.core.catalog.CatalogCache>`
+                Answers lookups of server types, locations, datacenters, ISOs and system images by id or name from memory, a :class:`PersistentCatalogCache <hcloud.core.catalog.PersistentCatalogCache>` keeps them between processes (default is None, every lookup sends a request)
         """
         self.token = token
         self._api_endpoint = api_endpoint
         self._application_name = application_name
         self._application_version = application_version
         self.poll_interval = poll_interval
+        self._identity_map = identity_map
+        self._catalog_cache = catalog_cache
 
         self.datacenters = DatacentersClient(self)
         """DatacentersClient Instance
@@ -113,6 +120,27 @@ class Client(object):
         :type: :class:`NetworksClient <hcloud.networks.client.NetworksClient>`
         """
 
+    def resolve(self, models):
+        # type: (Iterable[BoundModelBase]) -> None
+        """Completes incomplete bound models, e.g. the volumes of servers, with one paginated list call per resource type
+
+        Without it every incomplete model fetches its data with a request of its own on the first access.
+
+        :param models: List[:class:`BoundModelBase <hcloud.core.client.BoundModelBase>`]
+               Bound models to complete, complete ones are skipped
+        """
+        resolve_placeholders(models)
+
+    def refresh_catalogs(self):
+        """Lists all static catalogs now, replacing the ones held by the catalog cache of the client
+
+        Does nothing without a :class:`CatalogCache <hcloud.core.catalog.CatalogCache>`.
+        """
+        if self._catalog_cache is None:
+            return
+        for client in (self.datacenters, self.images, self.isos, self.locations, self.server_types):
+            self._catalog_cache.refresh(client)
+
     def _get_user_agent(self):
         """Get the user agent of the hcloud-python instance with the user application name (if specified)
 
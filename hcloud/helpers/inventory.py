@@ -0,0 +1,405 @@
+# -*- coding: utf-8 -*-
+import array
+import calendar
+import operator
+from collections import Counter, OrderedDict
+
+try:
+    from sys import intern
+except ImportError:  # Python 2, where intern is a builtin
+    pass
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from hcloud.core.client import resolve_placeholders
+from hcloud.core.domain import parse_iso_datetime
+from hcloud.floating_ips.client import BoundFloatingIP
+from hcloud.servers.client import BoundServer
+from hcloud.volumes.client import BoundVolume
+
+try:
+    _INT = "q" if "q" in array.typecodes else "l"
+except AttributeError:  # Python 2 has no array.typecodes and no "q"
+    _INT = "l"
+
+INTEGER = "integer"
+"""Column kind of integers, missing values are stored as 0"""
+FLOAT = "float"
+"""Column kind of floats, missing values are stored as NaN"""
+BOOLEAN = "boolean"
+"""Column kind of booleans, missing values are stored as False"""
+STRING = "string"
+"""Column kind of strings, stored as integer codes into a table of interned strings, missing values are None"""
+TIMESTAMP = "timestamp"
+"""Column kind of ISO 8601 timestamps, stored as seconds since the epoch, missing values are NaN"""
+
+_TYPECODES = {INTEGER: _INT, FLOAT: "d", BOOLEAN: "b", STRING: "i", TIMESTAMP: "d"}
+
+_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+SERVER_COLUMNS = (
+    ("id", INTEGER, ("id",)),
+    ("name", STRING, ("name",)),
+    ("status", STRING, ("status",)),
+    ("server_type", STRING, ("server_type", "name")),
+    ("datacenter", STRING, ("datacenter", "name")),
+    ("location", STRING, ("datacenter", "location", "name")),
+    ("image", STRING, ("image", "name")),
+    ("ipv4", STRING, ("public_net", "ipv4", "ip")),
+    ("outgoing_traffic", FLOAT, ("outgoing_traffic",)),
+    ("ingoing_traffic", FLOAT, ("ingoing_traffic",)),
+    ("included_traffic", FLOAT, ("included_traffic",)),
+    ("locked", BOOLEAN, ("locked",)),
+    ("created", TIMESTAMP, ("created",)),
+)
+"""Columns of a server inventory as (name, kind, path into the API response)"""
+
+VOLUME_COLUMNS = (
+    ("id", INTEGER, ("id",)),
+    ("name", STRING, ("name",)),
+    ("status", STRING, ("status",)),
+    ("size", INTEGER, ("size",)),
+    ("location", STRING, ("location", "name")),
+    ("server", INTEGER, ("server",)),
+    ("format", STRING, ("format",)),
+    ("created", TIMESTAMP, ("created",)),
+)
+"""Columns of a volume inventory, `server` is 0 for detached volumes"""
+
+FLOATING_IP_COLUMNS = (
+    ("id", INTEGER, ("id",)),
+    ("name", STRING, ("name",)),
+    ("type", STRING, ("type",)),
+    ("ip", STRING, ("ip",)),
+    ("home_location", STRING, ("home_location", "name")),
+    ("server", INTEGER, ("server",)),
+    ("blocked", BOOLEAN, ("blocked",)),
+    ("created", TIMESTAMP, ("created",)),
+)
+"""Columns of a Floating IP inventory, `server` is 0 for unassigned Floating IPs"""
+
+_RESOURCES = {
+    "servers": (SERVER_COLUMNS, BoundServer),
+    "volumes": (VOLUME_COLUMNS, BoundVolume),
+    "floating_ips": (FLOATING_IP_COLUMNS, BoundFloatingIP),
+}
+
+
+def _lookup(data, path):
+    for key in path:
+        if data is None:
+            return None
+        data = data.get(key)
+    return data
+
+
+def _to_timestamp(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    return calendar.timegm(value.utctimetuple()) + value.microsecond / 1e6
+
+
+class _StringColumn(object):
+    """Codes into a table of interned strings, -1 stands for None"""
+
+    def __init__(self):
+        self.values = []
+        self.codes_by_value = {}
+        self.codes = array.array("i")
+
+    def append(self, value):
+        code = self.codes_by_value.get(value)
+        if code is None:
+            if value is None:
+                code = -1
+            else:
+                code = len(self.values)
+                self.values.append(intern(str(value)))
+            self.codes_by_value[value] = code
+        self.codes.append(code)
+
+
+class Inventory(object):
+    """Columnar snapshot of servers, volumes or Floating IPs
+
+    Every column is a compact typed array (a NumPy array if NumPy is installed, :mod:`array` otherwise), so
+    filters and group-bys over thousands of resources run without building a bound model per resource.
+
+    :param client: ServersClient, VolumesClient or FloatingIPsClient
+           Client the inventory was built from, used by :meth:`bound_models`
+    :param columns: List[Tuple[str, str, Tuple[str]]]
+           Columns of the inventory as (name, kind, path into the API response)
+    :param arrays: Dict[str, array]
+           Values of every column, strings as codes into `strings`
+    :param strings: Dict[str, List[str]]
+           Interned strings of the string columns
+    :param entries: List[Dict] (optional)
+           Response data of every row, only kept if asked for as it takes more memory than the columns
+    """
+
+    use_numpy = numpy is not None
+    """Store the columns as NumPy arrays, disable to use :mod:`array` even if NumPy is installed"""
+
+    def __init__(self, client, columns, arrays, strings, entries=None):
+        self._client = client
+        self._entries = entries
+        self.columns = columns
+        self._kinds = OrderedDict((name, kind) for name, kind, _ in columns)
+        self._arrays = arrays
+        self._strings = strings
+
+    @classmethod
+    def from_client(cls, client, columns=None, keep_entries=False, **kwargs):
+        # type: (ClientEntityBase, Optional[List[Tuple[str, str, Tuple[str]]]], bool, ...) -> Inventory
+        """Builds an inventory of all entries of a servers, volumes or Floating IPs client
+
+        :param client: ServersClient, VolumesClient or FloatingIPsClient
+        :param columns: List[Tuple[str, str, Tuple[str]]] (optional)
+               Columns to collect, defaults to :data:`SERVER_COLUMNS`, :data:`VOLUME_COLUMNS` or :data:`FLOATING_IP_COLUMNS`
+        :param keep_entries: bool (optional)
+               Keep the response data of every row, so :meth:`bound_models` builds the models without any request
+        :param kwargs:
+               Filters passed on to `iter_all` of the client, e.g. `label_selector`
+        :return: :class:`Inventory <hcloud.helpers.inventory.Inventory>`
+        """
+        if client.results_list_attribute_name not in _RESOURCES:
+            raise ValueError("inventories are only supported for servers, volumes and floating_ips")
+        if columns is None:
+            columns = _RESOURCES[client.results_list_attribute_name][0]
+        return cls.from_data(client, client.iter_all(raw=True, **kwargs), columns, keep_entries)
+
+    @classmethod
+    def from_data(cls, client, entries, columns, keep_entries=False):
+        # type: (ClientEntityBase, Iterable[Dict], List[Tuple[str, str, Tuple[str]]], bool) -> Inventory
+        """Builds an inventory from decoded API responses, e.g. a cached `get_all(raw=True)` result"""
+        collected = []
+        kept = [] if keep_entries else None
+        for name, kind, path in columns:
+            collected.append((name, kind, path, _StringColumn() if kind == STRING else array.array(_TYPECODES[kind])))
+
+        for entry in entries:
+            if kept is not None:
+                kept.append(entry)
+            for name, kind, path, column in collected:
+                value = _lookup(entry, path)
+                if kind == STRING:
+                    column.append(value)
+                elif value is None:
+                    column.append(0 if kind in (INTEGER, BOOLEAN) else float("nan"))
+                elif kind == TIMESTAMP:
+                    column.append(_to_timestamp(parse_iso_datetime(value)))
+                else:
+                    column.append(value)
+
+        arrays = {}
+        strings = {}
+        for name, kind, path, column in collected:
+            if kind == STRING:
+                strings[name] = column.values
+                column = column.codes
+            arrays[name] = numpy.array(column) if cls.use_numpy else column
+        return cls(client, columns, arrays, strings, kept)
+
+    def _is_array_backed(self):
+        return not self._arrays or isinstance(next(iter(self._arrays.values())), array.array)
+
+    def __len__(self):
+        return len(self._arrays[self.columns[0][0]]) if self.columns else 0
+
+    def _kind(self, name):
+        try:
+            return self._kinds[name]
+        except KeyError:
+            raise ValueError("unknown column {name}".format(name=name))
+
+    def column(self, name):
+        # type: (str) -> Sequence
+        """Returns the values of a column, strings decoded and timestamps as seconds since the epoch
+
+        :param name: str
+        :return: numpy.ndarray, array.array or List[str] for string columns
+        """
+        if self._kind(name) == STRING:
+            strings = self._strings[name]
+            return [strings[code] if code >= 0 else None for code in self._arrays[name]]
+        return self._arrays[name]
+
+    def _code(self, name, string):
+        """Returns the code of a string in a string column, None if no row has that value"""
+        if string is None:
+            return -1
+        try:
+            return self._strings[name].index(string)
+        except ValueError:
+            return None
+
+    def mask(self, name, op, value):
+        # type: (str, str, Any) -> Sequence[bool]
+        """Compares every value of a column with `value`
+
+        :param name: str
+        :param op: str
+               One of `==`, `!=`, `<`, `<=`, `>`, `>=`, or `in` with a collection as `value`
+        :param value:
+               Value to compare with, datetimes for timestamp columns
+        :return: numpy.ndarray or List[bool]
+        """
+        kind = self._kind(name)
+        values = self._arrays[name]
+        if op == "in":
+            if kind == STRING:
+                value = [self._code(name, string) for string in value]
+            elif kind == TIMESTAMP:
+                value = [_to_timestamp(timestamp) for timestamp in value]
+            value = [v for v in value if v is not None]
+            if isinstance(values, array.array):
+                wanted = set(value)
+                return [v in wanted for v in values]
+            return numpy.isin(values, value)
+
+        compare = _OPERATORS.get(op)
+        if compare is None:
+            raise ValueError("unknown operator {op}".format(op=op))
+        if kind == STRING:
+            if op not in ("==", "!="):
+                return [v is not None and compare(v, value) for v in self.column(name)]
+            code = self._code(name, value)
+            # -2 is no code at all, so the comparison fails for every row
+            value = code if code is not None else -2
+        elif kind == TIMESTAMP:
+            value = _to_timestamp(value)
+        if isinstance(values, array.array):
+            return [compare(v, value) for v in values]
+        return compare(values, value)
+
+    def filter(self, *masks, **equals):
+        # type: (*Sequence[bool], **Any) -> Inventory
+        """Returns an inventory of the rows matching all masks and column values
+
+        A column value which is a list, tuple or set matches any of its members.
+
+        :param masks:
+               Results of :meth:`mask`
+        :param equals:
+               Values of columns, e.g. `status="running"` or `server_type=("cx11", "cx21")`
+        :return: :class:`Inventory <hcloud.helpers.inventory.Inventory>`
+        """
+        masks = list(masks)
+        for name, value in sorted(equals.items()):
+            if isinstance(value, (list, tuple, set, frozenset)):
+                masks.append(self.mask(name, "in", value))
+            else:
+                masks.append(self.mask(name, "==", value))
+        if not masks:
+            return self
+        if not self._is_array_backed():
+            selected = numpy.logical_and.reduce([numpy.asarray(mask, dtype=bool) for mask in masks])
+            return self.take(numpy.flatnonzero(selected))
+        return self.take([row for row, matches in enumerate(zip(*masks)) if all(matches)])
+
+    def take(self, rows):
+        # type: (Sequence[int]) -> Inventory
+        """Returns an inventory of the given rows
+
+        :param rows: List[int]
+        :return: :class:`Inventory <hcloud.helpers.inventory.Inventory>`
+        """
+        arrays = {}
+        for name, values in self._arrays.items():
+            if isinstance(values, array.array):
+                arrays[name] = array.array(values.typecode, (values[row] for row in rows))
+            else:
+                arrays[name] = values[numpy.asarray(rows, dtype=int)]
+        entries = None
+        if self._entries is not None:
+            entries = [self._entries[row] for row in rows]
+        return self.__class__(self._client, self.columns, arrays, self._strings, entries)
+
+    def _group_codes(self, name):
+        """Returns the group of every row as codes into the returned list of group values"""
+        values = self._arrays[name]
+        if self._kind(name) == STRING:
+            groups = self._strings[name] + [None]
+            if isinstance(values, array.array):
+                return [code if code >= 0 else len(groups) - 1 for code in values], groups
+            return numpy.where(values >= 0, values, len(groups) - 1), groups
+        if isinstance(values, array.array):
+            groups = sorted(set(values))
+            positions = dict((value, position) for position, value in enumerate(groups))
+            return [positions[value] for value in values], groups
+        groups, codes = numpy.unique(values, return_inverse=True)
+        return codes, groups.tolist()
+
+    def count_by(self, name):
+        # type: (str) -> Dict[Any, int]
+        """Counts the rows per value of a column
+
+        :param name: str
+        :return: Dict[value, int], most common values first
+        """
+        codes, groups = self._group_codes(name)
+        if isinstance(codes, list):
+            counts = Counter(codes)
+        else:
+            counts = dict(enumerate(numpy.bincount(codes, minlength=len(groups)).tolist()))
+        return OrderedDict((groups[code], count) for code, count in
+                           sorted(counts.items(), key=lambda item: (-item[1], item[0])) if count)
+
+    def sum_by(self, name, value_name):
+        # type: (str, str) -> Dict[Any, float]
+        """Sums a numeric column per value of another column, e.g. `sum_by("server_type", "outgoing_traffic")`
+
+        NaN values (missing data) are skipped.
+
+        :param name: str
+        :param value_name: str
+        :return: Dict[value, float]
+        """
+        if self._kind(value_name) == STRING:
+            raise ValueError("cannot sum the string column {name}".format(name=value_name))
+        codes, groups = self._group_codes(name)
+        values = self._arrays[value_name]
+        if isinstance(codes, list):
+            sums = [0.0] * len(groups)
+            for code, value in zip(codes, values):
+                if value == value:
+                    sums[code] += value
+        else:
+            values = numpy.asarray(values, dtype=float)
+            present = ~numpy.isnan(values)
+            sums = numpy.bincount(codes[present], weights=values[present], minlength=len(groups)).tolist()
+        used = set(codes) if isinstance(codes, list) else set(numpy.unique(codes).tolist())
+        return OrderedDict((groups[code], sums[code]) for code in sorted(used))
+
+    def bound_models(self, rows=None):
+        # type: (Optional[Sequence[int]]) -> List[BoundModelBase]
+        """Returns complete bound models of the given rows (all by default)
+
+        The models are built from the kept response data of the rows, or else completed with one listing of
+        the client (see :func:`resolve_placeholders <hcloud.core.client.resolve_placeholders>`).
+
+        :param rows: List[int] (optional)
+        :return: List[:class:`BoundServer <hcloud.servers.client.BoundServer>`], List[:class:`BoundVolume <hcloud.volumes.client.BoundVolume>`] or List[:class:`BoundFloatingIP <hcloud.floating_ips.client.BoundFloatingIP>`]
+        """
+        bound_model_class = _RESOURCES[self._client.results_list_attribute_name][1]
+        if self._entries is not None:
+            entries = self._entries
+            if rows is not None:
+                entries = [entries[row] for row in rows]
+            return [bound_model_class(self._client, entry) for entry in entries]
+        ids = self._arrays["id"]
+        if rows is not None:
+            ids = [ids[row] for row in rows]
+        models = [bound_model_class(self._client, {"id": int(id)}, complete=False) for id in ids]
+        resolve_placeholders(models)
+        return models
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+
+
+def _resolve(model, path):
+    value = model
+    for name in path:
+        if value is None:
+            return None
+        value = getattr(value, name)
+    return value
+
+
+class ResourceSet(object):
+    """Bound models of one resource type, indexed by their id
+
+    Lookups by id are O(1). Lookups by name, label or any other field build an index on their first use,
+    later lookups of the same kind are O(1) as well. Set operations compare the models by id and run in
+    linear time.
+
+    A resource set does not change after it was built, set operations and lookups return new sets. Indexes
+    hold the field values of their first use, fields of incomplete models are loaded while building them.
+
+    :param models: Iterable[:class:`BoundModelBase <hcloud.core.client.BoundModelBase>`]
+           Models of the set, the first model of every id is kept
+    """
+
+    def __init__(self, models=()):
+        self._models = OrderedDict()
+        for model in models:
+            self._models.setdefault(model.id, model)
+        self._names = None
+        self._labels = None
+        self._fields = {}
+
+    @classmethod
+    def from_client(cls, client, **kwargs):
+        # type: (ClientEntityBase, ...) -> ResourceSet
+        """Builds a set of all entries of a resource client, e.g. `ResourceSet.from_client(client.servers)`
+
+        :param client: Resource client, e.g. :class:`ServersClient <hcloud.servers.client.ServersClient>`
+        :param kwargs:
+               Filters passed on to `iter_all` of the client, e.g. `label_selector`
+        :return: :class:`ResourceSet <hcloud.helpers.resource_set.ResourceSet>`
+        """
+        return cls(client.iter_all(**kwargs))
+
+    def __len__(self):
+        return len(self._models)
+
+    def __iter__(self):
+        return iter(self._models.values())
+
+    def __contains__(self, model_or_id):
+        return getattr(model_or_id, "id", model_or_id) in self._models
+
+    def __repr__(self):
+        return "<ResourceSet of {count} models>".format(count=len(self))
+
+    def ids(self):
+        # type: () -> List[int]
+        """Returns the ids of all models in the order they were added"""
+        return list(self._models)
+
+    def get_by_id(self, id):
+        # type: (int) -> Optional[BoundModelBase]
+        """Returns the model with the given id, None if it is not in the set
+
+        :param id: int
+        :return: :class:`BoundModelBase <hcloud.core.client.BoundModelBase>`
+        """
+        return self._models.get(id)
+
+    def get_by_name(self, name):
+        # type: (str) -> Optional[BoundModelBase]
+        """Returns the model with the given name, None if it is not in the set
+
+        :param name: str
+        :return: :class:`BoundModelBase <hcloud.core.client.BoundModelBase>`
+        """
+        if self._names is None:
+            names = {}
+            for model in self:
+                names.setdefault(model.name, model)
+            self._names = names
+        return self._names.get(name)
+
+    def get_by_label(self, key, value=None):
+        # type: (str, Optional[str]) -> ResourceSet
+        """Returns the models which have the label, with the given value if there is one
+
+        :param key: str
+        :param value: str (optional)
+               Value of the label, any value matches if it is None
+        :return: :class:`ResourceSet <hcloud.helpers.resource_set.ResourceSet>`
+        """
+        if self._labels is None:
+            labels = {}
+            for model in self:
+                for label_key, label_value in (model.labels or {}).items():
+                    values = labels.setdefault(label_key, {None: []})
+                    values[None].append(model)
+                    values.setdefault(label_value, []).append(model)
+            self._labels = labels
+        return self.__class__(self._labels.get(key, {}).get(value, ()))
+
+    def get_by(self, field, value):
+        # type: (str, Any) -> ResourceSet
+        """Returns the models whose field has the given value
+
+        :param field: str
+               Name of the field, nested fields are separated by dots, e.g. `status` or `datacenter.name`
+        :param value:
+               Value of the field, which has to be hashable
+        :return: :class:`ResourceSet <hcloud.helpers.resource_set.ResourceSet>`
+        """
+        return self.group_by(field).get(value) or self.__class__()
+
+    def group_by(self, field):
+        # type: (str) -> Dict[Any, ResourceSet]
+        """Groups the models by the value of a field
+
+        :param field: str
+               Name of the field, nested fields are separated by dots, e.g. `datacenter.location.name`
+        :return: Dict[value, :class:`ResourceSet <hcloud.helpers.resource_set.ResourceSet>`], in the order of the models
+        """
+        groups = self._fields.get(field)
+        if groups is None:
+            path = field.split(".")
+            models_by_value = OrderedDict()
+            for model in self:
+                models_by_value.setdefault(_resolve(model, path), []).append(model)
+            groups = self._fields[field] = OrderedDict(
+                (value, self.__class__(models)) for value, models in models_by_value.items())
+        return groups
+
+    def union(self, other):
+        # type: (Iterable[BoundModelBase]) -> ResourceSet
+        """Returns the models of both sets, the models of this set are kept for ids in both"""
+        return self.__class__(list(self) + list(other))
+
+    def intersection(self, other):
+        # type: (Iterable[BoundModelBase]) -> ResourceSet
+        """Returns the models of this set whose id is in the other set as well"""
+        ids = _ids(other)
+        return self.__class__(model for id, model in self._models.items() if id in ids)
+
+    def difference(self, other):
+        # type: (Iterable[BoundModelBase]) -> ResourceSet
+        """Returns the models of this set whose id is not in the other set"""
+        ids = _ids(other)
+        return self.__class__(model for id, model in self._models.items() if id not in ids)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+def _ids(models):
+    if isinstance(models, ResourceSet):
+        return models._models
+    return set(model.id for model in models)
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+
+from hcloud.core.domain import BaseDomain
+
+LIST_KEYS = {
+    "private_net": "network",
+    "dns_ptr": "ip",
+    "subnets": "ip_range",
+    "routes": "destination",
+    "prices": "location",
+}
+"""Key identifying the entries of list fields, entries are compared by it instead of by their position"""
+
+_MISSING = object()
+
+
+class FieldChange(BaseDomain):
+    """A field which differs between two snapshots of a resource
+
+    :param path: Tuple
+           Keys leading to the field, e.g. `("status",)`, `("labels", "env")`, `("public_net", "ipv4", "ip")`
+           or `("private_net", 4711, "ip")` with the network id as the key of the list entry
+    :param old:
+           Value in the older snapshot, None if the field was added
+    :param new:
+           Value in the newer snapshot, None if the field was removed
+    """
+    __slots__ = (
+        "path",
+        "old",
+        "new",
+    )
+
+    def __init__(self, path, old, new):
+        self.path = path
+        self.old = old
+        self.new = new
+
+    def __repr__(self):
+        return "<FieldChange {path}: {old!r} -> {new!r}>".format(path=".".join(str(key) for key in self.path),
+                                                                 old=self.old, new=self.new)
+
+
+class ResourceChange(BaseDomain):
+    """A resource which was added, removed or changed between two snapshots
+
+    :param type: str
+           `added`, `removed` or `changed`
+    :param resource: str
+           Name of the resource, e.g. `servers`
+    :param id: int
+    :param old: Dict
+           Response data in the older snapshot, None if the resource was added
+    :param new: Dict
+           Response data in the newer snapshot, None if the resource was removed
+    :param changes: List[:class:`FieldChange <hcloud.helpers.snapshot.FieldChange>`]
+           Changed fields, empty unless the resource was changed
+    """
+    TYPE_ADDED = "added"
+    """Resource Change Type added"""
+    TYPE_REMOVED = "removed"
+    """Resource Change Type removed"""
+    TYPE_CHANGED = "changed"
+    """Resource Change Type changed"""
+
+    __slots__ = (
+        "type",
+        "resource",
+        "id",
+        "old",
+        "new",
+        "changes",
+    )
+
+    def __init__(self, type, resource, id, old=None, new=None, changes=None):
+        self.type = type
+        self.resource = resource
+        self.id = id
+        self.old = old
+        self.new = new
+        self.changes = changes or []
+
+    def __repr__(self):
+        return "<ResourceChange {type} {resource} {id}>".format(type=self.type, resource=self.resource, id=self.id)
+
+
+class SnapshotDiff(object):
+    """Differences between two snapshots, iterating over it yields every change
+
+    :param added: List[:class:`ResourceChange <hcloud.helpers.snapshot.ResourceChange>`]
+    :param removed: List[:class:`ResourceChange <hcloud.helpers.snapshot.ResourceChange>`]
+    :param changed: List[:class:`ResourceChange <hcloud.helpers.snapshot.ResourceChange>`]
+    """
+
+    def __init__(self, added, removed, changed):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __iter__(self):
+        for changes in (self.added, self.removed, self.changed):
+            for change in changes:
+                yield change
+
+    def __len__(self):
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    __nonzero__ = __bool__
+
+
+def _diff_values(path, old, new, ignore, changes):
+    if old == new or path in ignore:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            _diff_values(path + (key,), old[key], new.get(key, _MISSING), ignore, changes)
+        for key in new:
+            if key not in old:
+                _diff_values(path + (key,), _MISSING, new[key], ignore, changes)
+        return
+    list_key = LIST_KEYS.get(path[-1]) if path else None
+    if list_key and isinstance(old, list) and isinstance(new, list) and _keyed(old, list_key) and _keyed(new, list_key):
+        _diff_values(path, OrderedDict((entry[list_key], entry) for entry in old),
+                     OrderedDict((entry[list_key], entry) for entry in new), ignore, changes)
+        return
+    changes.append(FieldChange(path, None if old is _MISSING else old, None if new is _MISSING else new))
+
+
+def _keyed(entries, key):
+    return all(isinstance(entry, dict) and key in entry for entry in entries)
+
+
+class Snapshot(object):
+    """Response data of all entries of resource clients, indexed by resource name and id
+
+    Comparing two snapshots with :meth:`diff` takes time linear in the number of resources.
+
+    :param resources: Dict[str, Dict[int, Dict]]
+           Response data by resource name (e.g. `servers`) and id
+    """
+
+    def __init__(self, resources):
+        self.resources = resources
+
+    @classmethod
+    def from_clients(cls, *clients, **kwargs):
+        # type: (*ClientEntityBase, ...) -> Snapshot
+        """Lists all entries of the given resource clients, e.g. `Snapshot.from_clients(client.servers, client.volumes)`
+
+        :param clients: Resource clients, e.g. :class:`ServersClient <hcloud.servers.client.ServersClient>`
+        :param kwargs:
+               Filters passed on to `iter_all` of every client, e.g. `label_selector`
+        :return: :class:`Snapshot <hcloud.helpers.snapshot.Snapshot>`
+        """
+        resources = OrderedDict()
+        for client in clients:
+            resources[client.results_list_attribute_name] = OrderedDict(
+                (entry["id"], entry) for entry in client.iter_all(raw=True, **kwargs))
+        return cls(resources)
+
+    def diff(self, newer, ignore=()):
+        # type: (Snapshot, Iterable[str]) -> SnapshotDiff
+        """Compares this snapshot with a newer one
+
+        Resources which are in only one of the snapshots are added or removed. Resources which are in only one
+        of the snapshots' resource names are skipped, so snapshots of different clients can be compared.
+
+        :param newer: :class:`Snapshot <hcloud.helpers.snapshot.Snapshot>`
+        :param ignore: List[str] (optional)
+               Fields not to compare, nested fields separated by dots, e.g. `["outgoing_traffic", "public_net.ipv4.dns_ptr"]`
+        :return: :class:`SnapshotDiff <hcloud.helpers.snapshot.SnapshotDiff>`
+        """
+        ignore = frozenset(tuple(field.split(".")) for field in ignore)
+        added, removed, changed = [], [], []
+        for resource, old_entries in self.resources.items():
+            new_entries = newer.resources.get(resource)
+            if new_entries is None:
+                continue
+            for id, old in old_entries.items():
+                new = new_entries.get(id)
+                if new is None:
+                    removed.append(ResourceChange(ResourceChange.TYPE_REMOVED, resource, id, old=old))
+                    continue
+                changes = []
+                _diff_values((), old, new, ignore, changes)
+                if changes:
+                    changed.append(ResourceChange(ResourceChange.TYPE_CHANGED, resource, id, old, new, changes))
+            for id, new in new_entries.items():
+                if id not in old_entries:
+                    added.append(ResourceChange(ResourceChange.TYPE_ADDED, resource, id, new=new))
+        return SnapshotDiff(added, removed, changed)
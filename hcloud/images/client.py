@@ -7,18 +7,30 @@ from hcloud.images.domain import Image
 
 
 class BoundImage(BoundModelBase):
+    __slots__ = ()
     model = Image
 
-    def __init__(self, client, data):
+    def _hydrate_created_from(self, created_from):
+        if created_from is None:
+            return None
         from hcloud.servers.client import BoundServer
-        created_from = data.get("created_from")
-        if created_from is not None:
-            data['created_from'] = BoundServer(client._client.servers, created_from, complete=False)
-        bound_to = data.get("bound_to")
-        if bound_to is not None:
-            data['bound_to'] = BoundServer(client._client.servers, {"id": bound_to}, complete=False)
+        return BoundServer(self._client._client.servers, created_from, complete=False)
 
-        super(BoundImage, self).__init__(client, data)
+    def _hydrate_bound_to(self, bound_to):
+        if bound_to is None:
+            return None
+        from hcloud.servers.client import BoundServer
+        return BoundServer(self._client._client.servers, {"id": bound_to}, complete=False)
+
+    _hydrators = {
+        "created_from": _hydrate_created_from,
+        "bound_to": _hydrate_bound_to,
+    }
+
+    _expandable = {
+        "created_from": ("created_from", lambda image: [image.created_from]),
+        "bound_to": ("bound_to", lambda image: [image.bound_to]),
+    }
 
     def get_actions_list(self, sort=None, page=None, per_page=None, status=None):
         # type: (Optional[List[str]], Optional[int], Optional[int], Optional[List[str]]) -> PageResult[BoundAction, Meta]
@@ -36,17 +48,33 @@ class BoundImage(BoundModelBase):
         """
         return self._client.get_actions_list(self, sort=sort, page=page, per_page=per_page, status=status)
 
-    def get_actions(self, sort=None, status=None):
-        # type: (Optional[List[str]], Optional[List[str]]) -> List[BoundAction]
+    def get_actions(self, sort=None, status=None, resume_from=None):
+        # type: (Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> List[BoundAction]
         """Returns all action objects for the image.
 
         :param status: List[str] (optional)
                Response will have only actions with specified statuses. Choices: `running` `success` `error`
         :param sort: List[str] (optional)
                Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
         :return: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
         """
-        return self._client.get_actions(self, status=status, sort=sort)
+        return self._client.get_actions(self, status=status, sort=sort, resume_from=resume_from)
+
+    def iter_actions(self, sort=None, status=None, resume_from=None):
+        # type: (Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> PageIterator[BoundAction]
+        """Iterate over all action objects for the image, fetching the next page only when the current one is exhausted.
+
+        :param status: List[str] (optional)
+               Response will have only actions with specified statuses. Choices: `running` `success` `error`
+        :param sort: List[str] (optional)
+               Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :return: PageIterator[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+        """
+        return self._client.iter_actions(self, status=status, sort=sort, resume_from=resume_from)
 
     def update(self, description=None, type=None, labels=None):
         # type: (Optional[str], Optional[Dict[str, str]]) -> BoundImage
@@ -84,6 +112,8 @@ class BoundImage(BoundModelBase):
 
 class ImagesClient(ClientEntityBase, GetEntityByNameMixin):
     results_list_attribute_name = 'images'
+    query_params = ('name', 'label_selector', 'bound_to', 'type', 'sort', 'status')
+    catalog_filters = {"type": ["system"]}
 
     def get_actions_list(self,
                          image,         # type: Image
@@ -123,6 +153,7 @@ class ImagesClient(ClientEntityBase, GetEntityByNameMixin):
                     image,         # type: Image
                     sort=None,  # type: Optional[List[str]]
                     status=None,   # type: Optional[List[str]]
+                    resume_from=None,  # type: Optional[PaginationCursor]
                     ):
         # type: (...) -> List[BoundAction]
         """Returns all action objects for an image.
@@ -132,19 +163,49 @@ class ImagesClient(ClientEntityBase, GetEntityByNameMixin):
                Response will have only actions with specified statuses. Choices: `running` `success` `error`
         :param sort: List[str] (optional)
                Specify how the results are sorted. Choices: `id` `command` `status` `progress`  `started` `finished` . You can add one of ":asc", ":desc" to modify sort order. ( ":asc" is default)
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
         :return: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
         """
-        return super(ImagesClient, self).get_actions(image, sort=sort, status=status)
+        return super(ImagesClient, self).get_actions(image, sort=sort, status=status, resume_from=resume_from)
 
-    def get_by_id(self, id):
-        # type: (int) -> BoundImage
+    def iter_actions(self,
+                     image,         # type: Image
+                     sort=None,  # type: Optional[List[str]]
+                     status=None,   # type: Optional[List[str]]
+                     resume_from=None,  # type: Optional[PaginationCursor]
+                     ):
+        # type: (...) -> PageIterator[BoundAction]
+        """Iterate over all action objects for an image, fetching the next page only when the current one is exhausted.
+
+        :param image: :class:`BoundImage <hcloud.images.client.BoundImage>` or :class:`Image <hcloud.images.domain.Image>`
+        :param status: List[str] (optional)
+               Response will have only actions with specified statuses. Choices: `running` `success` `error`
+        :param sort: List[str] (optional)
+               Specify how the results are sorted. Choices: `id` `command` `status` `progress`  `started` `finished` . You can add one of ":asc", ":desc" to modify sort order. ( ":asc" is default)
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :return: PageIterator[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+        """
+        return super(ImagesClient, self).iter_actions(image, sort=sort, status=status, resume_from=resume_from)
+
+    def get_by_id(self, id, raw=False, fields=None):
+        # type: (int, bool, Optional[List[str]]) -> BoundImage
         """Get a specific Image
 
         :param id: int
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundImage <hcloud.images.client.BoundImage
         """
-        response = self._client.request(url="/images/{image_id}".format(image_id=id), method="GET")
-        return BoundImage(self, response['image'])
+        image = self._from_catalog("id", id)
+        if image is None:
+            image = self._client.request(url="/images/{image_id}".format(image_id=id), method="GET")['image']
+        if raw:
+            return image
+        return BoundImage(self, image, fields=fields)
 
     def get_list(self,
                  name=None,            # type: Optional[str]
@@ -154,7 +215,10 @@ class ImagesClient(ClientEntityBase, GetEntityByNameMixin):
                  sort=None,            # type: Optional[List[str]]
                  page=None,            # type: Optional[int]
                  per_page=None,        # type: Optional[int]
-                 status=None           # type: Optional[List[str]]
+                 status=None,          # type: Optional[List[str]]
+                 raw=False,            # type: bool
+                 expand=None,          # type: Optional[List[str]]
+                 fields=None,          # type: Optional[List[str]]
                  ):
         # type: (...) -> PageResults[List[BoundImage]]
         """Get all images
@@ -175,6 +239,12 @@ class ImagesClient(ClientEntityBase, GetEntityByNameMixin):
                Specifies the page to fetch
         :param per_page: int (optional)
                Specifies how many results are returned by page
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param expand: List[str] (optional)
+               Fields whose placeholder models are completed with one list call per resource type. Choices: created_from, bound_to
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: (List[:class:`BoundImage <hcloud.images.client.BoundImage>`], :class:`Meta <hcloud.core.domain.Meta>`)
         """
         params = {}
@@ -193,11 +263,14 @@ class ImagesClient(ClientEntityBase, GetEntityByNameMixin):
         if per_page:
             params['per_page'] = per_page
         if status:
-            params['status'] = per_page
+            params['status'] = status
 
         response = self._client.request(url="/images", method="GET", params=params)
-        images = [BoundImage(self, image_data) for image_data in response['images']]
+        if raw:
+            return self._add_meta_to_result(response['images'], response)
+        images = [BoundImage(self, image_data, fields=fields) for image_data in response['images']]
 
+        self._expand(images, expand)
         return self._add_meta_to_result(images, response)
 
     def get_all(self,
@@ -207,6 +280,10 @@ class ImagesClient(ClientEntityBase, GetEntityByNameMixin):
                 type=None,            # type: Optional[List[str]]
                 sort=None,            # type: Optional[List[str]]
                 status=None,          # type: Optional[List[str]]
+                resume_from=None,     # type: Optional[PaginationCursor]
+                raw=False,            # type: bool
+                expand=None,          # type: Optional[List[str]]
+                fields=None,          # type: Optional[List[str]]
                 ):
         # type: (...) -> List[BoundImage]
         """Get all images
@@ -223,19 +300,67 @@ class ImagesClient(ClientEntityBase, GetEntityByNameMixin):
                Can be used to filter images by their status. The response will only contain images matching the status.
         :param sort: List[str] (optional)
                Choices: id name created (You can add one of ":asc", ":desc" to modify sort order. ( ":asc" is default))
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param expand: List[str] (optional)
+               Fields whose placeholder models are completed with one list call per resource type. Choices: created_from, bound_to
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: List[:class:`BoundImage <hcloud.images.client.BoundImage>`]
         """
-        return super(ImagesClient, self).get_all(name=name, label_selector=label_selector, bound_to=bound_to, type=type, sort=sort, status=status)
+        return super(ImagesClient, self).get_all(name=name, label_selector=label_selector, bound_to=bound_to, type=type, sort=sort, status=status, resume_from=resume_from, raw=raw, expand=expand, fields=fields)
+
+    def iter_all(self,
+                 name=None,            # type: Optional[str]
+                 label_selector=None,  # type: Optional[str]
+                 bound_to=None,        # type: Optional[List[str]]
+                 type=None,            # type: Optional[List[str]]
+                 sort=None,            # type: Optional[List[str]]
+                 status=None,          # type: Optional[List[str]]
+                 resume_from=None,     # type: Optional[PaginationCursor]
+                 raw=False,            # type: bool
+                 fields=None,          # type: Optional[List[str]]
+                 ):
+        # type: (...) -> PageIterator[BoundImage]
+        """Iterate over all images, fetching the next page only when the current one is exhausted
+
+        :param name: str (optional)
+               Can be used to filter images by their name.
+        :param label_selector: str (optional)
+               Can be used to filter servers by labels. The response will only contain servers matching the label selector.
+        :param bound_to: List[str] (optional)
+               Server Id linked to the image. Only available for images of type backup
+        :param type: List[str] (optional)
+               Choices: system snapshot backup
+        :param status: List[str] (optional)
+               Can be used to filter images by their status. The response will only contain images matching the status.
+        :param sort: List[str] (optional)
+               Choices: id name created (You can add one of ":asc", ":desc" to modify sort order. ( ":asc" is default))
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
+        :return: PageIterator[:class:`BoundImage <hcloud.images.client.BoundImage>`]
+        """
+        return super(ImagesClient, self).iter_all(name=name, label_selector=label_selector, bound_to=bound_to, type=type, sort=sort, status=status, resume_from=resume_from, raw=raw, fields=fields)
 
-    def get_by_name(self, name):
-        # type: (str) -> BoundImage
+    def get_by_name(self, name, raw=False, fields=None):
+        # type: (str, bool, Optional[List[str]]) -> BoundImage
         """Get image by name
 
         :param name: str
                Used to get image by name.
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundImage <hcloud.images.client.BoundImage>`
         """
-        return super(ImagesClient, self).get_by_name(name)
+        return super(ImagesClient, self).get_by_name(name, raw=raw, fields=fields)
 
     def update(self, image, description=None, type=None, labels=None):
         # type:(Image,  Optional[str], Optional[str],  Optional[Dict[str, str]]) -> BoundImage
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
-from dateutil.parser import isoparse
 
-from hcloud.core.domain import BaseDomain, DomainIdentityMixin
+from hcloud.core.domain import BaseDomain, DomainIdentityMixin, intern_strings, lazy_iso_datetimes
 
 
+@lazy_iso_datetimes("created", "deprecated")
 class Image(BaseDomain, DomainIdentityMixin):
     """Image Domain
 
@@ -41,53 +41,53 @@ class Image(BaseDomain, DomainIdentityMixin):
             User-defined labels (key-value pairs)
     """
 
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "id",
         "name",
         "type",
+        "created",
         "description",
         "image_size",
         "disk_size",
+        "deprecated",
         "bound_to",
         "os_flavor",
         "os_version",
         "rapid_deploy",
         "created_from",
-        "status",
         "protection",
         "labels",
-        "created",
-        "deprecated"
+        "status",
     )
 
     def __init__(
-            self,
-            id=None,
-            name=None,
-            type=None,
-            created=None,
-            description=None,
-            image_size=None,
-            disk_size=None,
-            deprecated=None,
-            bound_to=None,
-            os_flavor=None,
-            os_version=None,
-            rapid_deploy=None,
-            created_from=None,
-            protection=None,
-            labels=None,
-            status=None
-
+        self,
+        id=None,
+        name=None,
+        type=None,
+        created=None,
+        description=None,
+        image_size=None,
+        disk_size=None,
+        deprecated=None,
+        bound_to=None,
+        os_flavor=None,
+        os_version=None,
+        rapid_deploy=None,
+        created_from=None,
+        protection=None,
+        labels=None,
+        status=None,
     ):
         self.id = id
         self.name = name
         self.type = type
-        self.created = isoparse(created) if created else None
+        self.created = created
         self.description = description
         self.image_size = image_size
         self.disk_size = disk_size
-        self.deprecated = isoparse(deprecated) if deprecated else None
+        self.deprecated = deprecated
         self.bound_to = bound_to
         self.os_flavor = os_flavor
         self.os_version = os_version
@@ -97,6 +97,51 @@ class Image(BaseDomain, DomainIdentityMixin):
         self.labels = labels
         self.status = status
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.name = get("name")
+        domain.type = intern_strings(get("type"))
+        domain.created = get("created")
+        domain.description = get("description")
+        domain.image_size = get("image_size")
+        domain.disk_size = get("disk_size")
+        domain.deprecated = get("deprecated")
+        domain.bound_to = get("bound_to")
+        domain.os_flavor = intern_strings(get("os_flavor"))
+        domain.os_version = intern_strings(get("os_version"))
+        domain.rapid_deploy = get("rapid_deploy")
+        domain.created_from = get("created_from")
+        domain.protection = get("protection")
+        domain.labels = intern_strings(get("labels"))
+        domain.status = intern_strings(get("status"))
+        return domain
+
+    @classmethod
+    def from_projection(cls, data, fields):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.name = get("name") if "name" in fields else None
+        domain.type = intern_strings(get("type")) if "type" in fields else None
+        domain.created = get("created") if "created" in fields else None
+        domain.description = get("description") if "description" in fields else None
+        domain.image_size = get("image_size") if "image_size" in fields else None
+        domain.disk_size = get("disk_size") if "disk_size" in fields else None
+        domain.deprecated = get("deprecated") if "deprecated" in fields else None
+        domain.bound_to = get("bound_to") if "bound_to" in fields else None
+        domain.os_flavor = intern_strings(get("os_flavor")) if "os_flavor" in fields else None
+        domain.os_version = intern_strings(get("os_version")) if "os_version" in fields else None
+        domain.rapid_deploy = get("rapid_deploy") if "rapid_deploy" in fields else None
+        domain.created_from = get("created_from") if "created_from" in fields else None
+        domain.protection = get("protection") if "protection" in fields else None
+        domain.labels = intern_strings(get("labels")) if "labels" in fields else None
+        domain.status = intern_strings(get("status")) if "status" in fields else None
+        return domain
+    # end of generated code
+
 
 class CreateImageResponse(BaseDomain):
     """Create Image Response Domain
@@ -106,15 +151,24 @@ class CreateImageResponse(BaseDomain):
     :param action: :class:`BoundAction <hcloud.actions.client.BoundAction>`
            The Action which shows the progress of the Floating IP Creation
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "action",
-        "image"
+        "image",
     )
 
     def __init__(
-            self,
-            action,  # type: BoundAction
-            image  # type: BoundImage
+        self,
+        action,  # type: BoundAction
+        image,  # type: BoundImage
     ):
         self.action = action
         self.image = image
+
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        domain.action = data["action"]
+        domain.image = data["image"]
+        return domain
+    # end of generated code
@@ -5,26 +5,39 @@ from hcloud.isos.domain import Iso
 
 
 class BoundIso(BoundModelBase):
+    __slots__ = ()
     model = Iso
 
 
 class IsosClient(ClientEntityBase, GetEntityByNameMixin):
     results_list_attribute_name = 'isos'
+    query_params = ('name',)
+    catalog_filters = {}
 
-    def get_by_id(self, id):
-        # type: (int) -> BoundIso
+    def get_by_id(self, id, raw=False, fields=None):
+        # type: (int, bool, Optional[List[str]]) -> BoundIso
         """Get a specific ISO by its id
 
         :param id: int
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundIso <hcloud.isos.client.BoundIso>`
         """
-        response = self._client.request(url="/isos/{iso_id}".format(iso_id=id), method="GET")
-        return BoundIso(self, response['iso'])
+        iso = self._from_catalog("id", id)
+        if iso is None:
+            iso = self._client.request(url="/isos/{iso_id}".format(iso_id=id), method="GET")['iso']
+        if raw:
+            return iso
+        return BoundIso(self, iso, fields=fields)
 
     def get_list(self,
                  name=None,      # type: Optional[str]
                  page=None,      # type: Optional[int]
                  per_page=None,  # type: Optional[int]
+                 raw=False,      # type: bool
+                 fields=None,    # type: Optional[List[str]]
                  ):
         # type: (...) -> PageResults[List[BoundIso], Meta]
         """Get a list of ISOs
@@ -35,6 +48,10 @@ class IsosClient(ClientEntityBase, GetEntityByNameMixin):
                Specifies the page to fetch
         :param per_page: int (optional)
                Specifies how many results are returned by page
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: (List[:class:`BoundIso <hcloud.isos.client.BoundIso>`], :class:`Meta <hcloud.core.domain.Meta>`)
         """
         params = {}
@@ -46,25 +63,53 @@ class IsosClient(ClientEntityBase, GetEntityByNameMixin):
             params['per_page'] = per_page
 
         response = self._client.request(url="/isos", method="GET", params=params)
-        isos = [BoundIso(self, iso_data) for iso_data in response['isos']]
+        if raw:
+            return self._add_meta_to_result(response['isos'], response)
+        isos = [BoundIso(self, iso_data, fields=fields) for iso_data in response['isos']]
         return self._add_meta_to_result(isos, response)
 
-    def get_all(self, name=None):
-        # type: (Optional[str]) -> List[BoundIso]
+    def get_all(self, name=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[PaginationCursor], bool, Optional[List[str]]) -> List[BoundIso]
         """Get all ISOs
 
         :param name: str (optional)
                Can be used to filter ISOs by their name.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: List[:class:`BoundIso <hcloud.isos.client.BoundIso>`]
         """
-        return super(IsosClient, self).get_all(name=name)
+        return super(IsosClient, self).get_all(name=name, resume_from=resume_from, raw=raw, fields=fields)
 
-    def get_by_name(self, name):
-        # type: (str) -> BoundIso
+    def iter_all(self, name=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[PaginationCursor], bool, Optional[List[str]]) -> PageIterator[BoundIso]
+        """Iterate over all ISOs, fetching the next page only when the current one is exhausted
+
+        :param name: str (optional)
+               Can be used to filter ISOs by their name.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
+        :return: PageIterator[:class:`BoundIso <hcloud.isos.client.BoundIso>`]
+        """
+        return super(IsosClient, self).iter_all(name=name, resume_from=resume_from, raw=raw, fields=fields)
+
+    def get_by_name(self, name, raw=False, fields=None):
+        # type: (str, bool, Optional[List[str]]) -> BoundIso
         """Get iso by name
 
         :param name: str
                Used to get iso by name.
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundIso <hcloud.isos.client.BoundIso>`
         """
-        return super(IsosClient, self).get_by_name(name)
+        return super(IsosClient, self).get_by_name(name, raw=raw, fields=fields)
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
-from dateutil.parser import isoparse
 
-from hcloud.core.domain import BaseDomain, DomainIdentityMixin
+from hcloud.core.domain import BaseDomain, DomainIdentityMixin, lazy_iso_datetimes
 
 
+@lazy_iso_datetimes("deprecated")
 class Iso(BaseDomain, DomainIdentityMixin):
     """Iso Domain
 
@@ -19,12 +19,13 @@ class Iso(BaseDomain, DomainIdentityMixin):
            ISO 8601 timestamp of deprecation, None if ISO is still available. After the deprecation time it will no longer be possible to attach the ISO to servers.
     """
 
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "id",
         "name",
         "type",
         "description",
-        "deprecated"
+        "deprecated",
     )
 
     def __init__(
@@ -39,4 +40,27 @@ class Iso(BaseDomain, DomainIdentityMixin):
         self.name = name
         self.type = type
         self.description = description
-        self.deprecated = isoparse(deprecated) if deprecated else None
+        self.deprecated = deprecated
+
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.name = get("name")
+        domain.type = get("type")
+        domain.description = get("description")
+        domain.deprecated = get("deprecated")
+        return domain
+
+    @classmethod
+    def from_projection(cls, data, fields):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.name = get("name") if "name" in fields else None
+        domain.type = get("type") if "type" in fields else None
+        domain.description = get("description") if "description" in fields else None
+        domain.deprecated = get("deprecated") if "deprecated" in fields else None
+        return domain
+    # end of generated code
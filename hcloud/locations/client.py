@@ -5,24 +5,35 @@ from hcloud.locations.domain import Location
 
 
 class BoundLocation(BoundModelBase):
+    __slots__ = ()
     model = Location
 
 
 class LocationsClient(ClientEntityBase, GetEntityByNameMixin):
     results_list_attribute_name = 'locations'
+    query_params = ('name',)
+    catalog_filters = {}
 
-    def get_by_id(self, id):
-        # type: (int) -> locations.client.BoundLocation
+    def get_by_id(self, id, raw=False, fields=None):
+        # type: (int, bool, Optional[List[str]]) -> locations.client.BoundLocation
         """Get a specific location by its ID.
 
         :param id: int
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundLocation <hcloud.locations.client.BoundLocation>`
         """
-        response = self._client.request(url="/locations/{location_id}".format(location_id=id), method="GET")
-        return BoundLocation(self, response['location'])
+        location = self._from_catalog("id", id)
+        if location is None:
+            location = self._client.request(url="/locations/{location_id}".format(location_id=id), method="GET")['location']
+        if raw:
+            return location
+        return BoundLocation(self, location, fields=fields)
 
-    def get_list(self, name=None, page=None, per_page=None):
-        # type: (Optional[str], Optional[int], Optional[int]) -> PageResult[List[BoundLocation], Meta]
+    def get_list(self, name=None, page=None, per_page=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[int], Optional[int], bool, Optional[List[str]]) -> PageResult[List[BoundLocation], Meta]
         """Get a list of locations
 
         :param name: str (optional)
@@ -31,6 +42,10 @@ class LocationsClient(ClientEntityBase, GetEntityByNameMixin):
                Specifies the page to fetch
         :param per_page: int (optional)
                Specifies how many results are returned by page
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: (List[:class:`BoundLocation <hcloud.locations.client.BoundLocation>`], :class:`Meta <hcloud.core.domain.Meta>`)
         """
         params = {}
@@ -42,25 +57,53 @@ class LocationsClient(ClientEntityBase, GetEntityByNameMixin):
             params["per_page"] = per_page
 
         response = self._client.request(url="/locations", method="GET", params=params)
-        locations = [BoundLocation(self, location_data) for location_data in response['locations']]
+        if raw:
+            return self._add_meta_to_result(response['locations'], response)
+        locations = [BoundLocation(self, location_data, fields=fields) for location_data in response['locations']]
         return self._add_meta_to_result(locations, response)
 
-    def get_all(self, name=None):
-        # type: (Optional[str]) -> List[BoundLocation]
+    def get_all(self, name=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[PaginationCursor], bool, Optional[List[str]]) -> List[BoundLocation]
         """Get all locations
 
         :param name: str (optional)
                Can be used to filter locations by their name.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: List[:class:`BoundLocation <hcloud.locations.client.BoundLocation>`]
         """
-        return super(LocationsClient, self).get_all(name=name)
+        return super(LocationsClient, self).get_all(name=name, resume_from=resume_from, raw=raw, fields=fields)
 
-    def get_by_name(self, name):
-        # type: (str) -> BoundLocation
+    def iter_all(self, name=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[PaginationCursor], bool, Optional[List[str]]) -> PageIterator[BoundLocation]
+        """Iterate over all locations, fetching the next page only when the current one is exhausted
+
+        :param name: str (optional)
+               Can be used to filter locations by their name.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
+        :return: PageIterator[:class:`BoundLocation <hcloud.locations.client.BoundLocation>`]
+        """
+        return super(LocationsClient, self).iter_all(name=name, resume_from=resume_from, raw=raw, fields=fields)
+
+    def get_by_name(self, name, raw=False, fields=None):
+        # type: (str, bool, Optional[List[str]]) -> BoundLocation
         """Get location by name
 
         :param name: str
                Used to get location by name.
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundLocation <hcloud.locations.client.BoundLocation>`
         """
-        return super(LocationsClient, self).get_by_name(name)
+        return super(LocationsClient, self).get_by_name(name, raw=raw, fields=fields)
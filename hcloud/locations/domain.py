@@ -23,6 +23,7 @@ class Location(BaseDomain, DomainIdentityMixin):
            Name of network zone this location resides in
     """
 
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "id",
         "name",
@@ -31,19 +32,19 @@ class Location(BaseDomain, DomainIdentityMixin):
         "city",
         "latitude",
         "longitude",
-        "network_zone"
+        "network_zone",
     )
 
     def __init__(
-            self,
-            id=None,
-            name=None,
-            description=None,
-            country=None,
-            city=None,
-            latitude=None,
-            longitude=None,
-            network_zone=None,
+        self,
+        id=None,
+        name=None,
+        description=None,
+        country=None,
+        city=None,
+        latitude=None,
+        longitude=None,
+        network_zone=None,
     ):
         self.id = id
         self.name = name
@@ -53,3 +54,32 @@ class Location(BaseDomain, DomainIdentityMixin):
         self.latitude = latitude
         self.longitude = longitude
         self.network_zone = network_zone
+
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.name = get("name")
+        domain.description = get("description")
+        domain.country = get("country")
+        domain.city = get("city")
+        domain.latitude = get("latitude")
+        domain.longitude = get("longitude")
+        domain.network_zone = get("network_zone")
+        return domain
+
+    @classmethod
+    def from_projection(cls, data, fields):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.name = get("name") if "name" in fields else None
+        domain.description = get("description") if "description" in fields else None
+        domain.country = get("country") if "country" in fields else None
+        domain.city = get("city") if "city" in fields else None
+        domain.latitude = get("latitude") if "latitude" in fields else None
+        domain.longitude = get("longitude") if "longitude" in fields else None
+        domain.network_zone = get("network_zone") if "network_zone" in fields else None
+        return domain
+    # end of generated code
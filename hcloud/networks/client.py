@@ -7,26 +7,28 @@ from hcloud.networks.domain import Network, NetworkRoute, NetworkSubnet
 
 
 class BoundNetwork(BoundModelBase):
+    __slots__ = ()
     model = Network
 
-    def __init__(self, client, data, complete=True):
-        subnets = data.get("subnets", [])
-        if subnets is not None:
-            subnets = [NetworkSubnet.from_dict(subnet) for subnet in subnets]
-            data['subnets'] = subnets
+    def _hydrate_subnets(self, subnets):
+        return [NetworkSubnet.from_dict(subnet) for subnet in subnets or []]
 
-        routes = data.get("routes", [])
-        if routes is not None:
-            routes = [NetworkRoute.from_dict(route) for route in routes]
-            data['routes'] = routes
+    def _hydrate_routes(self, routes):
+        return [NetworkRoute.from_dict(route) for route in routes or []]
 
+    def _hydrate_servers(self, servers):
         from hcloud.servers.client import BoundServer
-        servers = data.get("servers", [])
-        if servers is not None:
-            servers = [BoundServer(client._client.servers, {"id": server}, complete=False) for server in servers]
-            data['servers'] = servers
+        return [BoundServer(self._client._client.servers, {"id": server}, complete=False) for server in servers or []]
 
-        super(BoundNetwork, self).__init__(client, data, complete)
+    _hydrators = {
+        "subnets": _hydrate_subnets,
+        "routes": _hydrate_routes,
+        "servers": _hydrate_servers,
+    }
+
+    _expandable = {
+        "servers": ("servers", lambda network: network.servers),
+    }
 
     def update(self, name=None, labels=None):
         # type: (Optional[str], Optional[Dict[str, str]]) -> BoundNetwork
@@ -64,17 +66,33 @@ class BoundNetwork(BoundModelBase):
         """
         return self._client.get_actions_list(self, status, sort, page, per_page)
 
-    def get_actions(self, status=None, sort=None):
-        # type: (Optional[List[str]], Optional[List[str]]) -> List[BoundAction]
+    def get_actions(self, status=None, sort=None, resume_from=None):
+        # type: (Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> List[BoundAction]
         """Returns all action objects for a network.
 
         :param status: List[str] (optional)
                Response will have only actions with specified statuses. Choices: `running` `success` `error`
         :param sort: List[str] (optional)
                Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
         :return: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
         """
-        return self._client.get_actions(self, status, sort)
+        return self._client.get_actions(self, status, sort, resume_from=resume_from)
+
+    def iter_actions(self, status=None, sort=None, resume_from=None):
+        # type: (Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> PageIterator[BoundAction]
+        """Iterate over all action objects for a network, fetching the next page only when the current one is exhausted.
+
+        :param status: List[str] (optional)
+               Response will have only actions with specified statuses. Choices: `running` `success` `error`
+        :param sort: List[str] (optional)
+               Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :return: PageIterator[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+        """
+        return self._client.iter_actions(self, status, sort, resume_from=resume_from)
 
     def add_subnet(self, subnet):
         # type: (NetworkSubnet) -> List[BoundAction]
@@ -139,18 +157,25 @@ class BoundNetwork(BoundModelBase):
 
 class NetworksClient(ClientEntityBase, GetEntityByNameMixin):
     results_list_attribute_name = "networks"
+    query_params = ("name", "label_selector")
 
-    def get_by_id(self, id):
-        # type: (int) -> BoundNetwork
+    def get_by_id(self, id, raw=False, fields=None):
+        # type: (int, bool, Optional[List[str]]) -> BoundNetwork
         """Get a specific network
 
         :param id: int
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundNetwork <hcloud.networks.client.BoundNetwork>
         """
         response = self._client.request(
             url="/networks/{network_id}".format(network_id=id), method="GET"
         )
-        return BoundNetwork(self, response["network"])
+        if raw:
+            return response["network"]
+        return BoundNetwork(self, response["network"], fields=fields)
 
     def get_list(
             self,
@@ -158,6 +183,9 @@ class NetworksClient(ClientEntityBase, GetEntityByNameMixin):
             label_selector=None,  # type: Optional[str]
             page=None,  # type: Optional[int]
             per_page=None,  # type: Optional[int]
+            raw=False,  # type: bool
+            expand=None,  # type: Optional[List[str]]
+            fields=None,  # type: Optional[List[str]]
     ):
         # type: (...) -> PageResults[List[BoundNetwork], Meta]
         """Get a list of networks from this account
@@ -170,6 +198,12 @@ class NetworksClient(ClientEntityBase, GetEntityByNameMixin):
                Specifies the page to fetch
         :param per_page: int (optional)
                Specifies how many results are returned by page
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param expand: List[str] (optional)
+               Fields whose placeholder models are completed with one list call per resource type. Choices: servers
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: (List[:class:`BoundNetwork <hcloud.networks.client.BoundNetwork>`], :class:`Meta <hcloud.core.domain.Meta>`)
         """
         params = {}
@@ -183,35 +217,70 @@ class NetworksClient(ClientEntityBase, GetEntityByNameMixin):
             params["per_page"] = per_page
 
         response = self._client.request(url="/networks", method="GET", params=params)
+        if raw:
+            return self._add_meta_to_result(response["networks"], response)
 
         ass_networks = [
-            BoundNetwork(self, network_data) for network_data in response["networks"]
+            BoundNetwork(self, network_data, fields=fields) for network_data in response["networks"]
         ]
+        self._expand(ass_networks, expand)
         return self._add_meta_to_result(ass_networks, response)
 
-    def get_all(self, name=None, label_selector=None):
-        # type: (Optional[str], Optional[str]) -> List[BoundNetwork]
+    def get_all(self, name=None, label_selector=None, resume_from=None, raw=False, expand=None, fields=None):
+        # type: (Optional[str], Optional[str], Optional[PaginationCursor], bool, Optional[List[str]], Optional[List[str]]) -> List[BoundNetwork]
         """Get all networks from this account
 
         :param name: str (optional)
                Can be used to filter networks by their name.
         :param label_selector: str (optional)
                Can be used to filter networks by labels. The response will only contain networks matching the label selector.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param expand: List[str] (optional)
+               Fields whose placeholder models are completed with one list call per resource type. Choices: servers
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: List[:class:`BoundNetwork <hcloud.networks.client.BoundNetwork>`]
         """
         return super(NetworksClient, self).get_all(
-            name=name, label_selector=label_selector
+            name=name, label_selector=label_selector, resume_from=resume_from, raw=raw, expand=expand, fields=fields
+        )
+
+    def iter_all(self, name=None, label_selector=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[str], Optional[PaginationCursor], bool, Optional[List[str]]) -> PageIterator[BoundNetwork]
+        """Iterate over all networks from this account, fetching the next page only when the current one is exhausted
+
+        :param name: str (optional)
+               Can be used to filter networks by their name.
+        :param label_selector: str (optional)
+               Can be used to filter networks by labels. The response will only contain networks matching the label selector.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
+        :return: PageIterator[:class:`BoundNetwork <hcloud.networks.client.BoundNetwork>`]
+        """
+        return super(NetworksClient, self).iter_all(
+            name=name, label_selector=label_selector, resume_from=resume_from, raw=raw, fields=fields
         )
 
-    def get_by_name(self, name):
-        # type: (str) -> BoundNetwork
+    def get_by_name(self, name, raw=False, fields=None):
+        # type: (str, bool, Optional[List[str]]) -> BoundNetwork
         """Get network by name
 
         :param name: str
                Used to get network by name.
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundNetwork <hcloud.networks.client.BoundNetwork>`
         """
-        return super(NetworksClient, self).get_by_name(name)
+        return super(NetworksClient, self).get_by_name(name, raw=raw, fields=fields)
 
     def create(
             self,
@@ -321,8 +390,8 @@ class NetworksClient(ClientEntityBase, GetEntityByNameMixin):
         ]
         return add_meta_to_result(actions, response, "actions")
 
-    def get_actions(self, network, status=None, sort=None):
-        # type: (Network, Optional[List[str]], Optional[List[str]]) -> List[BoundAction]
+    def get_actions(self, network, status=None, sort=None, resume_from=None):
+        # type: (Network, Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> List[BoundAction]
         """Returns all action objects for a network.
 
         :param network: :class:`BoundNetwork <hcloud.networks.client.BoundNetwork>` or :class:`Network <hcloud.networks.domain.Network>`
@@ -330,10 +399,29 @@ class NetworksClient(ClientEntityBase, GetEntityByNameMixin):
                Response will have only actions with specified statuses. Choices: `running` `success` `error`
         :param sort: List[str] (optional)
                Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
         :return: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
         """
         return super(NetworksClient, self).get_actions(
-            network, status=status, sort=sort
+            network, status=status, sort=sort, resume_from=resume_from
+        )
+
+    def iter_actions(self, network, status=None, sort=None, resume_from=None):
+        # type: (Network, Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> PageIterator[BoundAction]
+        """Iterate over all action objects for a network, fetching the next page only when the current one is exhausted.
+
+        :param network: :class:`BoundNetwork <hcloud.networks.client.BoundNetwork>` or :class:`Network <hcloud.networks.domain.Network>`
+        :param status: List[str] (optional)
+               Response will have only actions with specified statuses. Choices: `running` `success` `error`
+        :param sort: List[str] (optional)
+               Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :return: PageIterator[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+        """
+        return super(NetworksClient, self).iter_actions(
+            network, status=status, sort=sort, resume_from=resume_from
         )
 
     def add_subnet(self, network, subnet):
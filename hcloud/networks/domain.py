@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
-from dateutil.parser import isoparse
 
-from hcloud.core.domain import BaseDomain
+from hcloud.core.domain import BaseDomain, intern_strings, lazy_iso_datetimes
 
 
+@lazy_iso_datetimes("created")
 class Network(BaseDomain):
     """Network Domain
 
@@ -25,33 +25,34 @@ class Network(BaseDomain):
            User-defined labels (key-value pairs)
     """
 
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "id",
         "name",
+        "created",
         "ip_range",
         "subnets",
         "routes",
         "servers",
         "protection",
         "labels",
-        "created"
     )
 
     def __init__(
-            self,
-            id,
-            name=None,
-            created=None,
-            ip_range=None,
-            subnets=None,
-            routes=None,
-            servers=None,
-            protection=None,
-            labels=None,
+        self,
+        id,
+        name=None,
+        created=None,
+        ip_range=None,
+        subnets=None,
+        routes=None,
+        servers=None,
+        protection=None,
+        labels=None,
     ):
         self.id = id
         self.name = name
-        self.created = isoparse(created) if created else None
+        self.created = created
         self.ip_range = ip_range
         self.subnets = subnets
         self.routes = routes
@@ -59,6 +60,37 @@ class Network(BaseDomain):
         self.protection = protection
         self.labels = labels
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = data["id"]
+        domain.name = get("name")
+        domain.created = get("created")
+        domain.ip_range = get("ip_range")
+        domain.subnets = get("subnets")
+        domain.routes = get("routes")
+        domain.servers = get("servers")
+        domain.protection = get("protection")
+        domain.labels = intern_strings(get("labels"))
+        return domain
+
+    @classmethod
+    def from_projection(cls, data, fields):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = data["id"]
+        domain.name = get("name") if "name" in fields else None
+        domain.created = get("created") if "created" in fields else None
+        domain.ip_range = get("ip_range") if "ip_range" in fields else None
+        domain.subnets = get("subnets") if "subnets" in fields else None
+        domain.routes = get("routes") if "routes" in fields else None
+        domain.servers = get("servers") if "servers" in fields else None
+        domain.protection = get("protection") if "protection" in fields else None
+        domain.labels = intern_strings(get("labels")) if "labels" in fields else None
+        return domain
+    # end of generated code
+
 
 class NetworkSubnet(BaseDomain):
     """Network Subnet Domain
@@ -72,14 +104,37 @@ class NetworkSubnet(BaseDomain):
     :param gateway: str
               Gateway for the route.
     """
-    __slots__ = ("type", "ip_range", "network_zone", "gateway")
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
+    __slots__ = (
+        "ip_range",
+        "type",
+        "network_zone",
+        "gateway",
+    )
 
-    def __init__(self, ip_range, type=None, network_zone=None, gateway=None):
-        self.type = type
+    def __init__(
+        self,
+        ip_range,
+        type=None,
+        network_zone=None,
+        gateway=None,
+    ):
         self.ip_range = ip_range
+        self.type = type
         self.network_zone = network_zone
         self.gateway = gateway
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.ip_range = data["ip_range"]
+        domain.type = get("type")
+        domain.network_zone = get("network_zone")
+        domain.gateway = get("gateway")
+        return domain
+    # end of generated code
+
 
 class NetworkRoute(BaseDomain):
     """Network Route Domain
@@ -90,12 +145,28 @@ class NetworkRoute(BaseDomain):
            Gateway for the route.
     """
 
-    __slots__ = ("destination", "gateway")
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
+    __slots__ = (
+        "destination",
+        "gateway",
+    )
 
-    def __init__(self, destination, gateway):
+    def __init__(
+        self,
+        destination,
+        gateway,
+    ):
         self.destination = destination
         self.gateway = gateway
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        domain.destination = data["destination"]
+        domain.gateway = data["gateway"]
+        return domain
+    # end of generated code
+
 
 class CreateNetworkResponse(BaseDomain):
     """Create Network Response Domain
@@ -106,12 +177,24 @@ class CreateNetworkResponse(BaseDomain):
            The Action which shows the progress of the network Creation
     """
 
-    __slots__ = ("network", "action")
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
+    __slots__ = (
+        "network",
+        "action",
+    )
 
     def __init__(
-            self,
-            network,  # type: BoundNetwork
-            action  # type: BoundAction
+        self,
+        network,  # type: BoundNetwork
+        action,  # type: BoundAction
     ):
         self.network = network
         self.action = action
+
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        domain.network = data["network"]
+        domain.action = data["action"]
+        return domain
+    # end of generated code
@@ -3,24 +3,35 @@ from hcloud.server_types.domain import ServerType
 
 
 class BoundServerType(BoundModelBase):
+    __slots__ = ()
     model = ServerType
 
 
 class ServerTypesClient(ClientEntityBase, GetEntityByNameMixin):
     results_list_attribute_name = 'server_types'
+    query_params = ('name',)
+    catalog_filters = {}
 
-    def get_by_id(self, id):
-        # type: (int) -> server_types.client.BoundServerType
+    def get_by_id(self, id, raw=False, fields=None):
+        # type: (int, bool, Optional[List[str]]) -> server_types.client.BoundServerType
         """Returns a specific Server Type.
 
         :param id: int
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundServerType <hcloud.server_types.client.BoundServerType>`
         """
-        response = self._client.request(url="/server_types/{server_type_id}".format(server_type_id=id), method="GET")
-        return BoundServerType(self, response['server_type'])
+        server_type = self._from_catalog("id", id)
+        if server_type is None:
+            server_type = self._client.request(url="/server_types/{server_type_id}".format(server_type_id=id), method="GET")['server_type']
+        if raw:
+            return server_type
+        return BoundServerType(self, server_type, fields=fields)
 
-    def get_list(self, name=None, page=None, per_page=None):
-        # type: (Optional[str], Optional[int], Optional[int]) -> PageResults[List[BoundServerType], Meta]
+    def get_list(self, name=None, page=None, per_page=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[int], Optional[int], bool, Optional[List[str]]) -> PageResults[List[BoundServerType], Meta]
         """Get a list of Server types
 
         :param name: str (optional)
@@ -29,6 +40,10 @@ class ServerTypesClient(ClientEntityBase, GetEntityByNameMixin):
                Specifies the page to fetch
         :param per_page: int (optional)
                Specifies how many results are returned by page
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: (List[:class:`BoundServerType <hcloud.server_types.client.BoundServerType>`], :class:`Meta <hcloud.core.domain.Meta>`)
         """
         params = {}
@@ -40,25 +55,53 @@ class ServerTypesClient(ClientEntityBase, GetEntityByNameMixin):
             params['per_page'] = per_page
 
         response = self._client.request(url="/server_types", method="GET", params=params)
-        server_types = [BoundServerType(self, server_type_data) for server_type_data in response['server_types']]
+        if raw:
+            return self._add_meta_to_result(response['server_types'], response)
+        server_types = [BoundServerType(self, server_type_data, fields=fields) for server_type_data in response['server_types']]
         return self._add_meta_to_result(server_types, response)
 
-    def get_all(self, name=None):
-        # type: (Optional[str]) -> List[BoundServerType]
+    def get_all(self, name=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[PaginationCursor], bool, Optional[List[str]]) -> List[BoundServerType]
         """Get all Server types
 
         :param name: str (optional)
                Can be used to filter server type by their name.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: List[:class:`BoundServerType <hcloud.server_types.client.BoundServerType>`]
         """
-        return super(ServerTypesClient, self).get_all(name=name)
+        return super(ServerTypesClient, self).get_all(name=name, resume_from=resume_from, raw=raw, fields=fields)
 
-    def get_by_name(self, name):
-        # type: (str) -> BoundServerType
+    def iter_all(self, name=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[PaginationCursor], bool, Optional[List[str]]) -> PageIterator[BoundServerType]
+        """Iterate over all Server types, fetching the next page only when the current one is exhausted
+
+        :param name: str (optional)
+               Can be used to filter server type by their name.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
+        :return: PageIterator[:class:`BoundServerType <hcloud.server_types.client.BoundServerType>`]
+        """
+        return super(ServerTypesClient, self).iter_all(name=name, resume_from=resume_from, raw=raw, fields=fields)
+
+    def get_by_name(self, name, raw=False, fields=None):
+        # type: (str, bool, Optional[List[str]]) -> BoundServerType
         """Get Server type by name
 
         :param name: str
                Used to get Server type by name.
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundServerType <hcloud.server_types.client.BoundServerType>`
         """
-        return super(ServerTypesClient, self).get_by_name(name)
+        return super(ServerTypesClient, self).get_by_name(name, raw=raw, fields=fields)
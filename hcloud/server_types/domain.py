@@ -26,6 +26,7 @@ class ServerType(BaseDomain, DomainIdentityMixin):
     :param deprecated: bool
            True if server type is deprecated
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "id",
         "name",
@@ -36,7 +37,7 @@ class ServerType(BaseDomain, DomainIdentityMixin):
         "prices",
         "storage_type",
         "cpu_type",
-        "deprecated"
+        "deprecated",
     )
 
     def __init__(
@@ -50,7 +51,7 @@ class ServerType(BaseDomain, DomainIdentityMixin):
         prices=None,
         storage_type=None,
         cpu_type=None,
-        deprecated=None
+        deprecated=None,
     ):
         self.id = id
         self.name = name
@@ -62,3 +63,36 @@ class ServerType(BaseDomain, DomainIdentityMixin):
         self.storage_type = storage_type
         self.cpu_type = cpu_type
         self.deprecated = deprecated
+
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.name = get("name")
+        domain.description = get("description")
+        domain.cores = get("cores")
+        domain.memory = get("memory")
+        domain.disk = get("disk")
+        domain.prices = get("prices")
+        domain.storage_type = get("storage_type")
+        domain.cpu_type = get("cpu_type")
+        domain.deprecated = get("deprecated")
+        return domain
+
+    @classmethod
+    def from_projection(cls, data, fields):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.name = get("name") if "name" in fields else None
+        domain.description = get("description") if "description" in fields else None
+        domain.cores = get("cores") if "cores" in fields else None
+        domain.memory = get("memory") if "memory" in fields else None
+        domain.disk = get("disk") if "disk" in fields else None
+        domain.prices = get("prices") if "prices" in fields else None
+        domain.storage_type = get("storage_type") if "storage_type" in fields else None
+        domain.cpu_type = get("cpu_type") if "cpu_type" in fields else None
+        domain.deprecated = get("deprecated") if "deprecated" in fields else None
+        return domain
+    # end of generated code
@@ -2,7 +2,7 @@
 from hcloud.core.client import ClientEntityBase, BoundModelBase, GetEntityByNameMixin
 
 from hcloud.actions.client import BoundAction
-from hcloud.core.domain import add_meta_to_result
+from hcloud.core.domain import add_meta_to_result, shared_values
 from hcloud.floating_ips.client import BoundFloatingIP
 from hcloud.isos.client import BoundIso
 from hcloud.servers.domain import Server, CreateServerResponse, ResetPasswordResponse, EnableRescueResponse, \
@@ -17,45 +17,67 @@ from hcloud.networks.domain import Network  # noqa
 
 
 class BoundServer(BoundModelBase):
+    __slots__ = ()
     model = Server
 
-    def __init__(self, client, data, complete=True):
-
-        datacenter = data.get('datacenter')
-        if datacenter is not None:
-            data['datacenter'] = BoundDatacenter(client._client.datacenters, datacenter)
-
-        volumes = data.get('volumes', [])
-        if volumes:
-            volumes = [BoundVolume(client._client.volumes, {"id": volume}, complete=False) for volume in volumes]
-            data['volumes'] = volumes
-
-        image = data.get("image", None)
-        if image is not None:
-            data['image'] = BoundImage(client._client.images, image)
-
-        iso = data.get("iso", None)
-        if iso is not None:
-            data['iso'] = BoundIso(client._client.isos, iso)
-
-        server_type = data.get("server_type")
-        if server_type is not None:
-            data['server_type'] = BoundServerType(client._client.server_types, server_type)
-
-        public_net = data.get("public_net")
-        if public_net:
-            ipv4_address = IPv4Address(**public_net['ipv4'])
-            ipv6_network = IPv6Network(**public_net['ipv6'])
-            floating_ips = [BoundFloatingIP(client._client.floating_ips, {"id": floating_ip}, complete=False) for
-                            floating_ip in public_net['floating_ips']]
-            data['public_net'] = PublicNetwork(ipv4=ipv4_address, ipv6=ipv6_network, floating_ips=floating_ips)
-
-        private_nets = data.get("private_net")
-        if private_nets:
-            private_nets = [PrivateNet(network=BoundNetwork(client._client.networks, {"id": private_net['network']}, complete=False), ip=private_net['ip'], alias_ips=private_net['alias_ips'], mac_address=private_net['mac_address']) for private_net in private_nets]
-            data['private_net'] = private_nets
-
-        super(BoundServer, self).__init__(client, data, complete)
+    def _hydrate_datacenter(self, datacenter):
+        if datacenter is None:
+            return None
+        return BoundDatacenter._shared(self._client._client.datacenters, datacenter)
+
+    def _hydrate_volumes(self, volumes):
+        if not volumes:
+            return volumes
+        return [BoundVolume(self._client._client.volumes, {"id": volume}, complete=False) for volume in volumes]
+
+    def _hydrate_image(self, image):
+        if image is None:
+            return None
+        return BoundImage._shared(self._client._client.images, image)
+
+    def _hydrate_iso(self, iso):
+        if iso is None:
+            return None
+        return BoundIso._shared(self._client._client.isos, iso)
+
+    def _hydrate_server_type(self, server_type):
+        if server_type is None:
+            return None
+        return BoundServerType._shared(self._client._client.server_types, server_type)
+
+    def _hydrate_public_net(self, public_net):
+        if not public_net:
+            return public_net
+        ipv4_address = IPv4Address.from_dict(public_net['ipv4'])
+        ipv6_network = IPv6Network(**public_net['ipv6'])
+        floating_ips = [BoundFloatingIP(self._client._client.floating_ips, {"id": floating_ip}, complete=False) for
+                        floating_ip in public_net['floating_ips']]
+        return PublicNetwork(ipv4=ipv4_address, ipv6=ipv6_network, floating_ips=floating_ips)
+
+    def _hydrate_private_net(self, private_nets):
+        if not private_nets:
+            return private_nets
+        return [PrivateNet(network=BoundNetwork(self._client._client.networks, {"id": private_net['network']}, complete=False),
+                           ip=private_net['ip'],
+                           alias_ips=private_net['alias_ips'],
+                           mac_address=private_net['mac_address'])
+                for private_net in private_nets]
+
+    _hydrators = {
+        "datacenter": _hydrate_datacenter,
+        "volumes": _hydrate_volumes,
+        "image": _hydrate_image,
+        "iso": _hydrate_iso,
+        "server_type": _hydrate_server_type,
+        "public_net": _hydrate_public_net,
+        "private_net": _hydrate_private_net,
+    }
+
+    _expandable = {
+        "volumes": ("volumes", lambda server: server.volumes or []),
+        "floating_ips": ("public_net", lambda server: server.public_net.floating_ips if server.public_net else []),
+        "networks": ("private_net", lambda server: [private_net.network for private_net in server.private_net or []]),
+    }
 
     def get_actions_list(self, status=None, sort=None, page=None, per_page=None):
         # type: (Optional[List[str]], Optional[List[str]], Optional[int], Optional[int]) -> PageResults[List[BoundAction, Meta]]
@@ -73,17 +95,33 @@ class BoundServer(BoundModelBase):
         """
         return self._client.get_actions_list(self, status, sort, page, per_page)
 
-    def get_actions(self, status=None, sort=None):
-        # type: (Optional[List[str]], Optional[List[str]]) -> List[BoundAction]
+    def get_actions(self, status=None, sort=None, resume_from=None):
+        # type: (Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> List[BoundAction]
         """Returns all action objects for a server.
 
         :param status: List[str] (optional)
                Response will have only actions with specified statuses. Choices: `running` `success` `error`
         :param sort: List[str] (optional)
                Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
         :return: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
         """
-        return self._client.get_actions(self, status, sort)
+        return self._client.get_actions(self, status, sort, resume_from=resume_from)
+
+    def iter_actions(self, status=None, sort=None, resume_from=None):
+        # type: (Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> PageIterator[BoundAction]
+        """Iterate over all action objects for a server, fetching the next page only when the current one is exhausted.
+
+        :param status: List[str] (optional)
+               Response will have only actions with specified statuses. Choices: `running` `success` `error`
+        :param sort: List[str] (optional)
+               Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :return: PageIterator[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+        """
+        return self._client.iter_actions(self, status, sort, resume_from=resume_from)
 
     def update(self, name=None, labels=None):
         # type: (Optional[str], Optional[Dict[str, str]]) -> BoundServer
@@ -312,16 +350,23 @@ class BoundServer(BoundModelBase):
 
 class ServersClient(ClientEntityBase, GetEntityByNameMixin):
     results_list_attribute_name = 'servers'
+    query_params = ('name', 'label_selector', 'status')
 
-    def get_by_id(self, id):
-        # type: (int) -> BoundServer
+    def get_by_id(self, id, raw=False, fields=None):
+        # type: (int, bool, Optional[List[str]]) -> BoundServer
         """Get a specific server
 
         :param id: int
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundServer <hcloud.servers.client.BoundServer>`
         """
         response = self._client.request(url="/servers/{server_id}".format(server_id=id), method="GET")
-        return BoundServer(self, response['server'])
+        if raw:
+            return response['server']
+        return BoundServer(self, response['server'], fields=fields)
 
     def get_list(self,
                  name=None,  # type: Optional[str]
@@ -329,6 +374,9 @@ class ServersClient(ClientEntityBase, GetEntityByNameMixin):
                  page=None,  # type: Optional[int]
                  per_page=None,  # type: Optional[int]
                  status=None,  # type: Optional[List[str]]
+                 raw=False,  # type: bool
+                 expand=None,  # type: Optional[List[str]]
+                 fields=None,  # type: Optional[List[str]]
                  ):
         # type: (...) -> PageResults[List[BoundServer], Meta]
         """Get a list of servers from this account
@@ -343,6 +391,12 @@ class ServersClient(ClientEntityBase, GetEntityByNameMixin):
                Specifies the page to fetch
         :param per_page: int (optional)
                Specifies how many results are returned by page
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param expand: List[str] (optional)
+               Fields whose placeholder models are completed with one list call per resource type. Choices: volumes, floating_ips, networks
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: (List[:class:`BoundServer <hcloud.servers.client.BoundServer>`], :class:`Meta <hcloud.core.domain.Meta>`)
         """
         params = {}
@@ -358,12 +412,16 @@ class ServersClient(ClientEntityBase, GetEntityByNameMixin):
             params['per_page'] = per_page
 
         response = self._client.request(url="/servers", method="GET", params=params)
+        if raw:
+            return self._add_meta_to_result(response['servers'], response)
 
-        ass_servers = [BoundServer(self, server_data) for server_data in response['servers']]
+        with shared_values.scope():
+            ass_servers = [BoundServer(self, server_data, fields=fields) for server_data in response['servers']]
+        self._expand(ass_servers, expand)
         return self._add_meta_to_result(ass_servers, response)
 
-    def get_all(self, name=None, label_selector=None, status=None):
-        # type: (Optional[str], Optional[str], Optional[List[str]]) -> List[BoundServer]
+    def get_all(self, name=None, label_selector=None, status=None, resume_from=None, raw=False, expand=None, fields=None):
+        # type: (Optional[str], Optional[str], Optional[List[str]], Optional[PaginationCursor], bool, Optional[List[str]], Optional[List[str]]) -> List[BoundServer]
         """Get all servers from this account
 
         :param name: str (optional)
@@ -372,19 +430,51 @@ class ServersClient(ClientEntityBase, GetEntityByNameMixin):
                Can be used to filter servers by labels. The response will only contain servers matching the label selector.
         :param status: List[str] (optional)
                Can be used to filter servers by their status. The response will only contain servers matching the status.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param expand: List[str] (optional)
+               Fields whose placeholder models are completed with one list call per resource type. Choices: volumes, floating_ips, networks
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: List[:class:`BoundServer <hcloud.servers.client.BoundServer>`]
         """
-        return super(ServersClient, self).get_all(name=name, label_selector=label_selector, status=status)
+        return super(ServersClient, self).get_all(name=name, label_selector=label_selector, status=status, resume_from=resume_from, raw=raw, expand=expand, fields=fields)
+
+    def iter_all(self, name=None, label_selector=None, status=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[str], Optional[List[str]], Optional[PaginationCursor], bool, Optional[List[str]]) -> PageIterator[BoundServer]
+        """Iterate over all servers from this account, fetching the next page only when the current one is exhausted
 
-    def get_by_name(self, name):
-        # type: (str) -> BoundServer
+        :param name: str (optional)
+               Can be used to filter servers by their name.
+        :param label_selector: str (optional)
+               Can be used to filter servers by labels. The response will only contain servers matching the label selector.
+        :param status: List[str] (optional)
+               Can be used to filter servers by their status. The response will only contain servers matching the status.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
+        :return: PageIterator[:class:`BoundServer <hcloud.servers.client.BoundServer>`]
+        """
+        return super(ServersClient, self).iter_all(name=name, label_selector=label_selector, status=status, resume_from=resume_from, raw=raw, fields=fields)
+
+    def get_by_name(self, name, raw=False, fields=None):
+        # type: (str, bool, Optional[List[str]]) -> BoundServer
         """Get server by name
 
         :param name: str
                Used to get server by name.
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundServer <hcloud.servers.client.BoundServer>`
         """
-        return super(ServersClient, self).get_by_name(name)
+        return super(ServersClient, self).get_by_name(name, raw=raw, fields=fields)
 
     def create(self,
                name,  # type: str
@@ -486,8 +576,8 @@ class ServersClient(ClientEntityBase, GetEntityByNameMixin):
         actions = [BoundAction(self._client.actions, action_data) for action_data in response['actions']]
         return add_meta_to_result(actions, response, 'actions')
 
-    def get_actions(self, server, status=None, sort=None):
-        # type: (Server, Optional[List[str]], Optional[List[str]]) -> List[BoundAction]
+    def get_actions(self, server, status=None, sort=None, resume_from=None):
+        # type: (Server, Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> List[BoundAction]
         """Returns all action objects for a server.
 
         :param server: :class:`BoundServer <hcloud.servers.client.BoundServer>` or :class:`Server <hcloud.servers.domain.Server>`
@@ -495,9 +585,26 @@ class ServersClient(ClientEntityBase, GetEntityByNameMixin):
                Response will have only actions with specified statuses. Choices: `running` `success` `error`
         :param sort: List[str] (optional)
                Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
         :return: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
         """
-        return super(ServersClient, self).get_actions(server, status=status, sort=sort)
+        return super(ServersClient, self).get_actions(server, status=status, sort=sort, resume_from=resume_from)
+
+    def iter_actions(self, server, status=None, sort=None, resume_from=None):
+        # type: (Server, Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> PageIterator[BoundAction]
+        """Iterate over all action objects for a server, fetching the next page only when the current one is exhausted.
+
+        :param server: :class:`BoundServer <hcloud.servers.client.BoundServer>` or :class:`Server <hcloud.servers.domain.Server>`
+        :param status: List[str] (optional)
+               Response will have only actions with specified statuses. Choices: `running` `success` `error`
+        :param sort: List[str] (optional)
+               Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :return: PageIterator[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+        """
+        return super(ServersClient, self).iter_actions(server, status=status, sort=sort, resume_from=resume_from)
 
     def update(self, server, name=None, labels=None):
         # type:(Server,  Optional[str],  Optional[Dict[str, str]]) -> BoundServer
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
-from dateutil.parser import isoparse
 
-from hcloud.core.domain import BaseDomain
+from hcloud.core.domain import BaseDomain, intern_strings, lazy_iso_datetimes, shared_values
 
 
+@lazy_iso_datetimes("created")
 class Server(BaseDomain):
     """Server Domain
 
@@ -60,10 +60,12 @@ class Server(BaseDomain):
     """Server Status rebuilding"""
     STATUS_UNKNOWN = "unknown"
     """Server Status unknown"""
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "id",
         "name",
         "status",
+        "created",
         "public_net",
         "server_type",
         "datacenter",
@@ -79,35 +81,34 @@ class Server(BaseDomain):
         "labels",
         "volumes",
         "private_net",
-        "created"
     )
 
     def __init__(
-            self,
-            id,
-            name=None,
-            status=None,
-            created=None,
-            public_net=None,
-            server_type=None,
-            datacenter=None,
-            image=None,
-            iso=None,
-            rescue_enabled=None,
-            locked=None,
-            backup_window=None,
-            outgoing_traffic=None,
-            ingoing_traffic=None,
-            included_traffic=None,
-            protection=None,
-            labels=None,
-            volumes=None,
-            private_net=None,
+        self,
+        id,
+        name=None,
+        status=None,
+        created=None,
+        public_net=None,
+        server_type=None,
+        datacenter=None,
+        image=None,
+        iso=None,
+        rescue_enabled=None,
+        locked=None,
+        backup_window=None,
+        outgoing_traffic=None,
+        ingoing_traffic=None,
+        included_traffic=None,
+        protection=None,
+        labels=None,
+        volumes=None,
+        private_net=None,
     ):
         self.id = id
         self.name = name
         self.status = status
-        self.created = isoparse(created) if created else None
+        self.created = created
         self.public_net = public_net
         self.server_type = server_type
         self.datacenter = datacenter
@@ -124,6 +125,57 @@ class Server(BaseDomain):
         self.volumes = volumes
         self.private_net = private_net
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = data["id"]
+        domain.name = get("name")
+        domain.status = intern_strings(get("status"))
+        domain.created = get("created")
+        domain.public_net = get("public_net")
+        domain.server_type = shared_values.share("server_types", get("server_type"))
+        domain.datacenter = shared_values.share("datacenters", get("datacenter"))
+        domain.image = shared_values.share("images", get("image"))
+        domain.iso = shared_values.share("isos", get("iso"))
+        domain.rescue_enabled = get("rescue_enabled")
+        domain.locked = get("locked")
+        domain.backup_window = intern_strings(get("backup_window"))
+        domain.outgoing_traffic = get("outgoing_traffic")
+        domain.ingoing_traffic = get("ingoing_traffic")
+        domain.included_traffic = get("included_traffic")
+        domain.protection = shared_values.share("server_protection", get("protection"))
+        domain.labels = intern_strings(get("labels"))
+        domain.volumes = get("volumes")
+        domain.private_net = get("private_net")
+        return domain
+
+    @classmethod
+    def from_projection(cls, data, fields):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = data["id"]
+        domain.name = get("name") if "name" in fields else None
+        domain.status = intern_strings(get("status")) if "status" in fields else None
+        domain.created = get("created") if "created" in fields else None
+        domain.public_net = get("public_net") if "public_net" in fields else None
+        domain.server_type = shared_values.share("server_types", get("server_type")) if "server_type" in fields else None
+        domain.datacenter = shared_values.share("datacenters", get("datacenter")) if "datacenter" in fields else None
+        domain.image = shared_values.share("images", get("image")) if "image" in fields else None
+        domain.iso = shared_values.share("isos", get("iso")) if "iso" in fields else None
+        domain.rescue_enabled = get("rescue_enabled") if "rescue_enabled" in fields else None
+        domain.locked = get("locked") if "locked" in fields else None
+        domain.backup_window = intern_strings(get("backup_window")) if "backup_window" in fields else None
+        domain.outgoing_traffic = get("outgoing_traffic") if "outgoing_traffic" in fields else None
+        domain.ingoing_traffic = get("ingoing_traffic") if "ingoing_traffic" in fields else None
+        domain.included_traffic = get("included_traffic") if "included_traffic" in fields else None
+        domain.protection = shared_values.share("server_protection", get("protection")) if "protection" in fields else None
+        domain.labels = intern_strings(get("labels")) if "labels" in fields else None
+        domain.volumes = get("volumes") if "volumes" in fields else None
+        domain.private_net = get("private_net") if "private_net" in fields else None
+        return domain
+    # end of generated code
+
 
 class CreateServerResponse(BaseDomain):
     """Create Server Response Domain
@@ -137,25 +189,36 @@ class CreateServerResponse(BaseDomain):
     :param root_password: str, None
            The root password of the server if no SSH-Key was given on server creation
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "server",
         "action",
         "next_actions",
-        "root_password"
+        "root_password",
     )
 
     def __init__(
-            self,
-            server,  # type: BoundServer
-            action,  # type: BoundAction
-            next_actions,  # type: List[Action]
-            root_password  # type: str
+        self,
+        server,  # type: BoundServer
+        action,  # type: BoundAction
+        next_actions,  # type: List[Action]
+        root_password,  # type: str
     ):
         self.server = server
         self.action = action
         self.next_actions = next_actions
         self.root_password = root_password
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        domain.server = data["server"]
+        domain.action = data["action"]
+        domain.next_actions = data["next_actions"]
+        domain.root_password = data["root_password"]
+        return domain
+    # end of generated code
+
 
 class ResetPasswordResponse(BaseDomain):
     """Reset Password Response Domain
@@ -165,19 +228,28 @@ class ResetPasswordResponse(BaseDomain):
     :param root_password: str
            The root password of the server
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "action",
-        "root_password"
+        "root_password",
     )
 
     def __init__(
-            self,
-            action,  # type: BoundAction
-            root_password  # type: str
+        self,
+        action,  # type: BoundAction
+        root_password,  # type: str
     ):
         self.action = action
         self.root_password = root_password
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        domain.action = data["action"]
+        domain.root_password = data["root_password"]
+        return domain
+    # end of generated code
+
 
 class EnableRescueResponse(BaseDomain):
     """Enable Rescue Response Domain
@@ -187,19 +259,28 @@ class EnableRescueResponse(BaseDomain):
     :param root_password: str
            The root password of the server in the rescue mode
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "action",
-        "root_password"
+        "root_password",
     )
 
     def __init__(
-            self,
-            action,  # type: BoundAction
-            root_password  # type: str
+        self,
+        action,  # type: BoundAction
+        root_password,  # type: str
     ):
         self.action = action
         self.root_password = root_password
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        domain.action = data["action"]
+        domain.root_password = data["root_password"]
+        return domain
+    # end of generated code
+
 
 class RequestConsoleResponse(BaseDomain):
     """Request Console Response Domain
@@ -211,22 +292,32 @@ class RequestConsoleResponse(BaseDomain):
     :param password: str
            VNC password to use for this connection. This password only works in combination with a wss_url with valid token.
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "action",
         "wss_url",
-        "password"
+        "password",
     )
 
     def __init__(
-            self,
-            action,  # type: BoundAction
-            wss_url,  # type: str
-            password,  # type: str
+        self,
+        action,  # type: BoundAction
+        wss_url,  # type: str
+        password,  # type: str
     ):
         self.action = action
         self.wss_url = wss_url
         self.password = password
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        domain.action = data["action"]
+        domain.wss_url = data["wss_url"]
+        domain.password = data["password"]
+        return domain
+    # end of generated code
+
 
 class PublicNetwork(BaseDomain):
     """Public Network Domain
@@ -235,21 +326,32 @@ class PublicNetwork(BaseDomain):
     :param ipv6: :class:`IPv6Network <hcloud.servers.domain.IPv6Network>`
     :param floating_ips: List[:class:`BoundFloatingIP <hcloud.floating_ips.client.BoundFloatingIP>`]
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "ipv4",
         "ipv6",
-        "floating_ips"
+        "floating_ips",
     )
 
-    def __init__(self,
-                 ipv4,  # type: IPv4Address
-                 ipv6,  # type: IPv6Network
-                 floating_ips,  # type: List[BoundFloatingIP]
-                 ):
+    def __init__(
+        self,
+        ipv4,  # type: IPv4Address
+        ipv6,  # type: IPv6Network
+        floating_ips,  # type: List[BoundFloatingIP]
+    ):
         self.ipv4 = ipv4
         self.ipv6 = ipv6
         self.floating_ips = floating_ips
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        domain.ipv4 = data["ipv4"]
+        domain.ipv6 = data["ipv6"]
+        domain.floating_ips = data["floating_ips"]
+        return domain
+    # end of generated code
+
 
 class IPv4Address(BaseDomain):
     """IPv4 Address Domain
@@ -261,21 +363,32 @@ class IPv4Address(BaseDomain):
     :param dns_ptr: str
            DNS PTR for the ip
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "ip",
         "blocked",
-        "dns_ptr"
+        "dns_ptr",
     )
 
-    def __init__(self,
-                 ip,  # type: str
-                 blocked,  # type: bool
-                 dns_ptr,  # type: str
-                 ):
+    def __init__(
+        self,
+        ip,  # type: str
+        blocked,  # type: bool
+        dns_ptr,  # type: str
+    ):
         self.ip = ip
         self.blocked = blocked
         self.dns_ptr = dns_ptr
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        domain.ip = data["ip"]
+        domain.blocked = data["blocked"]
+        domain.dns_ptr = data["dns_ptr"]
+        return domain
+    # end of generated code
+
 
 class IPv6Network(BaseDomain):
     """IPv6 Network Domain
@@ -324,20 +437,32 @@ class PrivateNet(BaseDomain):
     :param mac_address: str
            The mac address of the interface on the server
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "network",
         "ip",
         "alias_ips",
-        "mac_address"
+        "mac_address",
     )
 
-    def __init__(self,
-                 network,  # type: BoundNetwork
-                 ip,  # type: str
-                 alias_ips,  # type: List[str]
-                 mac_address,  # type: str
-                 ):
+    def __init__(
+        self,
+        network,  # type: BoundNetwork
+        ip,  # type: str
+        alias_ips,  # type: List[str]
+        mac_address,  # type: str
+    ):
         self.network = network
         self.ip = ip
         self.alias_ips = alias_ips
         self.mac_address = mac_address
+
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        domain.network = data["network"]
+        domain.ip = data["ip"]
+        domain.alias_ips = data["alias_ips"]
+        domain.mac_address = data["mac_address"]
+        return domain
+    # end of generated code
@@ -5,6 +5,7 @@ from hcloud.ssh_keys.domain import SSHKey
 
 
 class BoundSSHKey(BoundModelBase):
+    __slots__ = ()
     model = SSHKey
 
     def update(self, name=None, labels=None):
@@ -29,23 +30,32 @@ class BoundSSHKey(BoundModelBase):
 
 class SSHKeysClient(ClientEntityBase, GetEntityByNameMixin):
     results_list_attribute_name = 'ssh_keys'
+    query_params = ('name', 'fingerprint', 'label_selector')
 
-    def get_by_id(self, id):
-        # type: (int) -> BoundSSHKey
+    def get_by_id(self, id, raw=False, fields=None):
+        # type: (int, bool, Optional[List[str]]) -> BoundSSHKey
         """Get a specific SSH Key by its ID
 
         :param id: int
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundSSHKey <hcloud.ssh_keys.client.BoundSSHKey>`
         """
         response = self._client.request(url="/ssh_keys/{ssh_key_id}".format(ssh_key_id=id), method="GET")
-        return BoundSSHKey(self, response['ssh_key'])
+        if raw:
+            return response['ssh_key']
+        return BoundSSHKey(self, response['ssh_key'], fields=fields)
 
     def get_list(self,
                  name=None,  # type: Optional[str]
                  fingerprint=None,  # type: Optional[str]
                  label_selector=None,  # type: Optional[str]
                  page=None,  # type: Optional[int]
-                 per_page=None  # type: Optional[int]
+                 per_page=None,  # type: Optional[int]
+                 raw=False,  # type: bool
+                 fields=None,  # type: Optional[List[str]]
                  ):
         # type: (...) -> PageResults[List[BoundSSHKey], Meta]
         """Get a list of SSH keys from the account
@@ -60,6 +70,10 @@ class SSHKeysClient(ClientEntityBase, GetEntityByNameMixin):
                Specifies the page to fetch
         :param per_page: int (optional)
                Specifies how many results are returned by page
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return:  (List[:class:`BoundSSHKey <hcloud.ssh_keys.client.BoundSSHKey>`], :class:`Meta <hcloud.core.domain.Meta>`)
         """
         params = {}
@@ -75,12 +89,14 @@ class SSHKeysClient(ClientEntityBase, GetEntityByNameMixin):
             params['per_page'] = per_page
 
         response = self._client.request(url="/ssh_keys", method="GET", params=params)
+        if raw:
+            return self._add_meta_to_result(response['ssh_keys'], response)
 
-        ass_ssh_keys = [BoundSSHKey(self, server_data) for server_data in response['ssh_keys']]
+        ass_ssh_keys = [BoundSSHKey(self, server_data, fields=fields) for server_data in response['ssh_keys']]
         return self._add_meta_to_result(ass_ssh_keys, response)
 
-    def get_all(self, name=None, fingerprint=None, label_selector=None):
-        # type: (Optional[str], Optional[str], Optional[str]) -> List[BoundSSHKey]
+    def get_all(self, name=None, fingerprint=None, label_selector=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[str], Optional[str], Optional[PaginationCursor], bool, Optional[List[str]]) -> List[BoundSSHKey]
         """Get all SSH keys from the account
 
         :param name: str (optional)
@@ -89,19 +105,49 @@ class SSHKeysClient(ClientEntityBase, GetEntityByNameMixin):
                Can be used to filter SSH keys by their fingerprint. The response will only contain the SSH key matching the specified fingerprint.
         :param label_selector: str (optional)
                Can be used to filter SSH keys by labels. The response will only contain SSH keys matching the label selector.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return:  List[:class:`BoundSSHKey <hcloud.ssh_keys.client.BoundSSHKey>`]
         """
-        return super(SSHKeysClient, self).get_all(name=name, fingerprint=fingerprint, label_selector=label_selector)
+        return super(SSHKeysClient, self).get_all(name=name, fingerprint=fingerprint, label_selector=label_selector, resume_from=resume_from, raw=raw, fields=fields)
+
+    def iter_all(self, name=None, fingerprint=None, label_selector=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[str], Optional[str], Optional[PaginationCursor], bool, Optional[List[str]]) -> PageIterator[BoundSSHKey]
+        """Iterate over all SSH keys from the account, fetching the next page only when the current one is exhausted
+
+        :param name: str (optional)
+               Can be used to filter SSH keys by their name. The response will only contain the SSH key matching the specified name.
+        :param fingerprint: str (optional)
+               Can be used to filter SSH keys by their fingerprint. The response will only contain the SSH key matching the specified fingerprint.
+        :param label_selector: str (optional)
+               Can be used to filter SSH keys by labels. The response will only contain SSH keys matching the label selector.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
+        :return:  PageIterator[:class:`BoundSSHKey <hcloud.ssh_keys.client.BoundSSHKey>`]
+        """
+        return super(SSHKeysClient, self).iter_all(name=name, fingerprint=fingerprint, label_selector=label_selector, resume_from=resume_from, raw=raw, fields=fields)
 
-    def get_by_name(self, name):
-        # type: (str) -> SSHKeysClient
+    def get_by_name(self, name, raw=False, fields=None):
+        # type: (str, bool, Optional[List[str]]) -> SSHKeysClient
         """Get ssh key by name
 
         :param name: str
                Used to get ssh key by name.
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundSSHKey <hcloud.ssh_keys.client.BoundSSHKey>`
         """
-        return super(SSHKeysClient, self).get_by_name(name)
+        return super(SSHKeysClient, self).get_by_name(name, raw=raw, fields=fields)
 
     def get_by_fingerprint(self, fingerprint):
         # type: (str) -> BoundSSHKey
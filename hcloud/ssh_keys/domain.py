@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
-from dateutil.parser import isoparse
 
-from hcloud.core.domain import BaseDomain, DomainIdentityMixin
+from hcloud.core.domain import BaseDomain, DomainIdentityMixin, intern_strings, lazy_iso_datetimes
 
 
+@lazy_iso_datetimes("created")
 class SSHKey(BaseDomain, DomainIdentityMixin):
     """SSHKey Domain
 
@@ -20,13 +20,14 @@ class SSHKey(BaseDomain, DomainIdentityMixin):
     :param created: datetime
            Point in time when the SSH Key was created
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "id",
         "name",
         "fingerprint",
         "public_key",
         "labels",
-        "created"
+        "created",
     )
 
     def __init__(
@@ -36,11 +37,36 @@ class SSHKey(BaseDomain, DomainIdentityMixin):
         fingerprint=None,
         public_key=None,
         labels=None,
-        created=None
+        created=None,
     ):
         self.id = id
         self.name = name
         self.fingerprint = fingerprint
         self.public_key = public_key
         self.labels = labels
-        self.created = isoparse(created) if created else None
+        self.created = created
+
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.name = get("name")
+        domain.fingerprint = get("fingerprint")
+        domain.public_key = get("public_key")
+        domain.labels = intern_strings(get("labels"))
+        domain.created = get("created")
+        return domain
+
+    @classmethod
+    def from_projection(cls, data, fields):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = get("id")
+        domain.name = get("name") if "name" in fields else None
+        domain.fingerprint = get("fingerprint") if "fingerprint" in fields else None
+        domain.public_key = get("public_key") if "public_key" in fields else None
+        domain.labels = intern_strings(get("labels")) if "labels" in fields else None
+        domain.created = get("created") if "created" in fields else None
+        return domain
+    # end of generated code
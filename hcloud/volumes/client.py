@@ -2,24 +2,34 @@
 from hcloud.core.client import ClientEntityBase, BoundModelBase, GetEntityByNameMixin
 
 from hcloud.actions.client import BoundAction
-from hcloud.core.domain import add_meta_to_result
+from hcloud.core.domain import add_meta_to_result, shared_values
 from hcloud.volumes.domain import Volume, CreateVolumeResponse
 from hcloud.locations.client import BoundLocation
 
 
 class BoundVolume(BoundModelBase):
+    __slots__ = ()
     model = Volume
 
-    def __init__(self, client, data, complete=True):
-        location = data.get("location")
-        if location is not None:
-            data['location'] = BoundLocation(client._client.locations, location)
+    def _hydrate_location(self, location):
+        if location is None:
+            return None
+        return BoundLocation._shared(self._client._client.locations, location)
 
+    def _hydrate_server(self, server):
+        if server is None:
+            return None
         from hcloud.servers.client import BoundServer
-        server = data.get("server")
-        if server is not None:
-            data['server'] = BoundServer(client._client.servers, {"id": server}, complete=False)
-        super(BoundVolume, self).__init__(client, data, complete)
+        return BoundServer(self._client._client.servers, {"id": server}, complete=False)
+
+    _hydrators = {
+        "location": _hydrate_location,
+        "server": _hydrate_server,
+    }
+
+    _expandable = {
+        "server": ("server", lambda volume: [volume.server]),
+    }
 
     def get_actions_list(self, status=None, sort=None, page=None, per_page=None):
         # type: (Optional[List[str]], Optional[int], Optional[int]) -> PageResults[List[BoundAction, Meta]]
@@ -37,17 +47,33 @@ class BoundVolume(BoundModelBase):
         """
         return self._client.get_actions_list(self, status, sort, page, per_page)
 
-    def get_actions(self, status=None, sort=None):
-        # type: (Optional[List[str]]) -> List[BoundAction]
+    def get_actions(self, status=None, sort=None, resume_from=None):
+        # type: (Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> List[BoundAction]
         """Returns all action objects for a volume.
 
         :param status: List[str] (optional)
                Response will have only actions with specified statuses. Choices: `running` `success` `error`
         :param sort:List[str] (optional)
                Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
         :return: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
         """
-        return self._client.get_actions(self, status, sort)
+        return self._client.get_actions(self, status, sort, resume_from=resume_from)
+
+    def iter_actions(self, status=None, sort=None, resume_from=None):
+        # type: (Optional[List[str]], Optional[List[str]], Optional[PaginationCursor]) -> PageIterator[BoundAction]
+        """Iterate over all action objects for a volume, fetching the next page only when the current one is exhausted.
+
+        :param status: List[str] (optional)
+               Response will have only actions with specified statuses. Choices: `running` `success` `error`
+        :param sort:List[str] (optional)
+               Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :return: PageIterator[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+        """
+        return self._client.iter_actions(self, status, sort, resume_from=resume_from)
 
     def update(self, name=None, labels=None):
         # type: (Optional[str], Optional[Dict[str, str]]) -> BoundAction
@@ -110,19 +136,26 @@ class BoundVolume(BoundModelBase):
 
 class VolumesClient(ClientEntityBase, GetEntityByNameMixin):
     results_list_attribute_name = 'volumes'
+    query_params = ('name', 'label_selector', 'status')
 
-    def get_by_id(self, id):
-        # type: (int) -> volumes.client.BoundVolume
+    def get_by_id(self, id, raw=False, fields=None):
+        # type: (int, bool, Optional[List[str]]) -> volumes.client.BoundVolume
         """Get a specific volume by its id
 
         :param id: int
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundVolume <hcloud.volumes.client.BoundVolume>`
         """
         response = self._client.request(url="/volumes/{volume_id}".format(volume_id=id), method="GET")
-        return BoundVolume(self, response['volume'])
+        if raw:
+            return response['volume']
+        return BoundVolume(self, response['volume'], fields=fields)
 
-    def get_list(self, name=None, label_selector=None, page=None, per_page=None, status=None):
-        # type: (Optional[str], Optional[str], Optional[int], Optional[int], Optional[List[str]]) -> PageResults[List[BoundVolume], Meta]
+    def get_list(self, name=None, label_selector=None, page=None, per_page=None, status=None, raw=False, expand=None, fields=None):
+        # type: (Optional[str], Optional[str], Optional[int], Optional[int], Optional[List[str]], bool, Optional[List[str]], Optional[List[str]]) -> PageResults[List[BoundVolume], Meta]
         """Get a list of volumes from this account
 
         :param name: str (optional)
@@ -135,6 +168,12 @@ class VolumesClient(ClientEntityBase, GetEntityByNameMixin):
                Specifies the page to fetch
         :param per_page: int (optional)
                Specifies how many results are returned by page
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param expand: List[str] (optional)
+               Fields whose placeholder models are completed with one list call per resource type. Choices: server
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: (List[:class:`BoundVolume <hcloud.volumes.client.BoundVolume>`], :class:`Meta <hcloud.core.domain.Meta>`)
         """
         params = {}
@@ -150,30 +189,64 @@ class VolumesClient(ClientEntityBase, GetEntityByNameMixin):
             params['per_page'] = per_page
 
         response = self._client.request(url="/volumes", method="GET", params=params)
-        volumes = [BoundVolume(self, volume_data) for volume_data in response['volumes']]
+        if raw:
+            return self._add_meta_to_result(response['volumes'], response)
+        with shared_values.scope():
+            volumes = [BoundVolume(self, volume_data, fields=fields) for volume_data in response['volumes']]
+        self._expand(volumes, expand)
         return self._add_meta_to_result(volumes, response)
 
-    def get_all(self, label_selector=None, status=None):
-        # type: (Optional[str], Optional[List[str]]) -> List[BoundVolume]
+    def get_all(self, label_selector=None, status=None, resume_from=None, raw=False, expand=None, fields=None):
+        # type: (Optional[str], Optional[List[str]], Optional[PaginationCursor], bool, Optional[List[str]], Optional[List[str]]) -> List[BoundVolume]
         """Get all volumes from this account
 
         :param label_selector:
                Can be used to filter volumes by labels. The response will only contain volumes matching the label selector.
         :param status: List[str] (optional)
                Can be used to filter volumes by their status. The response will only contain volumes matching the status.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param expand: List[str] (optional)
+               Fields whose placeholder models are completed with one list call per resource type. Choices: server
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
         :return: List[:class:`BoundVolume <hcloud.volumes.client.BoundVolume>`]
         """
-        return super(VolumesClient, self).get_all(label_selector=label_selector, status=status)
+        return super(VolumesClient, self).get_all(label_selector=label_selector, status=status, resume_from=resume_from, raw=raw, expand=expand, fields=fields)
+
+    def iter_all(self, label_selector=None, status=None, resume_from=None, raw=False, fields=None):
+        # type: (Optional[str], Optional[List[str]], Optional[PaginationCursor], bool, Optional[List[str]]) -> PageIterator[BoundVolume]
+        """Iterate over all volumes from this account, fetching the next page only when the current one is exhausted
 
-    def get_by_name(self, name):
-        # type: (str) -> BoundVolume
+        :param label_selector:
+               Can be used to filter volumes by labels. The response will only contain volumes matching the label selector.
+        :param status: List[str] (optional)
+               Can be used to filter volumes by their status. The response will only contain volumes matching the status.
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :param raw: bool (optional)
+               Return the decoded response data of the entries instead of bound models
+        :param fields: List[str] (optional)
+               Fields to build the bound models with, other fields are skipped and loaded on their first access
+        :return: PageIterator[:class:`BoundVolume <hcloud.volumes.client.BoundVolume>`]
+        """
+        return super(VolumesClient, self).iter_all(label_selector=label_selector, status=status, resume_from=resume_from, raw=raw, fields=fields)
+
+    def get_by_name(self, name, raw=False, fields=None):
+        # type: (str, bool, Optional[List[str]]) -> BoundVolume
         """Get volume by name
 
         :param name: str
                Used to get volume by name.
+        :param raw: bool (optional)
+               Return the decoded response data instead of a bound model
+        :param fields: List[str] (optional)
+               Fields to build the bound model with, other fields are skipped and loaded on their first access
         :return: :class:`BoundVolume <hcloud.volumes.client.BoundVolume>`
         """
-        return super(VolumesClient, self).get_by_name(name)
+        return super(VolumesClient, self).get_by_name(name, raw=raw, fields=fields)
 
     def create(self,
                size,  # type: int
@@ -263,8 +336,8 @@ class VolumesClient(ClientEntityBase, GetEntityByNameMixin):
         actions = [BoundAction(self._client.actions, action_data) for action_data in response['actions']]
         return add_meta_to_result(actions, response, 'actions')
 
-    def get_actions(self, volume, status=None, sort=None):
-        # type: (Union[Volume, BoundVolume], Optional[List[str]]) -> List[BoundAction]
+    def get_actions(self, volume, status=None, sort=None, resume_from=None):
+        # type: (Union[Volume, BoundVolume], Optional[List[str]], Optional[PaginationCursor]) -> List[BoundAction]
         """Returns all action objects for a volume.
 
         :param volume: :class:`BoundVolume <hcloud.volumes.client.BoundVolume>` or :class:`Volume <hcloud.volumes.domain.Volume>`
@@ -272,9 +345,26 @@ class VolumesClient(ClientEntityBase, GetEntityByNameMixin):
                Response will have only actions with specified statuses. Choices: `running` `success` `error`
         :param sort:List[str] (optional)
                Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
         :return: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
         """
-        return super(VolumesClient, self).get_actions(volume, status=status, sort=sort)
+        return super(VolumesClient, self).get_actions(volume, status=status, sort=sort, resume_from=resume_from)
+
+    def iter_actions(self, volume, status=None, sort=None, resume_from=None):
+        # type: (Union[Volume, BoundVolume], Optional[List[str]], Optional[PaginationCursor]) -> PageIterator[BoundAction]
+        """Iterate over all action objects for a volume, fetching the next page only when the current one is exhausted.
+
+        :param volume: :class:`BoundVolume <hcloud.volumes.client.BoundVolume>` or :class:`Volume <hcloud.volumes.domain.Volume>`
+        :param status: List[str] (optional)
+               Response will have only actions with specified statuses. Choices: `running` `success` `error`
+        :param sort:List[str] (optional)
+               Specify how the results are sorted. Choices: `id` `id:asc` `id:desc` `command` `command:asc` `command:desc` `status` `status:asc` `status:desc` `progress` `progress:asc` `progress:desc` `started` `started:asc` `started:desc` `finished` `finished:asc` `finished:desc`
+        :param resume_from: :class:`PaginationCursor <hcloud.core.domain.PaginationCursor>` (optional)
+               Continues a listing after the last page it completed, the filters of the cursor are used instead of the given ones.
+        :return: PageIterator[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+        """
+        return super(VolumesClient, self).iter_actions(volume, status=status, sort=sort, resume_from=resume_from)
 
     def update(self, volume, name=None, labels=None):
         # type:(Union[Volume, BoundVolume],  Optional[str],  Optional[Dict[str, str]]) -> BoundVolume
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
-from dateutil.parser import isoparse
 
-from hcloud.core.domain import BaseDomain, DomainIdentityMixin
+from hcloud.core.domain import BaseDomain, DomainIdentityMixin, intern_strings, lazy_iso_datetimes, shared_values
 
 
+@lazy_iso_datetimes("created")
 class Volume(BaseDomain, DomainIdentityMixin):
     """Volume Domain
 
@@ -35,10 +35,12 @@ class Volume(BaseDomain, DomainIdentityMixin):
     STATUS_AVAILABLE = "available"
     """Volume Status available"""
 
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "id",
         "name",
         "server",
+        "created",
         "location",
         "size",
         "linux_device",
@@ -46,28 +48,26 @@ class Volume(BaseDomain, DomainIdentityMixin):
         "protection",
         "labels",
         "status",
-        "created"
     )
 
     def __init__(
-            self,
-            id,
-            name=None,
-            server=None,
-            created=None,
-            location=None,
-            size=None,
-            linux_device=None,
-            format=None,
-            protection=None,
-            labels=None,
-            status=None
-
+        self,
+        id,
+        name=None,
+        server=None,
+        created=None,
+        location=None,
+        size=None,
+        linux_device=None,
+        format=None,
+        protection=None,
+        labels=None,
+        status=None,
     ):
         self.id = id
         self.name = name
         self.server = server
-        self.created = isoparse(created) if created else None
+        self.created = created
         self.location = location
         self.size = size
         self.linux_device = linux_device
@@ -76,6 +76,41 @@ class Volume(BaseDomain, DomainIdentityMixin):
         self.labels = labels
         self.status = status
 
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = data["id"]
+        domain.name = get("name")
+        domain.server = get("server")
+        domain.created = get("created")
+        domain.location = shared_values.share("locations", get("location"))
+        domain.size = get("size")
+        domain.linux_device = intern_strings(get("linux_device"))
+        domain.format = intern_strings(get("format"))
+        domain.protection = get("protection")
+        domain.labels = intern_strings(get("labels"))
+        domain.status = intern_strings(get("status"))
+        return domain
+
+    @classmethod
+    def from_projection(cls, data, fields):
+        domain = cls.__new__(cls)
+        get = data.get
+        domain.id = data["id"]
+        domain.name = get("name") if "name" in fields else None
+        domain.server = get("server") if "server" in fields else None
+        domain.created = get("created") if "created" in fields else None
+        domain.location = shared_values.share("locations", get("location")) if "location" in fields else None
+        domain.size = get("size") if "size" in fields else None
+        domain.linux_device = intern_strings(get("linux_device")) if "linux_device" in fields else None
+        domain.format = intern_strings(get("format")) if "format" in fields else None
+        domain.protection = get("protection") if "protection" in fields else None
+        domain.labels = intern_strings(get("labels")) if "labels" in fields else None
+        domain.status = intern_strings(get("status")) if "status" in fields else None
+        return domain
+    # end of generated code
+
 
 class CreateVolumeResponse(BaseDomain):
     """Create Volume Response Domain
@@ -87,18 +122,28 @@ class CreateVolumeResponse(BaseDomain):
     :param next_actions: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
            List of actions that are performed after the creation, like attaching to a server
     """
+    # generated from codegen/schema.json by `python -m codegen.generate`, do not edit
     __slots__ = (
         "volume",
         "action",
-        "next_actions"
+        "next_actions",
     )
 
     def __init__(
-            self,
-            volume,  # type: BoundVolume
-            action,  # type: BoundAction
-            next_actions,  # type: List[BoundAction]
+        self,
+        volume,  # type: BoundVolume
+        action,  # type: BoundAction
+        next_actions,  # type: List[BoundAction]
     ):
         self.volume = volume
         self.action = action
         self.next_actions = next_actions
+
+    @classmethod
+    def from_dict(cls, data):
+        domain = cls.__new__(cls)
+        domain.volume = data["volume"]
+        domain.action = data["action"]
+        domain.next_actions = data["next_actions"]
+        return domain
+    # end of generated code
@@ -1,7 +1,14 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-"""The setup script."""
+"""The setup script.
+
+Set HCLOUD_COMPILE=1 to compile hcloud.core and the domain modules with Cython (e.g.
+``HCLOUD_COMPILE=1 pip install .``). The compiled modules behave like the pure Python ones,
+which are used whenever the extensions are missing or fail to build.
+"""
+import os
+from glob import glob
 
 from setuptools import setup, find_packages
 
@@ -21,9 +28,25 @@ extras_require = {
     'docs': [
         "Sphinx==1.8.1",
         "sphinx-rtd-theme==0.4.2"
+    ],
+    'numpy': [
+        "numpy>=1.13"
     ]
 }
 
+compiled_modules = sorted(
+    [path for path in glob("hcloud/core/*.py") if not path.endswith("__init__.py")] + glob("hcloud/*/domain.py")
+)
+
+ext_modules = []
+if os.environ.get("HCLOUD_COMPILE") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(compiled_modules, build_dir="build", language_level="3str", quiet=True)
+    for extension in ext_modules:
+        # a failed build leaves the pure Python module in place
+        extension.optional = True
+
 version = {}
 with open("hcloud/__version__.py") as fp:
     exec(fp.read(), version)
@@ -48,12 +71,13 @@ setup(
     description="Official Hetzner Cloud python library",
     install_requires=requirements,
     extras_require=extras_require,
+    ext_modules=ext_modules,
     license="MIT license",
     long_description=readme + '\n\n' + changelog,
     include_package_data=True,
     keywords='hcloud hetzner cloud',
     name='hcloud',
-    packages=find_packages(exclude=["examples", "tests*", "docs"]),
+    packages=find_packages(exclude=["examples", "tests*", "docs", "benchmarks", "codegen"]),
     test_suite='tests',
     url='https://github.com/hetznercloud/hcloud-python',
     version=version['VERSION'],
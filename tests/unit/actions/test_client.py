@@ -1,3 +1,5 @@
+import datetime
+
 import mock
 import pytest
 
@@ -107,3 +109,101 @@ class TestActionsClient(object):
         assert action2._client is actions_client
         assert action2.id == 2
         assert action2.command == "stop_server"
+
+
+class TestActionsClientHistory(object):
+
+    @staticmethod
+    def action(id, started):
+        return {
+            "id": id,
+            "command": "some_command",
+            "status": "success",
+            "progress": 100,
+            "started": started,
+            "finished": started,
+            "resources": [],
+            "error": None
+        }
+
+    @pytest.fixture()
+    def paginated_actions(self, hetzner_client):
+        actions = {
+            "/servers/1/actions": [self.action(13, "2019-03-01T10:00:00+00:00"), self.action(12, "2019-02-01T10:00:00+00:00"),
+                                   self.action(11, "2019-01-01T10:00:00+00:00")],
+            "/volumes/2/actions": [self.action(21, "2019-02-15T10:00:00+00:00")],
+            "/networks/3/actions": [],
+        }
+
+        def request(url, method, params):
+            page, per_page = params["page"], params["per_page"]
+            return {
+                "actions": actions[url][(page - 1) * per_page:page * per_page],
+                "meta": {
+                    "pagination": {
+                        "page": page,
+                        "per_page": per_page,
+                        "next_page": page + 1 if page * per_page < len(actions[url]) else None
+                    }
+                }
+            }
+
+        hetzner_client.request.side_effect = request
+        return hetzner_client
+
+    @pytest.fixture()
+    def resources(self, hetzner_client):
+        from hcloud.networks.client import BoundNetwork
+        from hcloud.servers.client import BoundServer
+        from hcloud.volumes.client import BoundVolume
+
+        return [
+            BoundServer(hetzner_client.servers, {"id": 1}),
+            BoundVolume(hetzner_client.volumes, {"id": 2}),
+            BoundNetwork(hetzner_client.networks, {"id": 3}),
+        ]
+
+    def test_get_history(self, paginated_actions, resources):
+        paginated_actions.servers.max_per_page = 1
+
+        histories = paginated_actions.actions.get_history(resources, status=["success"], max_workers=2)
+
+        assert list(histories.keys()) == resources
+        assert [action.id for action in histories[resources[0]]] == [13, 12, 11]
+        assert [action.id for action in histories[resources[1]]] == [21]
+        assert histories[resources[2]] == []
+        assert isinstance(histories[resources[0]][0], BoundAction)
+        paginated_actions.request.assert_any_call(url="/servers/1/actions", method="GET",
+                                                  params={"status": ["success"], "page": 3, "per_page": 1})
+
+    def test_get_history_since(self, paginated_actions, resources):
+        paginated_actions.servers.max_per_page = 1
+
+        histories = paginated_actions.actions.get_history(resources, since=datetime.datetime(2019, 2, 1, 10, 0))
+
+        assert [action.id for action in histories[resources[0]]] == [13, 12]
+        assert [action.id for action in histories[resources[1]]] == [21]
+        server_requests = [call for call in paginated_actions.request.call_args_list if call[1]["url"] == "/servers/1/actions"]
+        assert [call[1]["params"] for call in server_requests] == [
+            {"sort": ["started:desc"], "page": 1, "per_page": 1},
+            {"sort": ["started:desc"], "page": 2, "per_page": 1},
+            {"sort": ["started:desc"], "page": 3, "per_page": 1},
+        ]
+
+    def test_get_history_rate_limiter(self, paginated_actions, resources):
+        rate_limiter = mock.MagicMock()
+        rate_limiter.wrap.side_effect = lambda function: function
+
+        paginated_actions.actions.get_history(resources, rate_limiter=rate_limiter)
+
+        assert rate_limiter.wrap.call_count == 3
+
+    def test_get_history_since_and_sort(self, hetzner_client, resources):
+        with pytest.raises(ValueError):
+            hetzner_client.actions.get_history(resources, sort=["id"], since=datetime.datetime(2019, 1, 1))
+
+    def test_get_history_unsupported_resource(self, hetzner_client):
+        from hcloud.locations.client import BoundLocation
+
+        with pytest.raises(ValueError):
+            hetzner_client.actions.get_history([BoundLocation(hetzner_client.locations, {"id": 1})])
@@ -0,0 +1,197 @@
+import os
+import sqlite3
+
+import mock
+import pytest
+
+from hcloud import Client
+from hcloud.core.catalog import CatalogCache, PersistentCatalogCache, default_cache_path
+from hcloud.images.client import BoundImage
+from hcloud.server_types.client import BoundServerType
+
+
+class TestCatalogCache(object):
+
+    @pytest.fixture()
+    def client(self):
+        client = Client(token="token", catalog_cache=CatalogCache(ttl=3600, ttls={"server_types": 60}))
+        patcher = mock.patch.object(client, "request")
+        patcher.start()
+        yield client
+        patcher.stop()
+
+    @pytest.fixture()
+    def server_types(self, client):
+        client.request.return_value = {
+            "server_types": [{"id": 1, "name": "cx11"}, {"id": 2, "name": "cx21"}],
+            "meta": {"pagination": {"page": 1, "per_page": 50, "next_page": None}},
+        }
+        return client.server_types
+
+    def test_lookups_after_warm_up(self, client, server_types):
+        server_type = server_types.get_by_name("cx21")
+
+        assert isinstance(server_type, BoundServerType)
+        assert server_type.id == 2
+        assert server_types.get_by_id(1).name == "cx11"
+        assert server_types.get_by_id(2, raw=True) == {"id": 2, "name": "cx21"}
+        assert server_types.get_by_name("cx11", fields=["name"]).complete is False
+        client.request.assert_called_once_with(url="/server_types", method="GET", params={"page": 1, "per_page": 50})
+
+    def test_missing_entries_are_requested(self, client, server_types):
+        server_types.get_by_id(1)
+        client.request.return_value = {"server_type": {"id": 3, "name": "cx31"}}
+
+        assert server_types.get_by_id(3).name == "cx31"
+        client.request.assert_called_with(url="/server_types/3", method="GET")
+
+    @mock.patch("hcloud.core.catalog.time")
+    def test_ttl(self, time, client, server_types):
+        time.time.return_value = 1000
+        server_types.get_by_id(1)
+        time.time.return_value = 1059
+        server_types.get_by_id(1)
+        assert client.request.call_count == 1
+
+        time.time.return_value = 1060
+        server_types.get_by_id(1)
+        assert client.request.call_count == 2
+
+    def test_invalidate(self, client, server_types):
+        server_types.get_by_id(1)
+        client._catalog_cache.invalidate("locations")
+        server_types.get_by_id(1)
+        assert client.request.call_count == 1
+
+        client._catalog_cache.invalidate("server_types")
+        server_types.get_by_id(1)
+        assert client.request.call_count == 2
+
+    def test_system_images(self, client):
+        client.request.return_value = {
+            "images": [{"id": 4711, "name": "ubuntu-20.04", "type": "system"}],
+            "meta": {"pagination": {"page": 1, "per_page": 50, "next_page": None}},
+        }
+
+        image = client.images.get_by_name("ubuntu-20.04")
+
+        assert isinstance(image, BoundImage)
+        assert image.id == 4711
+        client.request.assert_called_once_with(
+            url="/images", method="GET", params={"type": ["system"], "page": 1, "per_page": 50})
+
+    def test_refresh_catalogs(self, client):
+        client.request.side_effect = lambda url, method, params: {
+            url.strip("/"): [], "meta": {"pagination": {"page": 1, "per_page": 50, "next_page": None}}}
+
+        client.refresh_catalogs()
+
+        assert sorted(call[1]["url"] for call in client.request.call_args_list) == [
+            "/datacenters", "/images", "/isos", "/locations", "/server_types"]
+
+    def test_shared_by_clients(self, client, server_types):
+        server_types.get_by_id(1)
+        other = Client(token="other-token", catalog_cache=client._catalog_cache)
+        other.request = mock.MagicMock(return_value={
+            "server_types": [{"id": 1, "name": "cx11-other"}],
+            "meta": {"pagination": {"page": 1, "per_page": 50, "next_page": None}},
+        })
+
+        assert other.server_types.get_by_id(1).name == "cx11-other"
+        assert server_types.get_by_id(1).name == "cx11"
+        assert client.request.call_count == 1
+
+        client._catalog_cache.invalidate("server_types")
+        other.server_types.get_by_id(1)
+        assert other.request.call_count == 2
+
+    def test_resources_are_not_cached(self, client):
+        client.request.return_value = {"server": {"id": 1, "name": "my-server"}}
+        client.servers.get_by_id(1)
+        client.servers.get_by_id(1)
+        assert client.request.call_count == 2
+
+
+class TestPersistentCatalogCache(object):
+
+    @pytest.fixture()
+    def path(self, tmpdir):
+        return str(tmpdir.join("cache", "catalogs.sqlite3"))
+
+    @staticmethod
+    def client(path, token="token", **kwargs):
+        client = Client(token=token, catalog_cache=PersistentCatalogCache(path, **kwargs))
+        client.request = mock.MagicMock(return_value={
+            "locations": [{"id": 1, "name": "fsn1"}, {"id": 2, "name": "nbg1"}],
+            "meta": {"pagination": {"page": 1, "per_page": 50, "next_page": None}},
+        })
+        return client
+
+    def test_later_process_starts_with_the_catalogs(self, path):
+        first = self.client(path)
+        assert first.locations.get_by_name("fsn1").id == 1
+
+        second = self.client(path)
+        assert second.locations.get_by_name("nbg1").id == 2
+        assert second.locations.get_by_id(1).name == "fsn1"
+        second.request.assert_not_called()
+        assert os.path.exists(path)
+
+    def test_keyed_by_endpoint_and_token(self, path):
+        self.client(path).locations.get_by_id(1)
+
+        other = self.client(path, token="other-token")
+        other.locations.get_by_id(1)
+        other.request.assert_called_once()
+
+        connection = sqlite3.connect(path)
+        keys = [row[0] for row in connection.execute("SELECT key FROM catalogs")]
+        connection.close()
+        assert len(set(keys)) == 2
+        assert not any("token" in key for key in keys)
+
+    @mock.patch("hcloud.core.catalog.time")
+    def test_ttl(self, time, path):
+        time.time.return_value = 1000
+        self.client(path, ttls={"locations": 60}).locations.get_by_id(1)
+
+        time.time.return_value = 1059
+        fresh = self.client(path)
+        fresh.locations.get_by_id(1)
+        fresh.request.assert_not_called()
+
+        time.time.return_value = 1060
+        expired = self.client(path)
+        expired.locations.get_by_id(1)
+        expired.request.assert_called_once()
+
+    def test_invalidate(self, path):
+        client = self.client(path)
+        client.locations.get_by_id(1)
+        client._catalog_cache.invalidate()
+
+        later = self.client(path)
+        later.locations.get_by_id(1)
+        later.request.assert_called_once()
+
+    def test_corrupt_catalog(self, path):
+        self.client(path).locations.get_by_id(1)
+        connection = sqlite3.connect(path)
+        with connection:
+            connection.execute("UPDATE catalogs SET entries = substr(entries, 1, 10)")
+        connection.close()
+
+        later = self.client(path)
+        assert later.locations.get_by_name("nbg1").id == 2
+        later.request.assert_called_once()
+
+    def test_unusable_database(self, tmpdir):
+        client = self.client(str(tmpdir))
+
+        assert client.locations.get_by_id(1).name == "fsn1"
+        assert client.locations.get_by_id(2).name == "nbg1"
+        client.request.assert_called_once()
+
+    def test_default_cache_path(self, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", "/cache")
+        assert default_cache_path() == os.path.join("/cache", "hcloud-python", "catalogs.sqlite3")
@@ -1,8 +1,23 @@
+import copy
+import threading
+
 import mock
 import pytest
 
-from hcloud.core.client import BoundModelBase, ClientEntityBase, GetEntityByNameMixin
-from hcloud.core.domain import add_meta_to_result, BaseDomain
+from hcloud.core.client import BoundModelBase, ClientEntityBase, GetEntityByNameMixin, resolve_placeholders
+from hcloud.core.domain import add_meta_to_result, BaseDomain, PaginationCursor
+from hcloud.datacenters.client import BoundDatacenter
+from hcloud.floating_ips.client import BoundFloatingIP
+from hcloud.images.client import BoundImage
+from hcloud.networks.client import BoundNetwork
+from hcloud.servers.client import BoundServer
+from hcloud.volumes.client import BoundVolume
+from tests.unit.datacenters.conftest import datacenter_response  # noqa: F401
+from tests.unit.floating_ips.conftest import floating_ip_response  # noqa: F401
+from tests.unit.images.conftest import image_response  # noqa: F401
+from tests.unit.networks.conftest import network_response  # noqa: F401
+from tests.unit.servers.conftest import response_full_server  # noqa: F401
+from tests.unit.volumes.conftest import volume_response  # noqa: F401
 
 
 class TestBoundModelBase():
@@ -18,6 +33,7 @@ class TestBoundModelBase():
                 self.description = description
 
         class BoundModel(BoundModelBase):
+            __slots__ = ()
             model = Model
 
         return BoundModel
@@ -61,6 +77,104 @@ class TestBoundModelBase():
         client.get_by_id.assert_not_called()
         assert bound_model.complete is False
 
+    def test_get_falsy_loaded_attribute_incomplete_model(self, bound_model_class, client):
+        bound_model = bound_model_class(client=client, data={"id": 101, "name": ""}, complete=False)
+        name = bound_model.name
+        client.get_by_id.assert_not_called()
+        assert name == ""
+        assert bound_model.complete is False
+
+    def test_lazy_reload_at_most_once(self, bound_model_class, client):
+        BoundModelBase.lazy_reloads.clear()
+        bound_model = bound_model_class(client=client, data={"id": 101}, complete=False)
+        client.get_by_id.return_value = bound_model_class(client=client, data={"id": 101, "name": "", "description": ""})
+
+        assert bound_model.name == ""
+        assert bound_model.description == ""
+        client.get_by_id.assert_called_once_with(101)
+        assert BoundModelBase.lazy_reloads == {"BoundModel": 1}
+
+    def test_hydrator_applied_once_on_first_access(self, bound_model_class, client):
+        hydrator = mock.MagicMock(side_effect=lambda bound_model, value: value.upper())
+
+        class HydratedModel(bound_model_class):
+            _hydrators = {"name": hydrator}
+
+        bound_model = HydratedModel(client=client, data={"id": 1, "name": "name"})
+        hydrator.assert_not_called()
+
+        assert bound_model.name == "NAME"
+        assert bound_model.name == "NAME"
+        hydrator.assert_called_once_with(bound_model, "name")
+
+    def test_hydrator_applied_after_reload(self, bound_model_class, client):
+        class HydratedModel(bound_model_class):
+            _hydrators = {"name": lambda bound_model, value: value.upper()}
+
+        bound_model = HydratedModel(client=client, data={"id": 101}, complete=False)
+        client.get_by_id.return_value = HydratedModel(client=client, data={"id": 101, "name": "name"})
+
+        assert bound_model.name == "NAME"
+        assert bound_model._hydrated == ("name",)
+
+    def test_slots(self, bound_model_class, client):
+        bound_model = bound_model_class(client=client, data={"id": 1})
+        assert not hasattr(bound_model, "__dict__")
+        with pytest.raises(AttributeError):
+            bound_model.friend = "candy"
+
+    def test_placeholders_share_loaded_fields(self, bound_model_class, client):
+        first = bound_model_class(client=client, data={"id": 1}, complete=False)
+        second = bound_model_class(client=client, data={"id": 2}, complete=False)
+        assert first._loaded_fields is second._loaded_fields
+
+    def test_fields(self, bound_model_class, client):
+        data = {"id": 101, "name": "name", "description": "description"}
+        bound_model = bound_model_class(client=client, data=data, fields=["name"])
+        client.get_by_id.return_value = bound_model_class(client=client, data=data)
+
+        assert bound_model.complete is False
+        assert bound_model._loaded_fields == frozenset(["id", "name"])
+        assert bound_model.data_model.description == ""
+        assert bound_model.name == "name"
+        client.get_by_id.assert_not_called()
+        assert bound_model.description == "description"
+        client.get_by_id.assert_called_once_with(101)
+
+    def test_fields_unknown(self, bound_model_class, client):
+        with pytest.raises(ValueError):
+            bound_model_class(client=client, data={"id": 1}, fields=["content"])
+
+    def test_shared(self, bound_model_class):
+        client = ClientEntityBase(mock.MagicMock())
+        data = {"id": 1, "name": "name"}
+
+        bound_model = bound_model_class._shared(client, data)
+
+        assert bound_model_class._shared(client, data) is bound_model
+        assert bound_model_class._shared(client, {"id": 1, "name": "name"}) is not bound_model
+        assert bound_model_class._shared(client, None) is None
+
+    @pytest.mark.parametrize("bound_model_class,response,key", [
+        (BoundServer, "response_full_server", "server"),
+        (BoundVolume, "volume_response", "volume"),
+        (BoundFloatingIP, "floating_ip_response", "floating_ip"),
+        (BoundNetwork, "network_response", "network"),
+        (BoundImage, "image_response", "image"),
+        (BoundDatacenter, "datacenter_response", "datacenter"),
+    ])
+    def test_init_leaves_data_untouched(self, request, bound_model_class, response, key):
+        response = request.getfixturevalue(response)
+        data = copy.deepcopy(response[key])
+        bound_model = bound_model_class(client=mock.MagicMock(), data=response[key])
+        other_bound_model = bound_model_class(client=mock.MagicMock(), data=response[key])
+
+        for field in bound_model_class._hydrators:
+            getattr(bound_model, field)
+            getattr(other_bound_model, field)
+
+        assert response[key] == data
+
 
 class TestClientEntityBase():
 
@@ -145,6 +259,222 @@ class TestClientEntityBase():
                           (12, 2, "sweet", 50), (22, 2, "sweet", 50),
                           (13, 3, "sweet", 50), (23, 3, "sweet", 50)]
 
+    def test_iter_all_is_lazy(self, client_class_constructor):
+        fetched_pages = []
+
+        def json_content_function(p):
+            fetched_pages.append(p)
+            return {
+                "candies": [10 + p, 20 + p],
+                "meta": {
+                    "pagination": {
+                        "page": p,
+                        "per_page": 11,
+                        "next_page": p + 1 if p < 3 else None
+                    }
+                }
+            }
+
+        candies_client = client_class_constructor(json_content_function)
+
+        result = candies_client.iter_all(status="sweet")
+        assert fetched_pages == []
+
+        assert next(result) == (11, 1, "sweet", 50)
+        assert next(result) == (21, 1, "sweet", 50)
+        assert fetched_pages == [1]
+
+        assert next(result) == (12, 2, "sweet", 50)
+        assert fetched_pages == [1, 2]
+
+        result.close()
+        assert fetched_pages == [1, 2]
+
+    def test_iter_all_ok(self, client_class_constructor):
+        def json_content_function(p):
+            return {
+                "candies": [10 + p, 20 + p],
+                "meta": {
+                    "pagination": {
+                        "page": p,
+                        "per_page": 11,
+                        "next_page": p + 1 if p < 3 else None
+                    }
+                }
+            }
+
+        candies_client = client_class_constructor(json_content_function)
+
+        result = list(candies_client.iter_all(status="sweet"))
+
+        assert result == [(11, 1, "sweet", 50), (21, 1, "sweet", 50),
+                          (12, 2, "sweet", 50), (22, 2, "sweet", 50),
+                          (13, 3, "sweet", 50), (23, 3, "sweet", 50)]
+
+    def test_get_all_concurrent_pages(self, client_class_constructor):
+        fetched_pages = []
+
+        def json_content_function(p):
+            fetched_pages.append(p)
+            return {
+                "candies": [10 + p, 20 + p],
+                "meta": {
+                    "pagination": {
+                        "page": p,
+                        "per_page": 11,
+                        "next_page": p + 1 if p < 5 else None,
+                        "last_page": 5
+                    }
+                }
+            }
+
+        candies_client = client_class_constructor(json_content_function)
+        candies_client.max_page_workers = 3
+
+        result = candies_client.get_all(status="sweet")
+
+        assert [r[0] for r in result] == [11, 21, 12, 22, 13, 23, 14, 24, 15, 25]
+        assert [r[1] for r in result] == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+        assert fetched_pages[0] == 1
+        assert sorted(fetched_pages) == [1, 2, 3, 4, 5]
+
+    def test_get_all_concurrent_pages_without_last_page(self, client_class_constructor):
+        fetched_pages = []
+
+        def json_content_function(p):
+            fetched_pages.append(p)
+            return {
+                "candies": [10 + p],
+                "meta": {
+                    "pagination": {
+                        "page": p,
+                        "per_page": 11,
+                        "next_page": p + 1 if p < 3 else None
+                    }
+                }
+            }
+
+        candies_client = client_class_constructor(json_content_function)
+        candies_client.max_page_workers = 3
+
+        result = candies_client.get_all(status="sweet")
+
+        assert result == [(11, 1, "sweet", 50), (12, 2, "sweet", 50), (13, 3, "sweet", 50)]
+        assert fetched_pages == [1, 2, 3]
+
+    def test_iter_all_prefetches_next_pages(self, client_class_constructor):
+        fetched = {p: threading.Event() for p in range(1, 4)}
+
+        def json_content_function(p):
+            fetched[p].set()
+            return {
+                "candies": [10 + p],
+                "meta": {
+                    "pagination": {
+                        "page": p,
+                        "per_page": 11,
+                        "next_page": p + 1 if p < 3 else None
+                    }
+                }
+            }
+
+        candies_client = client_class_constructor(json_content_function)
+        candies_client.prefetch_pages = 2
+
+        result = candies_client.iter_all(status="sweet")
+        assert next(result) == (11, 1, "sweet", 50)
+        # page 2 is fetched in the background without the caller asking for it
+        assert fetched[2].wait(timeout=5)
+
+        assert list(result) == [(12, 2, "sweet", 50), (13, 3, "sweet", 50)]
+
+    def test_iter_all_prefetch_raises_page_errors(self, client_class_constructor):
+        def json_content_function(p):
+            if p == 2:
+                raise RuntimeError("page 2 failed")
+            return {
+                "candies": [10 + p],
+                "meta": {
+                    "pagination": {
+                        "page": p,
+                        "per_page": 11,
+                        "next_page": p + 1
+                    }
+                }
+            }
+
+        candies_client = client_class_constructor(json_content_function)
+        candies_client.prefetch_pages = 1
+
+        result = candies_client.iter_all(status="sweet")
+        assert next(result) == (11, 1, "sweet", 50)
+        with pytest.raises(RuntimeError) as exception_info:
+            next(result)
+        assert str(exception_info.value) == "page 2 failed"
+
+    def test_iter_all_cursor_after_failed_page(self, client_class_constructor):
+        fetched_pages = []
+        failing_pages = {2}
+
+        def json_content_function(p):
+            fetched_pages.append(p)
+            if p in failing_pages:
+                failing_pages.remove(p)
+                raise RuntimeError("page failed")
+            return {
+                "candies": [10 + p, 20 + p],
+                "meta": {
+                    "pagination": {
+                        "page": p,
+                        "per_page": 11,
+                        "next_page": p + 1 if p < 3 else None
+                    }
+                }
+            }
+
+        candies_client = client_class_constructor(json_content_function)
+
+        result = candies_client.iter_all(status="sweet")
+        assert result.cursor.completed_page == 0
+
+        received = []
+        with pytest.raises(RuntimeError):
+            for candy in result:
+                received.append(candy)
+
+        assert received == [(11, 1, "sweet", 50), (21, 1, "sweet", 50)]
+        assert result.cursor.params == {"status": "sweet"}
+        assert result.cursor.per_page == 50
+        assert result.cursor.completed_page == 1
+
+        cursor = PaginationCursor.from_dict(result.cursor.to_dict())
+        resumed = candies_client.get_all(resume_from=cursor)
+
+        assert resumed == [(12, 2, "sweet", 50), (22, 2, "sweet", 50),
+                           (13, 3, "sweet", 50), (23, 3, "sweet", 50)]
+        assert fetched_pages == [1, 2, 2, 3]
+
+    def test_get_all_attaches_cursor_to_exception(self, client_class_constructor):
+        def json_content_function(p):
+            if p == 2:
+                raise RuntimeError("page failed")
+            return {"candies": [10 + p], "meta": {"pagination": {"page": p, "per_page": 1, "next_page": p + 1}}}
+
+        candies_client = client_class_constructor(json_content_function)
+
+        with pytest.raises(RuntimeError) as exception_info:
+            candies_client.get_all(status="sweet")
+
+        assert exception_info.value.cursor.params == {"status": "sweet"}
+        assert exception_info.value.cursor.completed_page == 1
+
+    def test_iter_all_cursor_completed(self, client_class_constructor):
+        candies_client = client_class_constructor(lambda p: {"candies": [1, 2]})
+
+        result = candies_client.iter_all(status="sweet")
+        assert list(result) == [(1, 1, "sweet", 50), (2, 1, "sweet", 50)]
+        assert result.cursor.completed_page == 1
+
     def test_get_actions_no_method(self, client_class_constructor):
         json_content = {"candies": [1, 2]}
 
@@ -179,6 +509,34 @@ class TestClientEntityBase():
                           (12, 2, "sweet", 50), (22, 2, "sweet", 50),
                           (13, 3, "sweet", 50), (23, 3, "sweet", 50)]
 
+    def test_iter_actions_ok(self, client_class_with_actions_constructor):
+        def json_content_function(p):
+            return {
+                "actions": [10 + p, 20 + p],
+                "meta": {
+                    "pagination": {
+                        "page": p,
+                        "per_page": 11,
+                        "next_page": p + 1 if p < 2 else None
+                    }
+                }
+            }
+
+        candies_client = client_class_with_actions_constructor(json_content_function)
+
+        result = list(candies_client.iter_actions(status="sweet"))
+
+        assert result == [(11, 1, "sweet", 50), (21, 1, "sweet", 50),
+                          (12, 2, "sweet", 50), (22, 2, "sweet", 50)]
+
+    def test_iter_actions_no_method(self, client_class_constructor):
+        candies_client = client_class_constructor(lambda p: {"candies": []})
+
+        with pytest.raises(ValueError) as exception_info:
+            candies_client.iter_actions()
+        error = exception_info.value
+        assert str(error) == 'this endpoint does not support iter_actions method'
+
     def test_raise_exception_if_list_attribute_is_not_implemented(self, client_class_with_actions_constructor):
         def json_content_function(p):
             return {
@@ -201,6 +559,83 @@ class TestClientEntityBase():
         assert str(error) == "in order to get results list, 'results_list_attribute_name' attribute of CandiesClient has to be specified"
 
 
+class TestResolvePlaceholders():
+
+    @pytest.fixture()
+    def candies(self):
+        class Candy(BaseDomain):
+            __slots__ = ("id", "name")
+
+            def __init__(self, id, name=None):
+                self.id = id
+                self.name = name
+
+        class BoundCandy(BoundModelBase):
+            model = Candy
+
+        class CandiesClient(ClientEntityBase):
+            results_list_attribute_name = 'candies'
+            max_per_page = 2
+            pages = [
+                [{"id": 1, "name": "one"}, {"id": 2, "name": "two"}],
+                [{"id": 3, "name": "three"}, {"id": 4, "name": "four"}],
+                [{"id": 5, "name": "five"}],
+            ]
+
+            def get_list(self, page=None, per_page=None, raw=False, expand=None):
+                self.requested_pages.append(page)
+                response = {
+                    "candies": self.pages[page - 1],
+                    "meta": {"pagination": {"page": page, "per_page": per_page,
+                                            "next_page": page + 1 if page < len(self.pages) else None}}
+                }
+                if raw:
+                    return self._add_meta_to_result(response["candies"], response)
+                candies = [BoundCandy(self, candy) for candy in response["candies"]]
+                self._expand(candies, expand)
+                return self._add_meta_to_result(candies, response)
+
+        candies_client = CandiesClient(mock.MagicMock())
+        candies_client.requested_pages = []
+        return candies_client, BoundCandy
+
+    def test_resolve_placeholders(self, candies):
+        candies_client, BoundCandy = candies
+        placeholders = [BoundCandy(candies_client, {"id": id}, complete=False) for id in (3, 1, 3)]
+        complete = BoundCandy(candies_client, {"id": 5, "name": "cinq"})
+
+        resolve_placeholders(placeholders + [complete, None])
+
+        assert [candy.name for candy in placeholders] == ["three", "one", "three"]
+        assert all(candy.complete for candy in placeholders)
+        assert complete.name == "cinq"
+        # the listing stops once every placeholder was found
+        assert candies_client.requested_pages == [1, 2]
+        candies_client._client.request.assert_not_called()
+
+    def test_resolve_placeholders_not_listed(self, candies):
+        candies_client, BoundCandy = candies
+        missing = BoundCandy(candies_client, {"id": 42}, complete=False)
+
+        resolve_placeholders([missing])
+
+        assert missing.complete is False
+        assert candies_client.requested_pages == [1, 2, 3]
+
+    def test_expand(self, candies):
+        candies_client, BoundCandy = candies
+        BoundCandy._expandable = {"friend": ("friend", lambda candy: [candy.friend])}
+        candies = [BoundCandy(candies_client, {"id": 1}), BoundCandy(candies_client, {"id": 2})]
+        candies[0].friend = BoundCandy(candies_client, {"id": 4}, complete=False)
+        candies[1].friend = None
+
+        candies_client._expand(candies, ["friend"])
+
+        assert candies[0].friend.name == "four"
+        with pytest.raises(ValueError):
+            candies_client._expand(candies, ["enemy"])
+
+
 class TestGetEntityByNameMixin():
     @pytest.fixture()
     def client_class_constructor(self):
@@ -0,0 +1,25 @@
+import os
+import sys
+import types
+
+import pytest
+
+from hcloud.core import EXTENSION_SUFFIXES, is_compiled
+
+
+class TestIsCompiled(object):
+
+    @pytest.fixture()
+    def module(self, monkeypatch):
+        module = types.ModuleType("hcloud.core.fake")
+        monkeypatch.setitem(sys.modules, "hcloud.core.fake", module)
+        return module
+
+    def test_python_module(self, module):
+        module.__file__ = os.path.join("hcloud", "core", "fake.py")
+        assert is_compiled("hcloud.core.fake") is False
+
+    @pytest.mark.parametrize("suffix", EXTENSION_SUFFIXES)
+    def test_extension_module(self, module, suffix):
+        module.__file__ = os.path.join("hcloud", "core", "fake" + suffix)
+        assert is_compiled("hcloud.core.fake") is True
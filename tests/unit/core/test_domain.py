@@ -1,7 +1,13 @@
+import datetime
+import threading
+
 import pytest
 from dateutil.parser import isoparse
+from dateutil.tz import tzoffset, tzutc
 
-from hcloud.core.domain import BaseDomain, DomainIdentityMixin, Meta, Pagination, add_meta_to_result
+from hcloud.core.domain import BaseDomain, DomainIdentityMixin, Meta, Pagination, PaginationCursor, add_meta_to_result, \
+    SharedValues, intern_strings, lazy_iso_datetimes, parse_iso_datetime, shared_values
+from hcloud.volumes.domain import Volume
 
 
 class TestMeta(object):
@@ -62,6 +68,36 @@ class TestMeta(object):
         assert result.meta.pagination.last_page == 10
         assert result.meta.pagination.total_entries == 100
 
+    def test_add_meta_to_result_reuses_result_type(self):
+        first = add_meta_to_result([1], {}, "id_list")
+        second = add_meta_to_result([2], {"meta": {}}, "id_list")
+        other = add_meta_to_result([3], {}, "name_list")
+
+        assert type(first) is type(second)
+        assert type(first).__name__ == "PageResultsId_list"
+        assert type(other) is not type(first)
+        assert second.id_list == [2]
+        assert second.meta.pagination is None
+        assert other.name_list == [3]
+
+
+class TestPaginationCursor(object):
+
+    def test_next_page(self):
+        cursor = PaginationCursor(params={"name": "my-server"}, per_page=50, completed_page=3)
+        assert cursor.next_page == 4
+
+    def test_to_dict_from_dict(self):
+        cursor = PaginationCursor(params={"status": ["running"], "name": None}, per_page=25, completed_page=2)
+
+        data = cursor.to_dict()
+        assert data == {"params": {"status": ["running"], "name": None}, "per_page": 25, "completed_page": 2}
+
+        restored = PaginationCursor.from_dict(data)
+        assert restored.params == cursor.params
+        assert restored.per_page == 25
+        assert restored.completed_page == 2
+
 
 class SomeDomain(BaseDomain, DomainIdentityMixin):
     __slots__ = ("id", "name")
@@ -123,3 +159,134 @@ class TestBaseDomain(object):
         model = ActionDomain.from_dict(data_dict)
         for k, v in expected_result.items():
             assert getattr(model, k) == v
+
+    def test_fields_cached_per_class(self):
+        class ExtendedActionDomain(ActionDomain):
+            __slots__ = ("description",)
+
+            def __init__(self, id, description=None):
+                super(ExtendedActionDomain, self).__init__(id)
+                self.description = description
+
+        assert ActionDomain._fields() == frozenset(["id", "name", "started"])
+        assert ActionDomain._fields() is ActionDomain._fields()
+        assert ExtendedActionDomain._fields() == frozenset(["id", "name", "started", "description"])
+
+        model = ExtendedActionDomain.from_dict({"id": 1, "description": "new"})
+        assert model.id == 1
+        assert model.description == "new"
+
+
+class TestSharedValues(object):
+
+    def test_share(self):
+        shared_values = SharedValues()
+        location = {"id": 1, "name": "fsn1"}
+
+        with shared_values.scope():
+            assert shared_values.share("locations", location) is location
+            assert shared_values.share("locations", {"id": 1, "name": "fsn1"}) is location
+            assert shared_values.share("datacenters", {"id": 1, "name": "fsn1"}) is not location
+
+            protection = {"delete": False}
+            assert shared_values.share("protection", protection) is protection
+            assert shared_values.share("protection", {"delete": False}) is protection
+            assert shared_values.share("protection", {"delete": True}) is not protection
+
+    def test_outside_of_a_scope(self):
+        shared_values = SharedValues()
+        location = {"id": 1, "name": "fsn1"}
+        with shared_values.scope():
+            shared_values.share("locations", location)
+
+        assert shared_values.share("locations", {"id": 1, "name": "fsn1"}) is not location
+        with shared_values.scope():
+            assert shared_values.share("locations", {"id": 1, "name": "fsn1"}) is not location
+
+    def test_scope_per_thread(self):
+        shared_values = SharedValues()
+        shared = []
+        thread = threading.Thread(target=lambda: shared.append(shared_values.share("locations", {"id": 1})))
+        with shared_values.scope():
+            location = shared_values.share("locations", {"id": 1})
+            thread.start()
+            thread.join()
+
+        assert shared[0] is not location
+
+    def test_from_dict(self):
+        prefix = "run"
+        with shared_values.scope():
+            first = Volume.from_dict({"id": 1, "status": prefix + "ning", "labels": {prefix + "s": prefix + "ning"},
+                                      "location": {"id": 1, "name": "fsn1"}})
+            second = Volume.from_dict({"id": 2, "status": prefix + "ning", "labels": {prefix + "s": prefix + "ning"},
+                                       "location": {"id": 1, "name": "fsn1"}})
+
+        assert first.location is second.location
+        assert first.status is second.status
+        assert first.labels == second.labels == {"runs": "running"}
+        assert list(first.labels)[0] is list(second.labels)[0]
+        assert first.labels["runs"] is second.labels["runs"]
+
+    def test_intern_strings(self):
+        assert intern_strings(None) is None
+        assert intern_strings(5) == 5
+        assert intern_strings("".join(["a", "b"])) is intern_strings("ab")
+        assert intern_strings({"a": 1, "b": "".join(["c", "d"])}) == {"a": 1, "b": "cd"}
+
+
+@lazy_iso_datetimes("started")
+class LazyActionDomain(BaseDomain):
+    __slots__ = ("id", "started")
+
+    def __init__(self, id, started=None):
+        self.id = id
+        self.started = started
+
+
+class TestLazyISODateTime(object):
+
+    @pytest.mark.parametrize(
+        "value,expected_result",
+        [
+            ("2016-01-30T23:50:11+00:00", datetime.datetime(2016, 1, 30, 23, 50, 11, tzinfo=tzutc())),
+            ("2016-01-30T23:50:11Z", datetime.datetime(2016, 1, 30, 23, 50, 11, tzinfo=tzutc())),
+            ("2016-01-30T23:50:11.25+01:30", datetime.datetime(2016, 1, 30, 23, 50, 11, 250000, tzinfo=tzoffset(None, 5400))),
+            ("2016-01-30T23:50:11-05:00", datetime.datetime(2016, 1, 30, 23, 50, 11, tzinfo=tzoffset(None, -18000))),
+            ("2016-01-30T23:50+00:00", datetime.datetime(2016, 1, 30, 23, 50, tzinfo=tzutc())),
+            ("2016-01-30", datetime.datetime(2016, 1, 30)),
+        ])
+    def test_parse_iso_datetime(self, value, expected_result):
+        result = parse_iso_datetime(value)
+        assert result == expected_result
+        assert result == isoparse(value)
+        assert result.utcoffset() == expected_result.utcoffset()
+
+    def test_parse_iso_datetime_invalid(self):
+        with pytest.raises(ValueError):
+            parse_iso_datetime("2016-02-30T23:50:11+00:00")
+
+    def test_parsed_on_first_access(self):
+        domain = LazyActionDomain.from_dict({"id": 1, "started": "2016-01-30T23:50:11+00:00"})
+        assert LazyActionDomain.started.slot.__get__(domain) == "2016-01-30T23:50:11+00:00"
+
+        started = domain.started
+
+        assert started == datetime.datetime(2016, 1, 30, 23, 50, 11, tzinfo=tzutc())
+        assert LazyActionDomain.started.slot.__get__(domain) is started
+        assert domain.started is started
+
+    @pytest.mark.parametrize("value", [None, ""])
+    def test_empty(self, value):
+        assert LazyActionDomain(id=1, started=value).started is None
+
+    def test_set_datetime(self):
+        started = datetime.datetime(2016, 1, 30, 23, 50, 11, tzinfo=tzutc())
+        domain = LazyActionDomain(id=1, started=started)
+        assert domain.started is started
+
+    def test_values_are_not_shared(self):
+        first = LazyActionDomain(id=1, started="2016-01-30T23:50:11+00:00")
+        second = LazyActionDomain(id=2, started="2017-01-30T23:50:11+00:00")
+        assert first.started.year == 2016
+        assert second.started.year == 2017
@@ -0,0 +1,155 @@
+import gc
+
+import mock
+import pytest
+
+from hcloud import Client
+from hcloud.core.identity import IdentityMap
+from hcloud.servers.client import BoundServer
+from hcloud.servers.domain import Server
+from hcloud.server_types.client import BoundServerType
+
+
+class Entity(object):
+    pass
+
+
+class TestIdentityMap(object):
+
+    def test_get_or_create(self):
+        identity_map = IdentityMap()
+        entity = identity_map.get_or_create(Entity, 1, Entity)
+
+        assert identity_map.get_or_create(Entity, 1, Entity) is entity
+        assert identity_map.get(Entity, 1) is entity
+        assert identity_map.get(Entity, 2) is None
+        assert len(identity_map) == 1
+
+    def test_models_are_published_once_built(self):
+        identity_map = IdentityMap()
+        published = []
+
+        def factory():
+            published.append(identity_map.get(Entity, 1))
+            return Entity()
+
+        entity = identity_map.get_or_create(Entity, 1, factory)
+        updated = []
+
+        assert published == [None]
+        assert identity_map.get_or_create(Entity, 1, factory, updated.append) is entity
+        assert updated == [entity]
+
+    def test_weak_references(self):
+        identity_map = IdentityMap()
+        identity_map.get_or_create(Entity, 1, Entity)
+        gc.collect()
+
+        assert identity_map.get(Entity, 1) is None
+
+    def test_max_size_keeps_recent_models_alive(self):
+        identity_map = IdentityMap(max_size=2)
+        for id in range(3):
+            identity_map.get_or_create(Entity, id, Entity)
+        gc.collect()
+
+        assert identity_map.get(Entity, 0) is None
+        assert identity_map.get(Entity, 1) is not None
+        assert identity_map.get(Entity, 2) is not None
+
+    def test_clear(self):
+        identity_map = IdentityMap(max_size=2)
+        identity_map.get_or_create(Entity, 1, Entity)
+        identity_map.clear()
+
+        assert identity_map.get(Entity, 1) is None
+
+
+class TestClientIdentityMap(object):
+
+    @pytest.fixture()
+    def client(self):
+        client = Client(token="token", identity_map=IdentityMap())
+        patcher = mock.patch.object(client, "request")
+        patcher.start()
+        yield client
+        patcher.stop()
+
+    @staticmethod
+    def server(id, status="running"):
+        return {
+            "id": id,
+            "name": "server-{}".format(id),
+            "status": status,
+            "server_type": {"id": 1, "name": "cx11", "cores": 1},
+            "datacenter": {
+                "id": 2,
+                "name": "fsn1-dc8",
+                "location": {"id": 1, "name": "fsn1"},
+                "server_types": {"available": [1], "supported": [1], "available_for_migration": [1]}
+            },
+            "volumes": [],
+        }
+
+    def test_listing_shares_nested_models(self, client):
+        client.request.return_value = {"servers": [self.server(1), self.server(2)]}
+
+        servers = client.servers.get_all()
+
+        assert servers[0].datacenter is servers[1].datacenter
+        assert servers[0].server_type is servers[1].server_type
+        # the placeholder of the datacenter resolves to the complete server type
+        assert servers[0].datacenter.server_types.available[0] is servers[0].server_type
+        assert servers[0].server_type.complete is True
+        assert servers[0].server_type.name == "cx11"
+
+    def test_fresher_data_updates_in_place(self, client):
+        client.request.return_value = {"server": self.server(1, status="off")}
+        server = client.servers.get_by_id(1)
+
+        client.request.return_value = {"servers": [self.server(1, status="running")]}
+        listed = client.servers.get_all()
+
+        assert listed[0] is server
+        assert server.status == "running"
+
+    def test_placeholder_does_not_replace_fetched_data(self, client):
+        client.request.return_value = {"server_type": {"id": 1, "name": "cx11"}}
+        server_type = client.server_types.get_by_id(1)
+
+        placeholder = BoundServerType(client.server_types, {"id": 1}, complete=False)
+
+        assert placeholder is server_type
+        assert placeholder.complete is True
+        assert placeholder.name == "cx11"
+
+    def test_projection_does_not_replace_fetched_data(self, client):
+        client.request.return_value = {"server": self.server(1)}
+        server = client.servers.get_by_id(1)
+
+        projected = BoundServer(client.servers, self.server(1, status="off"), fields=["status"])
+
+        assert projected is server
+        assert server.complete is True
+        assert server.status == "running"
+
+    def test_server_is_published_once_built(self, client):
+        from_dict = Server.from_dict
+        published = []
+
+        def build(data):
+            published.append(client._identity_map.get(BoundServer, data["id"]))
+            return from_dict(data)
+
+        with mock.patch.object(Server, "from_dict", side_effect=build):
+            server = BoundServer(client.servers, self.server(1))
+            BoundServer(client.servers, self.server(1, status="off"))
+
+        assert published == [None, server]
+        assert server.status == "off"
+
+    def test_without_identity_map(self, hetzner_client):
+        first = BoundServer(hetzner_client.servers, {"id": 1})
+        second = BoundServer(hetzner_client.servers, {"id": 1})
+
+        assert first is not second
@@ -0,0 +1,138 @@
+import mock
+import pytest
+
+from hcloud.core.client import ClientEntityBase
+from hcloud.core.domain import BaseDomain
+from hcloud.core.query import LabelPredicate
+
+
+class Candy(BaseDomain):
+    __slots__ = ("id", "name", "status", "labels")
+
+    def __init__(self, id, name=None, status=None, labels=None):
+        self.id = id
+        self.name = name
+        self.status = status
+        self.labels = labels
+
+
+CANDIES = [
+    Candy(id=1, name="lolly", status="sweet", labels={"color": "red"}),
+    Candy(id=2, name="toffee", status="sticky", labels={"color": "brown", "wrapped": ""}),
+    Candy(id=3, name="gum", status="sticky", labels={}),
+    Candy(id=4, name="drop", status="sour", labels={"color": "red", "wrapped": ""}),
+    Candy(id=5, name="mint", status=None, labels={"color": "green"}),
+]
+
+
+class TestQuery(object):
+
+    @pytest.fixture()
+    def requests(self):
+        return []
+
+    @pytest.fixture()
+    def candies_client(self, requests):
+        class CandiesClient(ClientEntityBase):
+            results_list_attribute_name = 'candies'
+            query_params = ('name', 'status', 'label_selector')
+
+            def get_list(self, page=None, per_page=None, **params):
+                requests.append(dict(params, page=page, per_page=per_page))
+                candies = CANDIES[(page - 1) * per_page:page * per_page]
+                return self._add_meta_to_result(candies, {
+                    "meta": {
+                        "pagination": {
+                            "page": page,
+                            "per_page": per_page,
+                            "next_page": page + 1 if page * per_page < len(CANDIES) else None
+                        }
+                    }
+                })
+
+        client = CandiesClient(mock.MagicMock())
+        client.max_per_page = 2
+        return client
+
+    def test_params_push_down(self, candies_client):
+        query = candies_client.query() \
+            .filter(status="sweet", name="lolly") \
+            .with_label("color", "red") \
+            .without_label("wrapped") \
+            .label_in("size", ["s", "m"]) \
+            .label_not_in("brand", ["x"]) \
+            .with_label("fresh") \
+            .without_label("flavor", "mint") \
+            .order_by("name")
+
+        assert query.params == {
+            "status": ["sweet"],
+            "name": "lolly",
+            "label_selector": "color=red,!wrapped,size in (s,m),brand notin (x),fresh,flavor!=mint",
+        }
+
+    def test_query_is_immutable(self, candies_client):
+        query = candies_client.query()
+        filtered = query.filter(status="sweet")
+
+        assert query.params == {}
+        assert filtered.params == {"status": ["sweet"]}
+
+    def test_client_side_filters(self, candies_client, requests):
+        query = candies_client.query().filter(id=[2, 3, 4]).where(lambda candy: candy.name != "gum")
+
+        assert [candy.id for candy in query] == [2, 4]
+        assert len(requests) == 3
+
+    def test_limit_stops_pagination(self, candies_client, requests):
+        query = candies_client.query().where(lambda candy: candy.status == "sticky").limit(1)
+
+        assert [candy.id for candy in query] == [2]
+        assert [request["page"] for request in requests] == [1]
+
+    def test_first_fetches_single_entry(self, candies_client, requests):
+        candy = candies_client.query().filter(status="sticky").first()
+
+        assert candy.id == 1
+        assert requests == [{"status": ["sticky"], "page": 1, "per_page": 1}]
+
+    def test_first_without_match(self, candies_client):
+        assert candies_client.query().filter(id=42).first() is None
+
+    def test_labels_evaluated_locally_without_label_selector(self, candies_client, requests):
+        candies_client.query_params = ('name', 'status')
+
+        query = candies_client.query().with_label("color", "red").with_label("wrapped")
+
+        assert query.params == {}
+        assert [candy.id for candy in query] == [4]
+
+    def test_local_sort_without_sort_param(self, candies_client):
+        query = candies_client.query().order_by("status:desc", "name").limit(4)
+
+        assert [candy.name for candy in query] == ["lolly", "gum", "toffee", "drop"]
+
+    def test_sort_push_down(self, candies_client, requests):
+        candies_client.query_params = ('sort',)
+
+        assert candies_client.query().order_by("name:desc").params == {"sort": ["name:desc"]}
+
+
+class TestLabelPredicate(object):
+
+    @pytest.mark.parametrize(
+        "predicate,labels,expected",
+        [
+            (LabelPredicate("exists", "env"), {"env": ""}, True),
+            (LabelPredicate("exists", "env"), None, False),
+            (LabelPredicate("missing", "env"), {}, True),
+            (LabelPredicate("equals", "env", ["prod"]), {"env": "prod"}, True),
+            (LabelPredicate("equals", "env", ["prod"]), {"env": "dev"}, False),
+            (LabelPredicate("not_equals", "env", ["prod"]), {}, True),
+            (LabelPredicate("in", "env", ["dev", "prod"]), {"env": "dev"}, True),
+            (LabelPredicate("not_in", "env", ["dev", "prod"]), {"env": "test"}, True),
+            (LabelPredicate("not_in", "env", ["dev", "prod"]), {"env": "prod"}, False),
+        ]
+    )
+    def test_matches(self, predicate, labels, expected):
+        assert predicate.matches(labels) is expected
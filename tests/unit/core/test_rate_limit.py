@@ -0,0 +1,40 @@
+import mock
+import pytest
+
+from hcloud.core.rate_limit import RateLimiter
+
+
+class TestRateLimiter(object):
+
+    @pytest.fixture()
+    def mocked_time(self):
+        patcher = mock.patch("hcloud.core.rate_limit.time")
+        mocked_time = patcher.start()
+        mocked_time.time.return_value = 100.0
+        mocked_time.sleep.side_effect = lambda seconds: setattr(mocked_time.time, "return_value", mocked_time.time.return_value + seconds)
+        yield mocked_time
+        patcher.stop()
+
+    def test_acquire_within_burst(self, mocked_time):
+        rate_limiter = RateLimiter(requests_per_second=2, burst=3)
+        for _ in range(3):
+            rate_limiter.acquire()
+        mocked_time.sleep.assert_not_called()
+
+    def test_acquire_waits_for_budget(self, mocked_time):
+        rate_limiter = RateLimiter(requests_per_second=2)
+        rate_limiter.acquire()
+        rate_limiter.acquire()
+        rate_limiter.acquire()
+        assert mocked_time.time.return_value == pytest.approx(101.0)
+
+    def test_wrap(self, mocked_time):
+        rate_limiter = RateLimiter(requests_per_second=1)
+        function = mock.MagicMock(return_value=42)
+
+        assert rate_limiter.wrap(function)(1, page=2) == 42
+        function.assert_called_once_with(1, page=2)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_second=0)
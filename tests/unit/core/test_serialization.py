@@ -0,0 +1,156 @@
+import datetime
+import json
+
+import mock
+import pytest
+from dateutil.tz import tzutc
+
+from hcloud import Client
+from hcloud.core.identity import IdentityMap
+from hcloud.core.serialization import FORMAT_VERSION, dumps, loads
+from hcloud.datacenters.client import BoundDatacenter
+from hcloud.datacenters.domain import DatacenterServerTypes
+from hcloud.images.client import BoundImage
+from hcloud.locations.domain import Location
+from hcloud.server_types.client import BoundServerType
+from hcloud.servers.client import BoundServer
+from hcloud.servers.domain import PublicNetwork
+
+
+@pytest.fixture()
+def server_data():
+    return {
+        "id": 42,
+        "name": "my-server",
+        "status": "running",
+        "created": "2016-01-30T23:50:00+00:00",
+        "public_net": {
+            "ipv4": {"ip": "1.2.3.4", "blocked": False, "dns_ptr": "server01.example.com"},
+            "ipv6": {"ip": "2001:db8::/64", "blocked": False, "dns_ptr": []},
+            "floating_ips": [478],
+        },
+        "private_net": [{"network": 4711, "ip": "10.1.1.5", "alias_ips": [], "mac_address": "86:00:ff:2a:7d:e1"}],
+        "server_type": {"id": 1, "name": "cx11", "prices": [{"location": "fsn1", "price_hourly": {"net": "1.0"}}]},
+        "datacenter": {"id": 2, "name": "fsn1-dc8", "location": {"id": 1, "name": "fsn1"},
+                       "server_types": {"available": [1], "supported": [1, 2], "available_for_migration": []}},
+        "image": {"id": 4711, "name": "ubuntu-16.04", "created_from": {"id": 1, "name": "Server"}, "bound_to": None},
+        "iso": None,
+        "rescue_enabled": False,
+        "locked": False,
+        "protection": {"delete": False, "rebuild": False},
+        "labels": {"env": "prod"},
+        "volumes": [1, 2],
+    }
+
+
+class TestSerialization(object):
+
+    def test_round_trip_bound_server(self, hetzner_client, server_data):
+        server = BoundServer(hetzner_client.servers, server_data)
+
+        restored = loads(dumps(server), hetzner_client)
+        assert loads(dumps(restored), hetzner_client).name == "my-server"
+
+        assert isinstance(restored, BoundServer)
+        assert restored._client is hetzner_client.servers
+        assert restored.complete is True
+        assert restored.name == "my-server"
+        assert restored.created == datetime.datetime(2016, 1, 30, 23, 50, tzinfo=tzutc())
+        assert restored.labels == {"env": "prod"}
+        assert restored.locked is False
+        assert isinstance(restored.public_net, PublicNetwork)
+        assert restored.public_net.ipv4.ip == "1.2.3.4"
+        assert restored.public_net.floating_ips[0].id == 478
+        assert restored.private_net[0].network.id == 4711
+        assert [volume.id for volume in restored.volumes] == [1, 2]
+        hetzner_client.request.assert_not_called()
+
+    def test_round_trip_with_identity_map(self, server_data):
+        client = Client(token="token", identity_map=IdentityMap())
+        client.request = mock.MagicMock()
+        server = BoundServer(client.servers, server_data)
+        projected = BoundServer(Client(token="token").servers, server_data, fields=["name"])
+
+        restored = loads(dumps(projected), client)
+
+        assert restored is server
+        assert server.complete is True
+        assert server.name == "my-server"
+        assert server.status == "running"
+
+        placeholder = loads(dumps(BoundServer(client.servers, {"id": 43}, complete=False)), client)
+        complete = loads(dumps(BoundServer(Client(token="token").servers, dict(server_data, id=43))), client)
+        assert complete is placeholder
+        assert placeholder.complete is True
+        assert placeholder.status == "running"
+        client.request.assert_not_called()
+
+    def test_relations_are_references(self, hetzner_client, server_data):
+        restored = loads(dumps(BoundServer(hetzner_client.servers, server_data)), hetzner_client)
+
+        assert isinstance(restored.datacenter, BoundDatacenter)
+        assert restored.datacenter._client is hetzner_client.datacenters
+        assert restored.datacenter.id == 2
+        assert restored.datacenter.complete is False
+        assert isinstance(restored.image, BoundImage)
+        assert restored.image.complete is False
+
+    def test_round_trip_nested_domain(self, hetzner_client, server_data):
+        datacenter = BoundDatacenter(hetzner_client.datacenters, server_data["datacenter"])
+
+        restored = loads(dumps(datacenter), hetzner_client)
+
+        assert isinstance(restored.server_types, DatacenterServerTypes)
+        assert [server_type.id for server_type in restored.server_types.supported] == [1, 2]
+        assert isinstance(restored.server_types.supported[0], BoundServerType)
+        assert restored.location.id == 1
+
+    def test_round_trip_list(self, hetzner_client, server_data):
+        server_types = [BoundServerType(hetzner_client.server_types, server_data["server_type"]),
+                        BoundServerType(hetzner_client.server_types, {"id": 2}, complete=False)]
+
+        restored = loads(dumps(server_types), hetzner_client)
+
+        assert restored[0].prices == [{"location": "fsn1", "price_hourly": {"net": "1.0"}}]
+        assert restored[0].complete is True
+        assert restored[1].complete is False
+        assert restored[1]._loaded_fields == frozenset(["id"])
+
+    def test_round_trip_domain(self, hetzner_client):
+        location = Location(id=1, name="fsn1", latitude=50.47612)
+
+        restored = loads(dumps(location), hetzner_client)
+
+        assert isinstance(restored, Location)
+        assert restored.name == "fsn1"
+        assert restored.latitude == 50.47612
+        assert restored.city is None
+
+    def test_parsed_timestamp(self, hetzner_client, server_data):
+        server = BoundServer(hetzner_client.servers, server_data)
+        server.created
+
+        assert loads(dumps(server), hetzner_client).created == server.created
+
+    def test_mapping_looking_like_a_tag(self, hetzner_client, server_data):
+        server_data["labels"] = {"#b": "label"}
+
+        restored = loads(dumps(BoundServer(hetzner_client.servers, server_data)), hetzner_client)
+
+        assert restored.labels == {"#b": "label"}
+
+    def test_field_names_written_once_per_type(self, hetzner_client, server_data):
+        servers = [BoundServer(hetzner_client.servers, dict(server_data, id=id)) for id in range(10)]
+
+        data = dumps(servers)
+
+        assert data.count(b'"rescue_enabled"') == 1
+        assert len(data) < len(json.dumps([server_data] * 10))
+
+    def test_unsupported_version(self, hetzner_client):
+        with pytest.raises(ValueError):
+            loads(json.dumps([FORMAT_VERSION + 1, {}, None]), hetzner_client)
+
+    def test_unsupported_type(self):
+        with pytest.raises(TypeError):
+            dumps(object())
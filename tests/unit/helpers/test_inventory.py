@@ -0,0 +1,152 @@
+import array
+import datetime
+import math
+
+import mock
+import pytest
+from dateutil.tz import tzutc
+
+from hcloud.helpers.inventory import Inventory, VOLUME_COLUMNS
+from hcloud.servers.client import BoundServer, ServersClient
+from hcloud.volumes.client import VolumesClient
+
+
+def server(id, status, server_type, outgoing_traffic, created):
+    return {
+        "id": id,
+        "name": "server-{id}".format(id=id),
+        "status": status,
+        "server_type": {"id": 1, "name": server_type},
+        "datacenter": {"id": 1, "name": "fsn1-dc8", "location": {"id": 1, "name": "fsn1"}},
+        "image": None,
+        "public_net": {"ipv4": {"ip": "1.2.3.{id}".format(id=id)}},
+        "outgoing_traffic": outgoing_traffic,
+        "ingoing_traffic": None,
+        "included_traffic": 654321,
+        "locked": False,
+        "created": created,
+    }
+
+
+class ArrayInventory(Inventory):
+    use_numpy = False
+
+
+class TestInventory(object):
+
+    @pytest.fixture(params=["array", "numpy"])
+    def inventory_class(self, request):
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+            return Inventory
+        return ArrayInventory
+
+    @pytest.fixture()
+    def servers_client(self):
+        servers_client = ServersClient(client=mock.MagicMock())
+        servers_client._client.request.return_value = {
+            "servers": [
+                server(1, "running", "cx11", 100, "2019-01-01T00:00:00+00:00"),
+                server(2, "off", "cx21", None, "2019-06-01T00:00:00+00:00"),
+                server(3, "running", "cx21", 300, "2020-01-01T00:00:00+00:00"),
+                server(4, "running", "cx11", 50, "2020-01-01T12:00:00+00:00"),
+            ],
+            "meta": {"pagination": {"page": 1, "per_page": 50, "next_page": None}},
+        }
+        return servers_client
+
+    @pytest.fixture()
+    def inventory(self, inventory_class, servers_client):
+        return inventory_class.from_client(servers_client, label_selector="env=prod")
+
+    def test_from_client(self, inventory, servers_client):
+        servers_client._client.request.assert_called_once_with(
+            url="/servers", method="GET", params={"label_selector": "env=prod", "page": 1, "per_page": 50})
+        assert len(inventory) == 4
+        assert list(inventory.column("id")) == [1, 2, 3, 4]
+        assert inventory.column("server_type") == ["cx11", "cx21", "cx21", "cx11"]
+        assert inventory.column("image") == [None, None, None, None]
+        assert inventory.column("location") == ["fsn1"] * 4
+        assert inventory.column("created")[0] == 1546300800.0
+        assert math.isnan(inventory.column("outgoing_traffic")[1])
+
+    def test_columns_are_typed_arrays(self, servers_client):
+        inventory = ArrayInventory.from_client(servers_client)
+        assert isinstance(inventory.column("id"), array.array)
+        assert isinstance(inventory.column("outgoing_traffic"), array.array)
+        assert inventory.column("server_type")[0] is inventory.column("server_type")[3]
+
+    def test_filter(self, inventory):
+        running = inventory.filter(status="running")
+        assert list(running.column("id")) == [1, 3, 4]
+
+        assert list(inventory.filter(status="running", server_type=("cx21", "cx31")).column("id")) == [3]
+        assert len(inventory.filter(status="deleting")) == 0
+
+    def test_filter_mask(self, inventory):
+        newer = inventory.mask("created", ">=", datetime.datetime(2019, 6, 1, tzinfo=tzutc()))
+        assert list(inventory.filter(newer).column("id")) == [2, 3, 4]
+        assert list(inventory.filter(newer, inventory.mask("outgoing_traffic", "<", 200)).column("id")) == [4]
+        assert list(inventory.filter(inventory.mask("name", ">", "server-2")).column("id")) == [3, 4]
+
+    def test_mask_unknown(self, inventory):
+        with pytest.raises(ValueError):
+            inventory.mask("status", "~", "running")
+        with pytest.raises(ValueError):
+            inventory.mask("flavor", "==", "running")
+
+    def test_count_by(self, inventory):
+        assert list(inventory.count_by("status").items()) == [("running", 3), ("off", 1)]
+        assert dict(inventory.count_by("image")) == {None: 4}
+        assert dict(inventory.filter(status="running").count_by("server_type")) == {"cx11": 2, "cx21": 1}
+
+    def test_sum_by(self, inventory):
+        assert dict(inventory.sum_by("server_type", "outgoing_traffic")) == {"cx11": 150.0, "cx21": 300.0}
+        assert dict(inventory.sum_by("status", "included_traffic")) == {"running": 3 * 654321.0, "off": 654321.0}
+        with pytest.raises(ValueError):
+            inventory.sum_by("status", "name")
+
+    def test_bound_models(self, inventory, servers_client):
+        servers = inventory.filter(server_type="cx21").bound_models()
+        assert [bound_server.id for bound_server in servers] == [2, 3]
+        assert all(isinstance(bound_server, BoundServer) for bound_server in servers)
+        assert servers[0]._client is servers_client
+        assert servers[0].complete is True
+        assert servers[1].status == "running"
+        assert servers[1].server_type.name == "cx21"
+
+        # completed with one listing instead of one request per server
+        assert servers_client._client.request.call_count == 2
+        servers_client._client.request.assert_called_with(
+            url="/servers", method="GET", params={"page": 1, "per_page": 50})
+
+    def test_bound_models_of_kept_entries(self, inventory_class, servers_client):
+        inventory = inventory_class.from_client(servers_client, keep_entries=True)
+
+        servers = inventory.filter(server_type="cx21").bound_models()
+        assert [bound_server.id for bound_server in servers] == [2, 3]
+        assert servers[1].status == "running"
+        assert [bound_server.id for bound_server in inventory.bound_models([3])] == [4]
+        servers_client._client.request.assert_called_once()
+
+    def test_entries_are_not_kept_by_default(self, inventory):
+        assert inventory._entries is None
+        assert inventory.take([0])._entries is None
+
+    def test_volumes(self, inventory_class):
+        volumes_client = VolumesClient(client=mock.MagicMock())
+        volumes = [
+            {"id": 1, "name": "data", "status": "available", "size": 10, "location": {"name": "fsn1"}, "server": 4,
+             "format": "ext4", "created": "2019-01-01T00:00:00+00:00"},
+            {"id": 2, "name": "backup", "status": "available", "size": 50, "location": {"name": "nbg1"}, "server": None,
+             "format": None, "created": "2019-01-01T00:00:00+00:00"},
+        ]
+        inventory = inventory_class.from_data(volumes_client, volumes, VOLUME_COLUMNS)
+        assert list(inventory.filter(server=0).column("id")) == [2]
+        assert dict(inventory.sum_by("location", "size")) == {"fsn1": 10.0, "nbg1": 50.0}
+
+    def test_unsupported_client(self):
+        from hcloud.images.client import ImagesClient
+
+        with pytest.raises(ValueError):
+            Inventory.from_client(ImagesClient(client=mock.MagicMock()))
@@ -0,0 +1,91 @@
+import mock
+import pytest
+
+from hcloud.helpers.resource_set import ResourceSet
+from hcloud.servers.client import BoundServer, ServersClient
+
+
+def server(id, status="running", labels=None, datacenter="fsn1-dc8"):
+    return {
+        "id": id,
+        "name": "server-{id}".format(id=id),
+        "status": status,
+        "labels": labels or {},
+        "datacenter": {"id": 1, "name": datacenter, "location": {"id": 1, "name": datacenter[:4]}},
+    }
+
+
+class TestResourceSet(object):
+
+    @pytest.fixture()
+    def servers_client(self):
+        return ServersClient(client=mock.MagicMock())
+
+    @pytest.fixture()
+    def servers(self, servers_client):
+        return ResourceSet(BoundServer(servers_client, data) for data in [
+            server(1, labels={"env": "prod", "team": "web"}),
+            server(2, status="off", labels={"env": "dev"}),
+            server(3, labels={"env": "prod"}, datacenter="nbg1-dc3"),
+            server(4, status="off", datacenter="nbg1-dc3"),
+        ])
+
+    def test_from_client(self, servers_client):
+        servers_client._client.request.return_value = {
+            "servers": [server(1), server(2)],
+            "meta": {"pagination": {"page": 1, "per_page": 50, "next_page": None}},
+        }
+
+        servers = ResourceSet.from_client(servers_client, label_selector="env=prod")
+
+        servers_client._client.request.assert_called_once_with(
+            url="/servers", method="GET", params={"label_selector": "env=prod", "page": 1, "per_page": 50})
+        assert servers.ids() == [1, 2]
+        assert all(isinstance(bound_server, BoundServer) for bound_server in servers)
+
+    def test_lookups(self, servers):
+        assert len(servers) == 4
+        assert servers.get_by_id(3).name == "server-3"
+        assert servers.get_by_id(5) is None
+        assert servers.get_by_name("server-2").id == 2
+        assert servers.get_by_name("server-5") is None
+        assert 1 in servers
+        assert servers.get_by_id(1) in servers
+        assert 5 not in servers
+
+    def test_get_by_label(self, servers):
+        assert servers.get_by_label("env").ids() == [1, 2, 3]
+        assert servers.get_by_label("env", "prod").ids() == [1, 3]
+        assert servers.get_by_label("team", "web").ids() == [1]
+        assert servers.get_by_label("team", "db").ids() == []
+        assert servers.get_by_label("owner").ids() == []
+
+    def test_get_by(self, servers):
+        assert servers.get_by("status", "off").ids() == [2, 4]
+        assert servers.get_by("datacenter.name", "nbg1-dc3").ids() == [3, 4]
+        assert servers.get_by("datacenter.location.name", "fsn1").ids() == [1, 2]
+        assert servers.get_by("status", "deleting").ids() == []
+
+    def test_group_by(self, servers):
+        groups = servers.group_by("status")
+        assert list(groups) == ["running", "off"]
+        assert groups["running"].ids() == [1, 3]
+        assert servers.group_by("status") is groups
+
+    def test_set_operations(self, servers, servers_client):
+        running = servers.get_by("status", "running")
+        prod = servers.get_by_label("env", "prod")
+        other = BoundServer(servers_client, server(1))
+
+        assert (running & servers.get_by_label("env")).ids() == [1, 3]
+        assert (servers - running).ids() == [2, 4]
+        assert (running | servers.get_by("status", "off")).ids() == [1, 3, 2, 4]
+        assert running.intersection(prod).ids() == [1, 3]
+        assert servers.difference([other]).ids() == [2, 3, 4]
+        assert servers.union([other]).get_by_id(1) is servers.get_by_id(1)
+
+    def test_first_model_of_an_id_is_kept(self, servers_client):
+        first = BoundServer(servers_client, server(1))
+        servers = ResourceSet([first, BoundServer(servers_client, server(1))])
+        assert len(servers) == 1
+        assert servers.get_by_id(1) is first
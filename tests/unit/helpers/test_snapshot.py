@@ -0,0 +1,126 @@
+import copy
+
+import mock
+import pytest
+
+from hcloud.helpers.snapshot import ResourceChange, Snapshot
+from hcloud.servers.client import ServersClient
+from hcloud.volumes.client import VolumesClient
+
+
+def server(id, status="running"):
+    return {
+        "id": id,
+        "name": "server-{id}".format(id=id),
+        "status": status,
+        "labels": {"env": "prod"},
+        "public_net": {
+            "ipv4": {"ip": "1.2.3.4", "blocked": False, "dns_ptr": "server01.example.com"},
+            "ipv6": {"ip": "2001:db8::/64", "blocked": False, "dns_ptr": []},
+            "floating_ips": [478],
+        },
+        "private_net": [
+            {"network": 4711, "ip": "10.1.1.5", "alias_ips": [], "mac_address": "86:00:ff:2a:7d:e1"},
+            {"network": 4712, "ip": "10.2.1.5", "alias_ips": [], "mac_address": "86:00:ff:2a:7d:e2"},
+        ],
+        "outgoing_traffic": 123456,
+    }
+
+
+def snapshot(*servers):
+    return Snapshot({"servers": dict((data["id"], data) for data in servers)})
+
+
+def changes(resource_change):
+    return [(change.path, change.old, change.new) for change in resource_change.changes]
+
+
+class TestSnapshot(object):
+
+    def test_from_clients(self):
+        servers_client = ServersClient(client=mock.MagicMock())
+        servers_client._client.request.return_value = {
+            "servers": [server(1), server(2)],
+            "meta": {"pagination": {"page": 1, "per_page": 50, "next_page": None}},
+        }
+        volumes_client = VolumesClient(client=mock.MagicMock())
+        volumes_client._client.request.return_value = {
+            "volumes": [{"id": 3, "name": "volume-3"}],
+            "meta": {"pagination": {"page": 1, "per_page": 50, "next_page": None}},
+        }
+
+        taken = Snapshot.from_clients(servers_client, volumes_client, label_selector="env=prod")
+
+        servers_client._client.request.assert_called_once_with(
+            url="/servers", method="GET", params={"label_selector": "env=prod", "page": 1, "per_page": 50})
+        assert list(taken.resources) == ["servers", "volumes"]
+        assert list(taken.resources["servers"]) == [1, 2]
+        assert taken.resources["volumes"][3] == {"id": 3, "name": "volume-3"}
+
+    def test_added_and_removed(self):
+        diff = snapshot(server(1), server(2)).diff(snapshot(server(2), server(3)))
+
+        assert [(change.type, change.resource, change.id) for change in diff] == [
+            (ResourceChange.TYPE_ADDED, "servers", 3),
+            (ResourceChange.TYPE_REMOVED, "servers", 1),
+        ]
+        assert diff.added[0].new == server(3)
+        assert diff.removed[0].old == server(1)
+        assert diff.changed == []
+        assert len(diff) == 2
+
+    def test_unchanged(self):
+        diff = snapshot(server(1)).diff(snapshot(server(1)))
+
+        assert not diff
+        assert list(diff) == []
+
+    def test_changed_fields(self):
+        new = copy.deepcopy(server(1))
+        new["status"] = "off"
+        new["labels"] = {"env": "dev", "team": "web"}
+        new["public_net"]["ipv4"]["dns_ptr"] = "server02.example.com"
+        new["public_net"]["floating_ips"] = [478, 479]
+
+        diff = snapshot(server(1)).diff(snapshot(new))
+
+        assert len(diff.changed) == 1
+        assert diff.changed[0].type == ResourceChange.TYPE_CHANGED
+        assert diff.changed[0].old == server(1)
+        assert diff.changed[0].new is new
+        assert changes(diff.changed[0]) == [
+            (("status",), "running", "off"),
+            (("labels", "env"), "prod", "dev"),
+            (("labels", "team"), None, "web"),
+            (("public_net", "ipv4", "dns_ptr"), "server01.example.com", "server02.example.com"),
+            (("public_net", "floating_ips"), [478], [478, 479]),
+        ]
+
+    def test_private_networks_are_compared_by_network(self):
+        new = copy.deepcopy(server(1))
+        new["private_net"].reverse()
+        new["private_net"][0]["alias_ips"] = ["10.2.1.8"]
+        del new["private_net"][1]
+        new["private_net"].append({"network": 4713, "ip": "10.3.1.5"})
+
+        diff = snapshot(server(1)).diff(snapshot(new))
+
+        assert changes(diff.changed[0]) == [
+            (("private_net", 4711), server(1)["private_net"][0], None),
+            (("private_net", 4712, "alias_ips"), [], ["10.2.1.8"]),
+            (("private_net", 4713), None, {"network": 4713, "ip": "10.3.1.5"}),
+        ]
+
+    def test_ignore(self):
+        new = copy.deepcopy(server(1))
+        new["outgoing_traffic"] = 654321
+        new["public_net"]["ipv4"]["blocked"] = True
+
+        assert not snapshot(server(1)).diff(snapshot(new), ignore=["outgoing_traffic", "public_net.ipv4"])
+        assert changes(snapshot(server(1)).diff(snapshot(new), ignore=["outgoing_traffic"]).changed[0]) == [
+            (("public_net", "ipv4", "blocked"), False, True),
+        ]
+
+    @pytest.mark.parametrize("resources", [{}, {"volumes": {}}])
+    def test_resources_missing_in_a_snapshot_are_skipped(self, resources):
+        assert not snapshot(server(1)).diff(Snapshot(resources))
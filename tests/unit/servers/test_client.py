@@ -1,6 +1,9 @@
+import copy
+
 import mock
 import pytest
 
+from hcloud.core.domain import PaginationCursor, shared_values
 from hcloud.floating_ips.client import BoundFloatingIP
 from hcloud.isos.client import BoundIso
 from hcloud.servers.client import ServersClient, BoundServer
@@ -92,6 +95,56 @@ class TestBoundServer(object):
         assert len(bound_server.private_net[0].alias_ips) == 1
         assert bound_server.private_net[0].alias_ips[0] == "10.1.1.8"
 
+    def test_bound_server_init_hydrates_lazily(self, response_full_server):
+        bound_server = BoundServer(
+            client=mock.MagicMock(),
+            data=response_full_server['server']
+        )
+
+        assert isinstance(bound_server._data_model.datacenter, dict)
+        assert isinstance(bound_server._data_model.public_net, dict)
+        assert bound_server._hydrated == ()
+
+        datacenter = bound_server.datacenter
+
+        assert isinstance(datacenter, BoundDatacenter)
+        assert bound_server.datacenter is datacenter
+        assert bound_server._hydrated == ("datacenter",)
+        assert isinstance(bound_server._data_model.public_net, dict)
+        assert isinstance(response_full_server['server']['datacenter'], dict)
+
+    def test_bound_server_data_model_is_hydrated(self, response_full_server):
+        bound_server = BoundServer(client=mock.MagicMock(), data=response_full_server['server'])
+        placeholder = BoundServer(client=mock.MagicMock(), data={"id": 1}, complete=False)
+
+        data_model = bound_server.data_model
+
+        assert isinstance(data_model.datacenter, BoundDatacenter)
+        assert isinstance(data_model.public_net, PublicNetwork)
+        assert isinstance(data_model.volumes[0], BoundVolume)
+        assert data_model.datacenter is bound_server.datacenter
+        assert placeholder.data_model.id == 1
+        placeholder._client.get_by_id.assert_not_called()
+
+    def test_bound_servers_share_catalog_models(self, hetzner_client, response_full_server):
+        with shared_values.scope():
+            first = BoundServer(client=hetzner_client.servers, data=copy.deepcopy(response_full_server['server']))
+            second = BoundServer(client=hetzner_client.servers, data=copy.deepcopy(response_full_server['server']))
+
+        assert first.data_model.datacenter is second.data_model.datacenter
+        assert first.datacenter is second.datacenter
+        assert first.server_type is second.server_type
+        assert first.public_net is not second.public_net
+
+    def test_pages_share_catalog_models(self, hetzner_client, response_full_server):
+        hetzner_client.request.side_effect = lambda **kwargs: {
+            "servers": [copy.deepcopy(response_full_server['server']), copy.deepcopy(response_full_server['server'])]}
+        first_page = hetzner_client.servers.get_list().servers
+        second_page = hetzner_client.servers.get_list().servers
+
+        assert first_page[0].data_model.datacenter is first_page[1].data_model.datacenter
+        assert first_page[0].data_model.datacenter is not second_page[0].data_model.datacenter
+
     @pytest.mark.parametrize(
         "params",
         [
@@ -138,6 +191,29 @@ class TestBoundServer(object):
         assert actions[0].id == 13
         assert actions[0].command == "start_server"
 
+    def test_iter_actions(self, hetzner_client, bound_server, response_get_actions):
+        hetzner_client.request.return_value = response_get_actions
+        actions = bound_server.iter_actions(status=[Server.STATUS_RUNNING])
+        hetzner_client.request.assert_not_called()
+
+        actions = list(actions)
+        hetzner_client.request.assert_called_with(url="/servers/14/actions", method="GET",
+                                                  params={"status": [Server.STATUS_RUNNING], "page": 1, "per_page": 50})
+
+        assert len(actions) == 1
+        assert isinstance(actions[0], BoundAction)
+        assert actions[0].id == 13
+
+    def test_iter_actions_resume_from(self, hetzner_client, bound_server, response_get_actions):
+        hetzner_client.request.return_value = response_get_actions
+        cursor = PaginationCursor(params={"status": [Server.STATUS_RUNNING]}, per_page=50, completed_page=2)
+
+        actions = list(bound_server.iter_actions(resume_from=cursor))
+
+        hetzner_client.request.assert_called_with(url="/servers/14/actions", method="GET",
+                                                  params={"status": [Server.STATUS_RUNNING], "page": 3, "per_page": 50})
+        assert actions[0].id == 13
+
     def test_update(self, hetzner_client, bound_server, response_update_server):
         hetzner_client.request.return_value = response_update_server
         server = bound_server.update(name="new-name", labels={})
@@ -404,6 +480,40 @@ class TestServersClient(object):
         assert bound_server2.id == 2
         assert bound_server2.name == "my-server2"
 
+    def test_iter_all(self, servers_client, response_simple_servers):
+        servers_client._client.request.return_value = response_simple_servers
+        bound_servers = servers_client.iter_all(name="server1")
+        servers_client._client.request.assert_not_called()
+
+        bound_server1 = next(bound_servers)
+        servers_client._client.request.assert_called_once_with(url="/servers", method="GET",
+                                                               params={"name": "server1", "page": 1, "per_page": 50})
+        assert bound_server1._client is servers_client
+        assert bound_server1.id == 1
+
+        assert [bound_server.id for bound_server in bound_servers] == [2]
+
+    def test_iter_all_resume_from(self, servers_client, response_simple_servers):
+        servers_client._client.request.return_value = response_simple_servers
+        cursor = PaginationCursor(params={"name": "server1", "label_selector": None, "status": None}, per_page=25, completed_page=3)
+
+        bound_servers = list(servers_client.iter_all(resume_from=cursor))
+
+        servers_client._client.request.assert_called_once_with(url="/servers", method="GET",
+                                                               params={"name": "server1", "page": 4, "per_page": 25})
+        assert len(bound_servers) == 2
+
+    def test_query_first(self, servers_client, response_simple_servers):
+        servers_client._client.request.return_value = response_simple_servers
+
+        bound_server = servers_client.query().filter(status="running").with_label("env", "prod").first()
+
+        servers_client._client.request.assert_called_once_with(
+            url="/servers", method="GET",
+            params={"status": ["running"], "label_selector": "env=prod", "page": 1, "per_page": 1}
+        )
+        assert bound_server.id == 1
+
     def test_get_by_name(self, servers_client, response_simple_servers):
         servers_client._client.request.return_value = response_simple_servers
         bound_server = servers_client.get_by_name("my-server")
@@ -416,6 +526,89 @@ class TestServersClient(object):
         assert bound_server.id == 1
         assert bound_server.name == "my-server"
 
+    def test_get_by_id_raw(self, servers_client, response_simple_server):
+        servers_client._client.request.return_value = response_simple_server
+        server = servers_client.get_by_id(1, raw=True)
+        servers_client._client.request.assert_called_with(url="/servers/1", method="GET")
+        assert server is response_simple_server["server"]
+
+    def test_get_list_raw(self, servers_client, response_simple_servers):
+        servers_client._client.request.return_value = response_simple_servers
+        result = servers_client.get_list(name="server1", raw=True)
+        servers_client._client.request.assert_called_with(url="/servers", method="GET", params={"name": "server1"})
+        assert result.servers is response_simple_servers["servers"]
+        assert result.meta is None
+
+    def test_get_all_raw(self, servers_client, response_simple_servers):
+        servers_client._client.request.return_value = response_simple_servers
+        servers = servers_client.get_all(status=[Server.STATUS_RUNNING], raw=True)
+        servers_client._client.request.assert_called_with(url="/servers", method="GET",
+                                                          params={"status": [Server.STATUS_RUNNING], "page": 1, "per_page": 50})
+        assert servers == response_simple_servers["servers"]
+
+    def test_get_by_name_raw(self, servers_client, response_simple_servers):
+        servers_client._client.request.return_value = response_simple_servers
+        server = servers_client.get_by_name("my-server", raw=True)
+        assert server is response_simple_servers["servers"][0]
+
+    def test_get_all_expand(self, hetzner_client, response_full_server):
+        def request(url, method, params):
+            if url == "/servers":
+                return {"servers": [response_full_server["server"]]}
+            return {"volumes": [{"id": 2, "name": "volume-2"}, {"id": 1, "name": "volume-1"}, {"id": 3, "name": "volume-3"}]}
+
+        hetzner_client.request.side_effect = request
+        servers = hetzner_client.servers.get_all(expand=["volumes"])
+
+        volumes = servers[0].volumes
+        assert [volume.complete for volume in volumes] == [True, True]
+        assert [volume.name for volume in volumes] == ["volume-1", "volume-2"]
+        assert hetzner_client.request.call_count == 2
+
+    def test_get_all_expand_unknown(self, servers_client, response_simple_servers):
+        servers_client._client.request.return_value = response_simple_servers
+        with pytest.raises(ValueError):
+            servers_client.get_all(expand=["locations"])
+
+    def test_get_list_fields(self, servers_client, response_simple_servers):
+        servers_client._client.request.return_value = response_simple_servers
+        servers = servers_client.get_list(fields=["name", "status", "labels"]).servers
+
+        assert servers[0].complete is False
+        assert servers[0].data_model.public_net is None
+        assert servers[0].data_model.datacenter is None
+        assert (servers[0].id, servers[0].name, servers[0].status) == (1, "my-server", "running")
+        servers_client._client.request.assert_called_once()
+
+    def test_get_by_name_fields(self, servers_client, response_simple_servers):
+        servers_client._client.request.return_value = response_simple_servers
+        server = servers_client.get_by_name("my-server", fields=["datacenter"])
+
+        assert server.datacenter.name == "fsn1-dc8"
+        assert server.data_model.name is None
+
+    def test_get_all_expand_not_among_fields(self, servers_client, response_simple_servers):
+        servers_client._client.request.return_value = response_simple_servers
+        with pytest.raises(ValueError):
+            servers_client.get_all(expand=["volumes"], fields=["name"])
+
+    @pytest.mark.parametrize("field,expand,id,expanded", [
+        ("public_net", "floating_ips", 478, lambda server: server.public_net.floating_ips[0]),
+        ("private_net", "networks", 4711, lambda server: server.private_net[0].network),
+    ])
+    def test_get_all_expand_from_fields(self, hetzner_client, response_full_server, field, expand, id, expanded):
+        def request(url, method, params):
+            if url == "/servers":
+                return {"servers": [response_full_server["server"]]}
+            return {expand: [{"id": id, "name": "listed"}]}
+
+        hetzner_client.request.side_effect = request
+        server = hetzner_client.servers.get_all(fields=[field], expand=[expand])[0]
+
+        assert expanded(server).complete is True
+        assert expanded(server).name == "listed"
+        assert hetzner_client.request.call_count == 2
+
     def test_create_with_datacenter(self, servers_client, response_create_simple_server):
         servers_client._client.request.return_value = response_create_simple_server
         response = servers_client.create(
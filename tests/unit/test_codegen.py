@@ -0,0 +1,72 @@
+import importlib
+
+import pytest
+
+from codegen.generate import generate, load_schema, render_module
+
+
+class TestGenerate(object):
+
+    def test_domain_modules_up_to_date(self):
+        assert generate(check=True) == []
+
+    def test_render_module(self):
+        source = '''@lazy_iso_datetimes("started")
+class Candy(BaseDomain):
+    """Candy Domain"""
+    FLAVOR_SWEET = "sweet"
+    __slots__ = (
+        "id",
+        "started",
+    )
+
+    def __init__(self, id, started=None):
+        self.id = id
+        self.started = started
+
+
+class Other(object):
+    pass
+'''
+        fields = [
+            {"name": "id", "required": True, "type": "int"},
+            {"name": "flavor", "intern": True},
+            {"name": "location", "shared": "locations"},
+            {"name": "created", "timestamp": True},
+        ]
+
+        generated = render_module(source, {"Candy": fields})
+
+        assert generated.startswith('@lazy_iso_datetimes("created")\nclass Candy(BaseDomain):\n    """Candy Domain"""\n'
+                                    '    FLAVOR_SWEET = "sweet"\n')
+        assert "        id,  # type: int\n        flavor=None,\n" in generated
+        assert '        domain.id = data["id"]\n' in generated
+        assert '        domain.flavor = intern_strings(get("flavor"))\n' in generated
+        assert '        domain.location = shared_values.share("locations", get("location"))\n' in generated
+        assert '        domain.flavor = intern_strings(get("flavor")) if "flavor" in fields else None\n' in generated
+        assert "started" not in generated
+        assert generated.endswith("    # end of generated code\n\n\nclass Other(object):\n    pass\n")
+        assert render_module(generated, {"Candy": fields}) == generated
+
+    @pytest.mark.parametrize("module,class_name,fields", [
+        (module, class_name, fields)
+        for module, classes in load_schema().items()
+        for class_name, fields in classes.items()
+    ])
+    def test_from_dict_matches_constructor(self, module, class_name, fields):
+        cls = getattr(importlib.import_module(module), class_name)
+        data = dict((field["name"], "value-{name}".format(name=field["name"])) for field in fields)
+        data.update((field["name"], {"id": 1}) for field in fields if field.get("shared"))
+        data.update((field["name"], "2016-01-30T23:50:00+00:00") for field in fields if field.get("timestamp"))
+
+        from_dict = cls.from_dict(dict(data, unknown="field"))
+        constructed = cls(**data)
+
+        for field in fields:
+            assert getattr(from_dict, field["name"]) == getattr(constructed, field["name"])
+
+        if hasattr(cls, "from_projection") and "id" in data:
+            projected = cls.from_projection(data, frozenset(["id", fields[-1]["name"]]))
+            for field in fields:
+                expected = getattr(constructed, field["name"]) if field["name"] in ("id", fields[-1]["name"]) else None
+                assert getattr(projected, field["name"]) == expected